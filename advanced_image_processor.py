@@ -11,17 +11,403 @@ import os
 import sys
 from pathlib import Path
 from PIL import Image, ImageTk
+from PIL.ExifTags import TAGS
 import queue
+import collections
+import atexit
 import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
 from image_compressor import ImageCompressor
 import tkinterdnd2 as tkdnd
 import requests
 import base64
+import io
 import json
 import piexif
+import logging
 import shutil
 import tempfile
 import subprocess
+import glob
+import re
+import mmap
+import functools
+import webbrowser
+
+# Windows XP* EXIF tags stored as UTF-16LE (XPTitle, XPComment, XPAuthor, XPKeywords, XPSubject)
+logger = logging.getLogger(__name__)
+
+_UTF16LE_XP_TAGS = frozenset({40091, 40092, 40093, 40094, 40095})
+
+@functools.lru_cache(maxsize=256)
+def _enc_utf16le(value):
+    """Encode a string for a Windows XP* EXIF tag (UTF-16LE, exactly one BOM).
+
+    Batch runs write the same Artist/Title strings across many files, so
+    the encode is cached - it is a pure str -> bytes mapping.
+    """
+    return b'\xff\xfe' + value.encode('utf-16le').removeprefix(b'\xff\xfe')
+
+
+def _dec_utf16le(data):
+    """Decode a Windows XP* EXIF tag value (UTF-16LE, optional BOM)."""
+    return data.removeprefix(b'\xff\xfe').decode('utf-16le', 'ignore')
+
+
+# image.info keys holding binary payloads (ICC profiles, raw EXIF, XMP
+# packets) - their str() reprs are multi-KB and useless in an Entry widget
+_BINARY_INFO_KEYS = frozenset({'icc_profile', 'exif', 'photoshop', 'xmp', 'XML:com.adobe.xmp'})
+
+# Field-name -> EXIF tag ID for the PIL getexif() save fallbacks
+_EXIF_TAG_MAP = {
+    'Title': 270,
+    'Description': 270,
+    'Author': 315,
+    'Copyright': 33432,
+    'Software': 11,
+    'DateTime': 306,
+    'Make': 271,
+    'Model': 272,
+}
+
+# Field names written into the PIL info dict by the PNG/WebP fallbacks
+_PNG_INFO_FIELDS = frozenset({'Title', 'Description', 'Author', 'Copyright', 'Software', 'Keywords'})
+_WEBP_INFO_FIELDS = frozenset({'Title', 'Description', 'Author', 'Copyright', 'Software'})
+
+
+def _apply_exif_fields(exif_dict, metadata_dict, custom_fields):
+    """Copy metadata fields into a PIL Exif mapping - one table lookup each."""
+    for field_name, value in metadata_dict.items():
+        tag_id = _EXIF_TAG_MAP.get(field_name)
+        if tag_id is not None:
+            exif_dict[tag_id] = value
+    if custom_fields:
+        exif_dict[0x9286] = '; '.join(custom_fields)
+
+
+def _apply_info_fields(info, metadata_dict, custom_fields, allowed):
+    """Copy metadata fields into a PIL info dict ('Description' joins 'Title')."""
+    for field_name, value in metadata_dict.items():
+        if field_name in allowed:
+            info['Title' if field_name == 'Description' else field_name] = value
+    if custom_fields:
+        info['Comment'] = '; '.join(custom_fields)
+
+
+def _save_one_metadata(item):
+    """Write one file's metadata in a worker process (picklable entry point)."""
+    path, metadata_dict, custom_fields = item
+    ext = os.path.splitext(path)[1].lower()
+    try:
+        image = Image.open(path)
+        if ext in ('.png', '.webp'):
+            info = image.info.copy()
+            allowed = _PNG_INFO_FIELDS if ext == '.png' else _WEBP_INFO_FIELDS
+            _apply_info_fields(info, metadata_dict, custom_fields, allowed)
+            image.save(path, **info)
+        else:
+            exif_dict = image.getexif()
+            _apply_exif_fields(exif_dict, metadata_dict, custom_fields)
+            image.save(path, exif=exif_dict)
+        return (path, True, '')
+    except Exception as e:
+        return (path, False, str(e))
+
+
+# Field-name -> ExifTool XMP tag for WebP writes
+_WEBP_EXIFTOOL_TAGS = {
+    'XPTitle': '-XMP:Title',
+    'ImageDescription': '-XMP:Description',
+    'Artist': '-XMP:Creator',
+    'Copyright': '-XMP:Rights',
+    'Software': '-XMP:Software',
+    'XPKeywords': '-XMP:Subject',
+    'DateTime': '-XMP:CreateDate',
+    'Make': '-XMP:Make',
+    'Model': '-XMP:Model',
+}
+
+
+# Field-name -> (tag ID, tag name, encoding) for the piexif JPEG save path
+_JPEG_TAG_MAPPING = {
+    'XPTitle': (40091, 'XPTitle', 'utf-16le'),
+    'ImageDescription': (270, 'ImageDescription', 'utf-8'),
+    'XPKeywords': (40094, 'XPKeywords', 'utf-16le'),
+    'Artist': (315, 'Artist', 'utf-8'),
+    'Copyright': (33432, 'Copyright', 'utf-8'),
+    'Software': (11, 'Software', 'utf-8'),
+    'DateTime': (306, 'DateTime', 'utf-8'),
+    'Make': (271, 'Make', 'utf-8'),
+    'Model': (272, 'Model', 'utf-8'),
+}
+
+
+# Camera fields that live in the Exif IFD rather than 0th
+_JPEG_EXIF_SECTION_TAGS = {
+    'ISO': 34855,
+    'FNumber': 33437,
+    'ExposureTime': 33434,
+    'FocalLength': 37386,
+    'Flash': 37385,
+    'WhiteBalance': 41987,
+}
+
+
+# Common fields offered by the batch metadata dialog
+_BATCH_TAG_MAPPING = {
+    'Title': 270,
+    'Description': 270,
+    'Keywords': 272,
+    'Author': 315,
+    'Copyright': 33432,
+}
+
+
+# The same dialog fields as ExifTool tag names
+_BATCH_EXIFTOOL_TAGS = {
+    'Title': 'Title',
+    'Description': 'ImageDescription',
+    'Keywords': 'Keywords',
+    'Author': 'Artist',
+    'Copyright': 'Copyright',
+}
+
+
+# Compiled once - these run on every chat message
+_THINK_RE = re.compile(r'<think>.*?</think>', re.DOTALL)
+_BLANKS_RE = re.compile(r'\n\s*\n')
+
+# Images grouped into one vision request during batch AI processing;
+# amortizes the HTTP round trip and the model prefill across the group
+_AI_BATCH_SIZE = 4
+
+# Splits a grouped vision response back into per-image sections
+_IMAGE_SECTION_RE = re.compile(r'===\s*IMAGE\s+(\d+)[^=]*===', re.IGNORECASE)
+
+# Keyword indicators looked for in AI responses; the alternation finds
+# every hit in one pass over a single lowercased copy
+_KEYWORD_INDICATORS = ('kitchen', 'worktop', 'countertop', 'cabinet', 'modern',
+                       'design', 'concrete', 'wood', 'granite', 'braganza')
+_KEYWORD_SET = frozenset(_KEYWORD_INDICATORS)
+_TOKEN_SPLIT_RE = re.compile(r'[^a-z0-9]+')
+
+# Flags AI messages worth offering to the SEO apply button - checked once
+# per incoming message, single pass, no lowercased copy
+_SEO_RE = re.compile(
+    r'seo|meta|title|description|alt\s*text|keywords|structured\s*data',
+    re.IGNORECASE)
+
+# Display names for chat transcript saves - skips per-message .title()
+_SENDER_TITLES = {'ai': 'Ai', 'user': 'User', 'system': 'System'}
+
+# Numbered-section lines in AI analysis responses ("1. ..." / "1) ...")
+# and which metadata field each section feeds
+_AI_SECTION_RE = re.compile(r'^\s*(\d+)[.)]\s*(.+)$')
+_AI_SECTION_FIELDS = {1: 'ImageDescription', 5: 'Keywords', 6: 'AltText'}
+_AI_LINE_HINTS = (('description', 'ImageDescription'),
+                  ('keywords', 'Keywords'),
+                  ('alt text', 'AltText'))
+
+# Key prefixes worth turning into form fields in the SEO results popup
+_SEO_FORM_KEYS = ('title', 'description', 'keywords', 'alt text',
+                  'file name', 'category', 'color', 'mood')
+
+# Chat messages that look like rules/format instructions for batch AI runs
+_USER_RULE_RE = re.compile(r'rule|instruction|always|never|should|must|format',
+                           re.IGNORECASE)
+_AI_FORMAT_RE = re.compile(r'format|structure', re.IGNORECASE)
+
+# Extensions the app treats as images, shared by the folder scanners and
+# drop handlers (tuple because str.endswith wants one)
+_IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.webp', '.avif')
+
+# MIME types for the vision data: URLs - probed once by extension instead
+# of labelling every upload image/jpeg
+_MIME_BY_EXT = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.bmp': 'image/bmp',
+    '.tiff': 'image/tiff',
+    '.webp': 'image/webp',
+    '.avif': 'image/avif',
+}
+
+# AI response field patterns, compiled once - the parser runs per response
+_AI_FIELD_RES = {
+    'Title': re.compile(r'title\s*:\s*(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE),
+    'Artist': re.compile(r'artist\s*:\s*(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE),
+    'Make': re.compile(r'make\s*:\s*(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE),
+    'Model': re.compile(r'model\s*:\s*(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE),
+}
+
+_AI_FALLBACK_RES = {
+    'Title': [
+        re.compile(r'title["\']?\s*[:=]\s*["\']([^"\']+)["\']', re.IGNORECASE),
+        re.compile(r'<title>([^<]+)</title>', re.IGNORECASE),
+        re.compile(r'name["\']?\s*[:=]\s*["\']([^"\']+)["\']', re.IGNORECASE),
+    ],
+    'Artist': [
+        re.compile(r'artist["\']?\s*[:=]\s*["\']([^"\']+)["\']', re.IGNORECASE),
+        re.compile(r'company["\']?\s*[:=]\s*["\']([^"\']+)["\']', re.IGNORECASE),
+        re.compile(r'brand["\']?\s*[:=]\s*["\']([^"\']+)["\']', re.IGNORECASE),
+    ],
+    'Make': [
+        re.compile(r'make["\']?\s*[:=]\s*["\']([^"\']+)["\']', re.IGNORECASE),
+        re.compile(r'product code["\']?\s*[:=]\s*["\']([^"\']+)["\']', re.IGNORECASE),
+        re.compile(r'code["\']?\s*[:=]\s*["\']([^"\']+)["\']', re.IGNORECASE),
+    ],
+    'Model': [
+        re.compile(r'model["\']?\s*[:=]\s*["\']([^"\']+)["\']', re.IGNORECASE),
+        re.compile(r'type["\']?\s*[:=]\s*["\']([^"\']+)["\']', re.IGNORECASE),
+        re.compile(r'product type["\']?\s*[:=]\s*["\']([^"\']+)["\']', re.IGNORECASE),
+    ],
+}
+
+# Single-sweep SEO parser: one alternation walked with finditer instead of
+# six separate full-text searches; m.lastgroup names the field and
+# <field>_v holds its captured value
+_SEO_UNIFIED_RE = re.compile(
+    r'(?P<meta_title><meta[^>]*name=["\']title["\'][^>]*content=["\'](?P<meta_title_v>[^"\']+)["\'])'
+    r'|(?P<kv_title>title["\']?\s*[:=]\s*["\'](?P<kv_title_v>[^"\']+)["\'])'
+    r'|(?P<meta_desc><meta[^>]*name=["\']description["\'][^>]*content=["\'](?P<meta_desc_v>[^"\']+)["\'])'
+    r'|(?P<kv_desc>description["\']?\s*[:=]\s*["\'](?P<kv_desc_v>[^"\']+)["\'])'
+    r'|(?P<alt>alt=["\'](?P<alt_v>[^"\']+)["\'])'
+    r'|(?P<kv_keywords>keywords["\']?\s*[:=]\s*["\'](?P<kv_keywords_v>[^"\']+)["\'])',
+    re.IGNORECASE)
+
+_SEO_GROUP_FIELDS = {
+    'meta_title': 'Title',
+    'kv_title': 'Title',
+    'meta_desc': 'Description',
+    'kv_desc': 'Description',
+    'alt': 'AltText',
+    'kv_keywords': 'Keywords',
+}
+
+_JSON_LD_RE = re.compile(
+    r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.DOTALL | re.IGNORECASE)
+
+
+# Vision prompt templates, hoisted so batch runs over hundreds of images
+# don't rebuild the big literals per call - format_map fills the per-image
+# fields straight from the parsed filename dict
+_SINGLE_IMAGE_PROMPT = """
+Filename: {filename}
+Product Code: {code}
+Product Type: {type}
+Color: {color}
+Product Name: {name}
+Category: {category}
+
+Rules and Instructions:
+{rules}
+
+Please provide metadata suggestions for this image in the following format:
+
+Title: [descriptive title based on the product and room shown]
+Description: [detailed description of what's shown in the image]
+Keywords: [relevant search terms, comma-separated]
+Artist: [Your Company Name]
+Make: {code}
+Model: {type}
+
+Please ensure all 6 fields are provided with the exact format shown above.
+"""
+
+_BATCH_IMAGE_SECTION = """=== IMAGE {index}: {filename} ===
+Product Code: {code}
+Product Type: {type}
+Color: {color}
+Product Name: {name}
+Category: {category}"""
+
+
+def _apply_batch_metadata(item):
+    """Apply resolved (tag_id, value) pairs to one file (process-pool worker)."""
+    path, encoded_tags = item
+    try:
+        if path.lower().endswith(('.jpg', '.jpeg')):
+            # JPEG: patch the APP1 segment in place - no pixel decode,
+            # no lossy re-encode
+            try:
+                exif_dict = piexif.load(path)
+            except Exception:
+                exif_dict = {'0th': {}, 'Exif': {}, 'GPS': {}, '1st': {}, 'Interop': {}, 'thumbnail': None}
+            
+            for tag_id, value in encoded_tags:
+                exif_dict['0th'][tag_id] = value.encode('utf-8')
+            
+            piexif.insert(piexif.dump(exif_dict), path)
+            return (path, True, '')
+        
+        # Context manager releases the decoder buffers per file instead of
+        # leaving them for GC - save() forces a full load()
+        with Image.open(path) as image:
+            exif_dict = image.getexif()
+            
+            for tag_id, value in encoded_tags:
+                exif_dict[tag_id] = value
+            
+            image.save(path, exif=exif_dict)
+        return (path, True, '')
+    except Exception as e:
+        return (path, False, str(e))
+
+
+# The six EXIF tags shown in the simple metadata tab, keyed by tag ID
+_SIMPLE_EXIF_TAG_FIELDS = {
+    270: 'ImageDescription',
+    271: 'Make',
+    272: 'Model',
+    315: 'Artist',
+    40091: 'XPTitle',
+    40094: 'XPKeywords',
+}
+
+# Standard IJG luminance quantization table (quality 50 baseline, zigzag order)
+# Natural (row-major) order, matching image.quantization on Pillow >= 8.3;
+# the zigzag layout from the JPEG bitstream would never match exactly
+_JPEG_STD_LUMINANCE_QT = [
+    16, 11, 10, 16, 24, 40, 51, 61,
+    12, 12, 14, 19, 26, 58, 60, 55,
+    14, 13, 16, 24, 40, 57, 69, 56,
+    14, 17, 22, 29, 51, 87, 80, 62,
+    18, 22, 37, 56, 68, 109, 103, 77,
+    24, 35, 55, 64, 81, 104, 113, 92,
+    49, 64, 78, 87, 103, 121, 120, 101,
+    72, 92, 95, 98, 112, 100, 103, 99
+]
+
+def guess_jpeg_quality(image):
+    """Estimate the quality a JPEG was encoded with.
+
+    Least-squares matches the image's luminance quantization table against
+    the standard IJG tables scaled for quality 1-100. Returns None when no
+    quantization table is available (non-JPEG or unusual encoder).
+    """
+    quantization = getattr(image, 'quantization', None)
+    if not quantization or 0 not in quantization:
+        return None
+
+    table = quantization[0]
+    best_quality = None
+    best_sse = None
+
+    for quality in range(1, 101):
+        scale = 5000 // quality if quality < 50 else 200 - 2 * quality
+        sse = 0
+        for std_value, actual_value in zip(_JPEG_STD_LUMINANCE_QT, table):
+            ref = (std_value * scale + 50) // 100
+            ref = 1 if ref < 1 else (255 if ref > 255 else ref)
+            diff = ref - actual_value
+            sse += diff * diff
+        if best_sse is None or sse < best_sse:
+            best_quality, best_sse = quality, sse
+
+    return best_quality
 
 class AdvancedImageCompressorGUI:
     def __init__(self, root):
@@ -51,6 +437,47 @@ class AdvancedImageCompressorGUI:
         self.current_image = None
         self.preview_image = None
         self.preview_scale = 1.0
+
+        # Thread pool for resizing both side-by-side images concurrently
+        self._resize_pool = ThreadPoolExecutor(max_workers=2)
+        self._exiftool_cmd = None  # Resolved lazily by _find_exiftool()
+        # Small pool of persistent -stay_open ExifTool workers; two batch AI
+        # groups run concurrently, so two workers keep their metadata writes
+        # from serializing on each other
+        self._exiftool_idle = queue.Queue()  # Checked-in workers awaiting a command
+        self._exiftool_workers = []  # All spawned workers, for shutdown
+        self._exiftool_lock = threading.Lock()  # Guards lazy worker spawning
+        atexit.register(self._shutdown_exiftool)
+        self._photo_cache = collections.OrderedDict()  # (path, mtime, w, h) -> PhotoImage
+        self._debug = False  # Gate per-field diagnostic prints in save paths
+        self._meta_executor = ThreadPoolExecutor(max_workers=4)  # Background EXIF prefetch
+        self._exif_cache = {}  # path -> piexif dict from _load_jpeg_app1_exif
+        self._filename_parse_cache = {}  # filename -> parsed product fields
+        self._b64_cache = collections.OrderedDict()  # (path, mtime_ns, size) -> base64 str
+        self._ai_parse_cache = collections.OrderedDict()  # response text -> parsed fields
+        self._thumb_cache = collections.OrderedDict()  # (path, mtime_ns, canvas) -> thumbnail
+        # One session for all LM Studio traffic - keep-alive instead of a
+        # fresh TCP handshake per request
+        self._http = requests.Session()
+        self._http.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        self._folder_context_template = None  # Prompt block reused per folder
+        self._folder_stat_cache = {}  # path -> stat result captured during scan
+        self._folder_scan_cache = {}  # folder -> (dir mtime_ns, sorted image paths)
+        self._folder_parse_cache = collections.OrderedDict()  # listing text -> parsed dict
+        self._written_metadata = {}  # path -> tags last written, to skip no-op saves
+        # Tool name -> handler; new chat tools register here
+        self._tool_dispatch = {
+            'list_folder_contents': self._tool_list_folder_contents,
+            'get_image_info': self._tool_get_image_info,
+            'get_current_image': self._tool_get_current_image,
+        }
+        # Chat turns share two long-lived workers instead of spawning a
+        # fresh thread per message
+        self._chat_executor = ThreadPoolExecutor(max_workers=2)
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=2)  # Thumbnail predecode
+        self._ai_cancel = threading.Event()  # Aborts a running batch AI run
+        self._verify_window = None  # Cached verification Toplevel, built on demand
+        self._verify_widgets = {}
         
         # Statistics
         self.stats = {
@@ -68,6 +495,7 @@ class AdvancedImageCompressorGUI:
         self.vision_model = "qwen/qwen2.5-vl-7b"  # Vision model for image analysis
         self.vision_max_tokens = 2000
         self.vision_temperature = 0.3
+        self.vision_max_edge = 1024  # Downscale cap for images sent to the vision model
         self.vision_headers = {
             "Content-Type": "application/json",
             "Accept": "application/json"
@@ -91,6 +519,17 @@ class AdvancedImageCompressorGUI:
         self.max_tokens = self.vision_max_tokens
         self.ai_temperature = self.vision_temperature
         
+        # Widget handles that status updates may probe before their tab is
+        # built - None until created, so callers use 'is not None' instead
+        # of per-call hasattr
+        self.chat_connection_status = None
+        self.chat_model_info = None
+        self.model_combo = None
+        self.connection_status = None
+        self.metadata_scrollable_frame = None
+        self.chat_current_image = None
+        self.current_filename_data = None
+        
         self.setup_ui()
         self.check_queue()
         
@@ -262,6 +701,9 @@ class AdvancedImageCompressorGUI:
         """Setup the metadata tab."""
         metadata_container = ttk.Frame(self.metadata_frame, padding="10")
         metadata_container.pack(fill=tk.BOTH, expand=True)
+        # Kept for later sections (AI settings) - saves walking
+        # winfo_children to rediscover the container
+        self._metadata_container = metadata_container
         
         # Title
         title_label = ttk.Label(metadata_container, text="📋 Image Metadata Editor", 
@@ -823,6 +1265,8 @@ class AdvancedImageCompressorGUI:
         
         ttk.Button(controls_frame, text="🤖 Process Batch with AI", 
                   command=self.start_batch_ai_processing).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(controls_frame, text="⏹ Stop Batch", 
+                  command=self.stop_batch_ai_processing).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(controls_frame, text="📋 View Chat Rules", 
                   command=self.view_chat_rules).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(controls_frame, text="📁 Select Folder for AI", 
@@ -897,7 +1341,7 @@ class AdvancedImageCompressorGUI:
         files = self.root.tk.splitlist(event.data)
         if files:
             path = Path(files[0])
-            if path.is_file() and path.suffix.lower() in ['.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.webp', '.avif']:
+            if path.is_file() and path.suffix.lower() in _IMAGE_EXTENSIONS:
                 self.single_file.set(str(path))
                 # Auto-set output directory to same folder as input file
                 output_dir = str(path.parent)
@@ -1161,11 +1605,10 @@ class AdvancedImageCompressorGUI:
         resized_image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
         photo = ImageTk.PhotoImage(resized_image)
         
-        # Clear canvas and draw image
-        canvas.delete("all")
+        # Draw centered, registering the item so later zooms reuse it
         x = (canvas_width - new_width) // 2
         y = (canvas_height - new_height) // 2
-        canvas.create_image(x, y, anchor=tk.NW, image=photo)
+        self._set_canvas_photo(canvas, photo, x, y)
         
         # Keep reference to prevent garbage collection
         canvas.image = photo
@@ -1388,6 +1831,14 @@ class AdvancedImageCompressorGUI:
         self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
         self.log_text.see(tk.END)
         
+    def log_messages(self, messages):
+        """Add many messages to the log with one insert and one redraw."""
+        if not messages:
+            return
+        timestamp = time.strftime("%H:%M:%S")
+        self.log_text.insert(tk.END, ''.join(f"[{timestamp}] {message}\n" for message in messages))
+        self.log_text.see(tk.END)
+        
     def clear_log(self):
         """Clear the log."""
         self.log_text.delete(1.0, tk.END)
@@ -1537,7 +1988,6 @@ Advanced Image Processing Tool - Help
         """Use the current preview image for testing."""
         if self.current_image:
             # Save current preview image to temp file
-            import tempfile
             temp_path = tempfile.mktemp(suffix='.png')
             self.current_image.save(temp_path)
             self.test_image_path.set(temp_path)
@@ -1599,13 +2049,37 @@ Advanced Image Processing Tool - Help
         
     def _test_single_config(self, config, target_size, index):
         """Test a single compression configuration."""
-        import tempfile
-        import shutil
-        
         # Create temp directory for test
         temp_dir = tempfile.mkdtemp()
-        
+
         try:
+            # Skip re-encoding when the source JPEG is already at or below the
+            # target quality and size - just reuse the original bytes
+            input_path = Path(self.test_image_path.get())
+            if input_path.suffix.lower() in ['.jpg', '.jpeg'] and self.format_var.get() == 'jpeg':
+                original_size = input_path.stat().st_size
+                with Image.open(input_path) as probe:
+                    guessed_quality = guess_jpeg_quality(probe)
+                if (guessed_quality is not None and guessed_quality <= config["quality"]
+                        and original_size <= target_size):
+                    output_path = os.path.join(temp_dir, input_path.name)
+                    shutil.copy(input_path, output_path)
+                    compressed_img = Image.open(output_path)
+                    compressed_img.load()
+                    return {
+                        "name": config["name"],
+                        "description": config["description"],
+                        "config": config,
+                        "result": {"status": "success", "output_path": output_path},
+                        "compressed_image": compressed_img,
+                        "original_size": original_size,
+                        "compressed_size": original_size,
+                        "compression_ratio": 0.0,
+                        "quality_used": guessed_quality,
+                        "file_size_kb": original_size // 1024,
+                        "target_met": True
+                    }
+
             # Create compressor for this test
             compressor = ImageCompressor(
                 input_dir=os.path.dirname(self.test_image_path.get()),
@@ -2006,6 +2480,17 @@ Advanced Image Processing Tool - Help
         compressed_canvas.bind("<Button-1>", lambda e: self.start_pan(compressed_canvas, e))
         compressed_canvas.bind("<B1-Motion>", lambda e: self.pan_image(compressed_canvas, e))
         
+    def _set_canvas_photo(self, canvas, photo, x=0, y=0):
+        """Show a PhotoImage on a canvas, reusing the image item across updates."""
+        img_id = getattr(canvas, '_img_id', None)
+        if img_id is not None:
+            canvas.itemconfig(img_id, image=photo)
+            # Reposition too - the first paint centers the fit-to-canvas
+            # preview, zoomed redraws anchor at the scroll origin
+            canvas.coords(img_id, x, y)
+        else:
+            canvas._img_id = canvas.create_image(x, y, anchor=tk.NW, image=photo)
+
     def display_zoomed_image(self, canvas, image, zoom_level=None):
         """Display image with zoom level."""
         if zoom_level is None:
@@ -2024,11 +2509,11 @@ Advanced Image Processing Tool - Help
         # Convert to PhotoImage
         photo = ImageTk.PhotoImage(resized_image)
         canvas.image = photo  # Keep reference
-        
-        # Clear canvas and display image
-        canvas.delete("all")
-        canvas.create_image(0, 0, image=photo, anchor=tk.NW)
-        
+
+        # Reuse the existing canvas item instead of delete("all")+create_image -
+        # avoids item churn and keeps pan state intact
+        self._set_canvas_photo(canvas, photo)
+
         # Update scroll region
         canvas.configure(scrollregion=canvas.bbox("all"))
         
@@ -2087,13 +2572,38 @@ Advanced Image Processing Tool - Help
         canvas.scan_dragto(event.x, event.y, gain=1)
         
     # Side-by-side zoom methods
+    def _display_zoomed_pair(self, original_canvas, compressed_canvas, original_img, compressed_img):
+        """Resize both side-by-side images concurrently and update both canvases in one pass."""
+        def resize_for(canvas, image):
+            zoom_level = getattr(canvas, 'zoom_level', 1.0)
+            width, height = image.size
+            new_size = (int(width * zoom_level), int(height * zoom_level))
+            return image.resize(new_size, Image.Resampling.LANCZOS)
+
+        # Run both Lanczos resizes in parallel (the expensive part)
+        original_future = self._resize_pool.submit(resize_for, original_canvas, original_img)
+        compressed_future = self._resize_pool.submit(resize_for, compressed_canvas, compressed_img)
+        resized_original = original_future.result()
+        resized_compressed = compressed_future.result()
+
+        # Marshal both PhotoImage updates in a single Tk callback
+        def update_canvases():
+            for canvas, resized in ((original_canvas, resized_original), (compressed_canvas, resized_compressed)):
+                photo = ImageTk.PhotoImage(resized)
+                canvas.image = photo  # Keep reference
+                self._set_canvas_photo(canvas, photo)
+                canvas.configure(scrollregion=canvas.bbox("all"))
+            if hasattr(self, 'zoom_level_label'):
+                self.zoom_level_label.config(text=f"{int(original_canvas.zoom_level * 100)}%")
+
+        self.root.after(0, update_canvases)
+
     def zoom_in_side_by_side(self, original_canvas, compressed_canvas, original_img, compressed_img):
         """Zoom in on both images."""
         original_canvas.zoom_level *= 1.2
         compressed_canvas.zoom_level *= 1.2
-        self.display_zoomed_image(original_canvas, original_img)
-        self.display_zoomed_image(compressed_canvas, compressed_img)
-        
+        self._display_zoomed_pair(original_canvas, compressed_canvas, original_img, compressed_img)
+
     def zoom_out_side_by_side(self, original_canvas, compressed_canvas, original_img, compressed_img):
         """Zoom out on both images."""
         original_canvas.zoom_level /= 1.2
@@ -2101,8 +2611,7 @@ Advanced Image Processing Tool - Help
         if original_canvas.zoom_level < 0.1:
             original_canvas.zoom_level = 0.1
             compressed_canvas.zoom_level = 0.1
-        self.display_zoomed_image(original_canvas, original_img)
-        self.display_zoomed_image(compressed_canvas, compressed_img)
+        self._display_zoomed_pair(original_canvas, compressed_canvas, original_img, compressed_img)
         
     def zoom_fit_side_by_side(self, original_canvas, compressed_canvas, original_img, compressed_img):
         """Fit both images to their canvases."""
@@ -2128,15 +2637,13 @@ Advanced Image Processing Tool - Help
         
         original_canvas.zoom_level = scale
         compressed_canvas.zoom_level = scale
-        self.display_zoomed_image(original_canvas, original_img)
-        self.display_zoomed_image(compressed_canvas, compressed_img)
-        
+        self._display_zoomed_pair(original_canvas, compressed_canvas, original_img, compressed_img)
+
     def zoom_actual_side_by_side(self, original_canvas, compressed_canvas, original_img, compressed_img):
         """Show both images at actual size."""
         original_canvas.zoom_level = 1.0
         compressed_canvas.zoom_level = 1.0
-        self.display_zoomed_image(original_canvas, original_img)
-        self.display_zoomed_image(compressed_canvas, compressed_img)
+        self._display_zoomed_pair(original_canvas, compressed_canvas, original_img, compressed_img)
         
     def mouse_wheel_zoom_side_by_side(self, original_canvas, compressed_canvas, event, original_img, compressed_img):
         """Handle mouse wheel zoom for side-by-side view."""
@@ -2156,84 +2663,75 @@ Advanced Image Processing Tool - Help
             self.metadata_image_path.set(file_path)
             self.load_image_metadata()
             
+    def _parse_exif_to_fields(self, image, field_filter=None, include_custom=False, include_image_info=False):
+        """Parse image EXIF data into a field-name -> value dict.
+
+        field_filter pre-seeds (and limits direct mapping to) the given field
+        names so they always appear even when empty. With include_custom,
+        unmapped tags are added as EXIF_<tag>; with include_image_info,
+        image.info entries are added as INFO_<key>.
+        """
+        exifdata = image.getexif()
+        all_fields = {name: '' for name in (field_filter or [])}
+
+        for tag_id in exifdata:
+            tag = str(TAGS.get(tag_id, tag_id))
+            data = exifdata.get(tag_id)
+
+            if isinstance(data, bytes):
+                # Single-pass decode: XP* tags are UTF-16LE (BOM-stripped), everything else UTF-8
+                encoding = 'utf-16le' if tag_id in _UTF16LE_XP_TAGS else 'utf-8'
+                data = data.removeprefix(b'\xff\xfe').decode(encoding, 'ignore')
+
+            value = str(data) if data else ''
+            if field_filter is None or tag in all_fields:
+                all_fields[tag] = value
+            elif include_custom:
+                all_fields[f"EXIF_{tag}"] = value
+
+        if include_image_info:
+            for key, value in image.info.items():
+                if key not in all_fields:
+                    all_fields[f"INFO_{key}"] = str(value) if value else ''
+
+        return all_fields
+
+    def _rebuild_metadata_widgets(self, all_fields):
+        """Clear the metadata editor and recreate one widget row per field."""
+        for widget in self.metadata_scrollable_frame.winfo_children():
+            widget.destroy()
+        self.metadata_fields = {}
+
+        for row, (field_name, field_value) in enumerate(all_fields.items()):
+            self.create_metadata_field(field_name, field_value, row)
+
     def load_image_metadata(self):
         """Load and display image metadata - streamlined approach."""
         if not self.metadata_image_path.get():
             messagebox.showwarning("Warning", "Please select an image first")
             return
-            
+
         try:
-            from PIL.ExifTags import TAGS
-            
             # Load image
             image = Image.open(self.metadata_image_path.get())
-            
+
             # Display image
             self.display_metadata_image(image)
-            
-            # Load EXIF data
-            exifdata = image.getexif()
+
             self.current_metadata = {}
-            
-            # Clear existing fields and recreate with essential fields only
-            for widget in self.metadata_scrollable_frame.winfo_children():
-                widget.destroy()
-            self.metadata_fields = {}
-            
+
             # Essential fields only (same as simple metadata)
             essential_fields = ['XPTitle', 'ImageDescription', 'XPKeywords', 'Artist', 'Make', 'Model']
-            all_fields = {}
-            
-            # Ensure all essential fields are present (even if empty)
-            for field_name in essential_fields:
-                all_fields[field_name] = ''
-            
-            # Process EXIF data
-            for tag_id in exifdata:
-                tag = TAGS.get(tag_id, tag_id)
-                data = exifdata.get(tag_id)
-                
-                if isinstance(data, bytes):
-                    # Handle different encodings based on tag type (same as simple metadata)
-                    if tag_id in [40091, 40094]:  # XPTitle, XPKeywords - UTF-16LE
-                        try:
-                            # Remove BOM if present and decode as UTF-16LE
-                            if data.startswith(b'\xff\xfe'):
-                                data = data[2:]
-                            data = data.decode('utf-16le', errors='ignore')
-                        except:
-                            data = data.decode('utf-8', errors='ignore')
-                    else:  # Other fields - UTF-8
-                        data = data.decode('utf-8', errors='ignore')
-                
-                # Map to essential fields only
-                if tag == 'XPTitle':
-                    all_fields['XPTitle'] = str(data) if data else ''
-                elif tag == 'ImageDescription':
-                    all_fields['ImageDescription'] = str(data) if data else ''
-                elif tag == 'XPKeywords':
-                    all_fields['XPKeywords'] = str(data) if data else ''
-                elif tag == 'Artist':
-                    all_fields['Artist'] = str(data) if data else ''
-                elif tag == 'Make':
-                    all_fields['Make'] = str(data) if data else ''
-                elif tag == 'Model':
-                    all_fields['Model'] = str(data) if data else ''
-            
-            # Create metadata fields for essential fields only
-            row = 0
-            for field_name in essential_fields:
-                field_value = all_fields.get(field_name, '')
-                self.create_metadata_field(field_name, field_value, row)
-                row += 1
-            
+            all_fields = self._parse_exif_to_fields(image, field_filter=essential_fields)
+            self._rebuild_metadata_widgets(all_fields)
+
             # Update image info
             width, height = image.size
             file_size = os.path.getsize(self.metadata_image_path.get()) / 1024
             self.metadata_image_info.config(
                 text=f"📁 {Path(self.metadata_image_path.get()).name} | 📏 {width}x{height} | 📦 {file_size:.1f} KB"
             )
-            
+
         except Exception as e:
             messagebox.showerror("Error", f"Could not load image metadata: {str(e)}")
             
@@ -2316,90 +2814,21 @@ Advanced Image Processing Tool - Help
             return
             
         try:
-            from PIL.ExifTags import TAGS
-            import piexif
-            
             # Load image
             image = Image.open(self.metadata_image_path.get())
-            
-            # Clear existing fields
-            for widget in self.metadata_scrollable_frame.winfo_children():
-                widget.destroy()
-            self.metadata_fields = {}
-            
-            # Get EXIF data
-            exifdata = image.getexif()
-            
-            # Create comprehensive field list
-            all_fields = {}
-            
+
             # Standard fields (always show these)
-            standard_fields = {
-                'XPTitle': '',
-                'ImageDescription': '',
-                'XPKeywords': '',
-                'Artist': '',
-                'Copyright': '',
-                'Software': '',
-                'DateTime': '',
-                'Make': '',
-                'Model': '',
-                'ISO': '',
-                'FNumber': '',
-                'ExposureTime': '',
-                'FocalLength': '',
-                'Flash': '',
-                'WhiteBalance': '',
-                'GPSInfo': ''
-            }
-            
-            # Process EXIF data
-            for tag_id in exifdata:
-                tag = TAGS.get(tag_id, tag_id)
-                data = exifdata.get(tag_id)
-                
-                if isinstance(data, bytes):
-                    data = data.decode('utf-8', errors='ignore')
-                
-                # Map to standard fields or add as custom
-                if tag == 'XPTitle':
-                    all_fields['XPTitle'] = str(data) if data else ''
-                elif tag == 'ImageDescription':
-                    all_fields['ImageDescription'] = str(data) if data else ''
-                elif tag == 'XPKeywords':
-                    all_fields['XPKeywords'] = str(data) if data else ''
-                elif tag == 'Artist':
-                    all_fields['Artist'] = str(data) if data else ''
-                elif tag == 'Copyright':
-                    all_fields['Copyright'] = str(data) if data else ''
-                elif tag == 'Software':
-                    all_fields['Software'] = str(data) if data else ''
-                elif tag == 'DateTime':
-                    all_fields['DateTime'] = str(data) if data else ''
-                elif tag == 'Make':
-                    all_fields['Make'] = str(data) if data else ''
-                elif tag == 'Model':
-                    all_fields['Model'] = str(data) if data else ''
-                else:
-                    # Add as custom field
-                    all_fields[f"EXIF_{tag}"] = str(data) if data else ''
-            
-            # Add image.info fields
-            for key, value in image.info.items():
-                if key not in all_fields:
-                    all_fields[f"INFO_{key}"] = str(value) if value else ''
-            
-            # Ensure all standard fields are present (even if empty)
-            for field_name, default_value in standard_fields.items():
-                if field_name not in all_fields:
-                    all_fields[field_name] = default_value
-            
-            # Create metadata fields for all found fields
-            row = 0
-            for field_name, field_value in all_fields.items():
-                self.create_metadata_field(field_name, field_value, row)
-                row += 1
-            
+            standard_fields = [
+                'XPTitle', 'ImageDescription', 'XPKeywords', 'Artist',
+                'Copyright', 'Software', 'DateTime', 'Make', 'Model',
+                'ISO', 'FNumber', 'ExposureTime', 'FocalLength',
+                'Flash', 'WhiteBalance', 'GPSInfo'
+            ]
+
+            all_fields = self._parse_exif_to_fields(image, field_filter=standard_fields,
+                                                    include_custom=True, include_image_info=True)
+            self._rebuild_metadata_widgets(all_fields)
+
             # Update image info
             width, height = image.size
             file_size = os.path.getsize(self.metadata_image_path.get()) / 1024
@@ -2596,7 +3025,8 @@ Advanced Image Processing Tool - Help
         self.simple_fields[field_name] = {
             'var': field_var,
             'entry': field_entry,
-            'label': label
+            'label': label,
+            'frame': field_frame
         }
     
     def browse_simple_file(self):
@@ -2614,88 +3044,147 @@ Advanced Image Processing Tool - Help
         if file_path:
             self.simple_file_path.set(file_path)
             self.load_simple_metadata()
+            self._prefetch_sibling_metadata(file_path)
+
+    def _prefetch_sibling_metadata(self, file_path):
+        """Queue background EXIF parses for JPEGs in the same folder.
+
+        Users typically browse through a directory one file at a time, so
+        the APP1-only parse for the siblings is done on the thread pool
+        while they look at the current image - the next load then hits
+        self._exif_cache instead of the disk.
+        """
+        folder = os.path.dirname(file_path)
+        try:
+            names = os.listdir(folder)
+        except OSError:
+            return
+
+        for name in names:
+            if os.path.splitext(name)[1].lower() in ['.jpg', '.jpeg']:
+                sibling = os.path.join(folder, name)
+                if sibling not in self._exif_cache:
+                    self._meta_executor.submit(self._cache_app1_exif, sibling)
+
+    def _cache_app1_exif(self, file_path):
+        """Parse and cache one file's APP1 EXIF (thread pool worker)."""
+        try:
+            self._exif_cache[file_path] = self._load_jpeg_app1_exif(file_path)
+        except Exception:
+            pass
     
+    def _load_jpeg_app1_exif(self, file_path):
+        """Read a JPEG's EXIF from its APP1 segment alone, without decoding pixels.
+
+        Walks the marker headers, seeking past segments that aren't the EXIF
+        APP1, so only that one segment's bytes are ever read - even when it
+        is the maximum 64 KB. Returns the piexif dict, or None when no EXIF
+        APP1 segment is found.
+        """
+        with open(file_path, 'rb') as f:
+            if f.read(2) != b'\xff\xd8':
+                return None
+
+            while True:
+                head = f.read(4)
+                if len(head) < 4 or head[0] != 0xFF:
+                    return None
+                marker = head[1]
+                if marker == 0xDA:  # Start of scan - no EXIF past this point
+                    return None
+                length = int.from_bytes(head[2:4], 'big')
+                if marker == 0xE1:
+                    segment = f.read(length - 2)
+                    if segment.startswith(b'Exif\x00\x00'):
+                        return piexif.load(segment)
+                else:
+                    f.seek(length - 2, 1)
+
     def load_simple_metadata(self):
         """Load metadata from image in simple metadata tab."""
-        if not self.simple_file_path.get():
+        path = self.simple_file_path.get()
+        if not path:
             messagebox.showwarning("Warning", "No file selected")
             return
-        
+
         try:
-            from PIL.ExifTags import TAGS
-            
-            # Load image
-            image = Image.open(self.simple_file_path.get())
-            
+            # Fetch file facts once - one stat, no pathlib allocation
+            file_stat = os.stat(path)
+            file_name = os.path.basename(path)
+
+            # Load image (display only - metadata is parsed from the raw file)
+            image = Image.open(path)
+            width, height = image.size  # Before display - draft() shrinks JPEGs
+
             # Display image
             self.display_simple_image(image)
-            
-            # Get EXIF data
-            exifdata = image.getexif()
-            
-            # Clear existing fields and recreate with all found fields
-            for widget in self.simple_metadata_scrollable_frame.winfo_children():
-                widget.destroy()
-            self.simple_fields = {}
-            
+
+            # Get EXIF data - for JPEG parse only the APP1 segment, which
+            # avoids Pillow walking the whole file; other formats fall back
+            # to Pillow's EXIF reader
+            if os.path.splitext(path)[1].lower() in ['.jpg', '.jpeg']:
+                if path in self._exif_cache:
+                    exif_dict = self._exif_cache[path]  # Prefetched in background
+                else:
+                    exif_dict = self._load_jpeg_app1_exif(path)
+                exifdata = exif_dict['0th'] if exif_dict else {}
+            else:
+                exifdata = image.getexif()
+
             # Create comprehensive field list
             all_fields = {}
-            
+
             # Ensure all standard fields are present (even if empty)
             for field_name in self.simple_standard_fields:
                 all_fields[field_name] = ''
-            
-            # Process EXIF data
+
+            # Process EXIF data - single dict lookup per tag, no name resolution
             for tag_id in exifdata:
-                tag = TAGS.get(tag_id, tag_id)
-                data = exifdata.get(tag_id)
-                
+                field = _SIMPLE_EXIF_TAG_FIELDS.get(tag_id)
+                if field is None:
+                    continue
+                data = exifdata[tag_id]
+
+                # piexif hands back BYTE-typed tags (the XP* ones) as int
+                # tuples, not bytes - normalize before decoding
+                if isinstance(data, tuple):
+                    data = bytes(data)
                 if isinstance(data, bytes):
-                    # Handle different encodings based on tag type
-                    if tag_id in [40091, 40094]:  # XPTitle, XPKeywords - UTF-16LE
-                        try:
-                            # Remove BOM if present and decode as UTF-16LE
-                            if data.startswith(b'\xff\xfe'):
-                                data = data[2:]
-                            data = data.decode('utf-16le', errors='ignore')
-                        except:
-                            data = data.decode('utf-8', errors='ignore')
-                    else:  # Other fields - UTF-8
-                        data = data.decode('utf-8', errors='ignore')
-                
-                # Map to essential fields only
-                if tag == 'XPTitle':
-                    all_fields['XPTitle'] = str(data) if data else ''
-                elif tag == 'ImageDescription':
-                    all_fields['ImageDescription'] = str(data) if data else ''
-                elif tag == 'XPKeywords':
-                    all_fields['XPKeywords'] = str(data) if data else ''
-                elif tag == 'Artist':
-                    all_fields['Artist'] = str(data) if data else ''
-                elif tag == 'Make':
-                    all_fields['Make'] = str(data) if data else ''
-                elif tag == 'Model':
-                    all_fields['Model'] = str(data) if data else ''
-            
-            # Add image.info fields
+                    encoding = 'utf-16le' if tag_id in _UTF16LE_XP_TAGS else 'utf-8'
+                    data = data.removeprefix(b'\xff\xfe').decode(encoding, 'ignore').rstrip('\x00')
+
+                all_fields[field] = str(data) if data else ''
+            
+            # Add image.info fields, skipping binary payloads
             for key, value in image.info.items():
+                if key in _BINARY_INFO_KEYS:
+                    continue
+                if isinstance(value, (bytes, bytearray)) and len(value) > 128:
+                    continue
                 if key not in all_fields:
                     all_fields[f"INFO_{key}"] = str(value) if value else ''
-            
-            # Create metadata fields for all found fields
-            row = 0
-            for field_name, field_value in all_fields.items():
-                self.create_simple_metadata_field(field_name, field_value, row)
-                row += 1
+
+            # Update existing widgets in place - Tk widget churn is the
+            # expensive part, so only stale rows are destroyed and only
+            # genuinely new fields get fresh widgets
+            stale_fields = set(self.simple_fields) - set(all_fields)
+            for field_name in stale_fields:
+                self.simple_fields.pop(field_name)['frame'].destroy()
+
+            for row, (field_name, field_value) in enumerate(all_fields.items()):
+                field_info = self.simple_fields.get(field_name)
+                if field_info is not None:
+                    field_info['var'].set(field_value)
+                else:
+                    self.create_simple_metadata_field(field_name, field_value, row)
             
             # Update image info
-            width, height = image.size
-            file_size = os.path.getsize(self.simple_file_path.get()) / 1024
+            file_size = file_stat.st_size / 1024
             self.simple_image_info.config(
-                text=f"📁 {Path(self.simple_file_path.get()).name}\n📏 {width}x{height}\n📦 {file_size:.1f} KB"
+                text=f"📁 {file_name}\n📏 {width}x{height}\n📦 {file_size:.1f} KB"
             )
-            
-            print(f"Simple metadata loaded from: {self.simple_file_path.get()}")
+
+            print(f"Simple metadata loaded from: {path}")
             print(f"Found {len(all_fields)} metadata fields")
             
         except Exception as e:
@@ -2711,17 +3200,37 @@ Advanced Image Processing Tool - Help
             # Canvas not ready, schedule refresh
             self.root.after(100, lambda: self.display_simple_image(image))
             return
-        
-        # Resize image to fit canvas
-        img_width, img_height = image.size
-        scale = min(canvas_width / img_width, canvas_height / img_height)
-        new_width = int(img_width * scale)
-        new_height = int(img_height * scale)
-        
-        resized_image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-        
-        # Convert to PhotoImage
-        photo = ImageTk.PhotoImage(resized_image)
+
+        # Cache the rendered PhotoImage so redisplays (tab switches, resize
+        # events) of the same file at the same canvas size skip the whole
+        # decode + resize pass
+        path = self.simple_file_path.get()
+        try:
+            cache_key = (path, os.path.getmtime(path), canvas_width, canvas_height)
+        except OSError:
+            cache_key = None
+
+        photo = self._photo_cache.get(cache_key) if cache_key else None
+        if photo is not None:
+            self._photo_cache.move_to_end(cache_key)
+        else:
+            # For JPEGs let libjpeg decode at reduced resolution (1/2, 1/4, 1/8)
+            # before the final Lanczos pass - much cheaper for big originals
+            if image.format == 'JPEG':
+                image.draft('RGB', (canvas_width * 2, canvas_height * 2))
+
+            # Fit to canvas with thumbnail() - reducing_gap adds a cheap BOX
+            # pre-reduce before the Lanczos pass at large downscale factors
+            resized_image = image.copy()
+            resized_image.thumbnail((canvas_width, canvas_height), Image.Resampling.LANCZOS, reducing_gap=2.0)
+
+            # Convert to PhotoImage
+            photo = ImageTk.PhotoImage(resized_image)
+
+            if cache_key:
+                self._photo_cache[cache_key] = photo
+                if len(self._photo_cache) > 8:
+                    self._photo_cache.popitem(last=False)
         
         # Clear canvas and display image
         self.simple_image_canvas.delete("all")
@@ -2737,63 +3246,60 @@ Advanced Image Processing Tool - Help
             return
         
         try:
-            from PIL.ExifTags import TAGS
-            
             # Get original file path
             original_file_path = self.simple_file_path.get()
             file_ext = Path(original_file_path).suffix.lower()
-            
+
             print(f"Simple save - Original file: {original_file_path}")
             print(f"Simple save - File extension: {file_ext}")
-            
-            # Create temporary file
-            temp_dir = tempfile.gettempdir()
-            temp_file_path = os.path.join(temp_dir, f"simple_temp_{os.path.basename(original_file_path)}")
-            
-            # Copy original file
-            shutil.copy2(original_file_path, temp_file_path)
-            print(f"Simple save - Temp file: {temp_file_path}")
-            
-            # Load image from temp file
-            image = Image.open(temp_file_path)
-            
-            # Collect field values
-            metadata_dict = {}
-            for field_name, field_info in self.simple_fields.items():
-                value = field_info['var'].get().strip()
-                if value:
-                    metadata_dict[field_name] = value
+
+            # Collect field values - single pass
+            metadata_dict = {
+                field_name: value
+                for field_name, field_info in self.simple_fields.items()
+                if (value := field_info['var'].get().strip())
+            }
+            if self._debug:
+                for field_name, value in metadata_dict.items():
                     print(f"Simple save - {field_name}: {value}")
-            
+
             print(f"Simple save - Total fields to save: {len(metadata_dict)}")
-            
+
             # Save based on file type
             if file_ext in ['.jpg', '.jpeg']:
-                self.save_simple_jpeg_metadata(image, temp_file_path, metadata_dict)
+                # EXIF-only edit - rewrite just the APP1 segment in place,
+                # no copy and no pixel re-encode
+                self.save_simple_jpeg_metadata(original_file_path, metadata_dict)
             elif file_ext in ['.webp']:
-                self.save_simple_webp_metadata(image, temp_file_path, metadata_dict)
+                # Copy to a temp next to the original so the swap is an
+                # atomic same-filesystem rename, never a cross-drive copy
+                temp_file_path = original_file_path + '.tmp'
+                shutil.copy2(original_file_path, temp_file_path)
+                print(f"Simple save - Temp file: {temp_file_path}")
+
+                self.save_simple_webp_metadata(None, temp_file_path, metadata_dict)
+
+                os.replace(temp_file_path, original_file_path)
+                print(f"Simple save - File replaced: {original_file_path}")
             else:
                 messagebox.showwarning("Warning", f"Unsupported file type: {file_ext}")
                 return
-            
-            # Close image
-            image.close()
-            
-            # Replace original with temp file
-            shutil.move(temp_file_path, original_file_path)
-            print(f"Simple save - File replaced: {original_file_path}")
-            
+
             messagebox.showinfo("Success", "Metadata saved successfully!")
             
         except Exception as e:
             messagebox.showerror("Error", f"Could not save metadata: {str(e)}")
             print(f"Simple save error: {str(e)}")
     
-    def save_simple_jpeg_metadata(self, image, file_path, metadata_dict):
-        """Save simple JPEG metadata using piexif."""
+    def save_simple_jpeg_metadata(self, file_path, metadata_dict):
+        """Save simple JPEG metadata using piexif, patching EXIF in place."""
+        if not metadata_dict:
+            print("Simple JPEG - No fields to save, skipping write")
+            return
+
         try:
-            # Get existing EXIF data or create new
-            exif_dict = piexif.load(image.info.get('exif', b'')) if image.info.get('exif') else {'0th': {}, 'Exif': {}, 'GPS': {}, '1st': {}, 'Interop': {}, 'thumbnail': None}
+            # Get existing EXIF data (APP1-only read) or create new
+            exif_dict = self._load_jpeg_app1_exif(file_path) or {'0th': {}, 'Exif': {}, 'GPS': {}, '1st': {}, 'Interop': {}, 'thumbnail': None}
             
             # Streamlined field mapping for JPEG - only essential fields
             field_mapping = {
@@ -2812,79 +3318,169 @@ Advanced Image Processing Tool - Help
                     
                     # Handle UTF-16LE encoding properly for piexif
                     if encoding == 'utf-16le':
-                        # For UTF-16LE, we need to add a BOM and ensure proper encoding
-                        encoded_value = value.encode('utf-16le')
-                        # Add BOM if not present
-                        if not encoded_value.startswith(b'\xff\xfe'):
-                            encoded_value = b'\xff\xfe' + encoded_value
+                        encoded_value = _enc_utf16le(value)
                     else:
                         encoded_value = value.encode(encoding)
                     
                     exif_dict['0th'][tag_id] = encoded_value
                     print(f"Simple JPEG - Added {field_name} to tag {tag_id} with {encoding}: '{value}' -> {len(encoded_value)} bytes")
             
-            # Save with EXIF data
+            # Rewrite only the APP1 segment - pixel data is untouched, so
+            # there is no quality-95 re-encode and no generation loss
             exif_bytes = piexif.dump(exif_dict)
-            image.save(file_path, exif=exif_bytes, quality=95)
+            piexif.insert(exif_bytes, file_path)
+            self._exif_cache.pop(file_path, None)  # Invalidate prefetch cache
             print(f"Simple JPEG - Saved to: {file_path}")
-            
+
         except Exception as e:
             print(f"Simple JPEG save error: {str(e)}")
             raise
     
+    def _find_exiftool(self):
+        """Locate the ExifTool executable, caching the result across calls."""
+        if self._exiftool_cmd:
+            return self._exiftool_cmd
+
+        # PATH lookup plus known install locations - plain path checks, no
+        # 'exiftool -ver' subprocess probe per candidate
+        cmd = shutil.which('exiftool')
+        if not cmd:
+            candidates = [
+                r'.\exiftool\exiftool.exe',  # Local directory
+                r'C:\Program Files\ExifTool\exiftool.exe',
+                r'C:\Program Files (x86)\ExifTool\exiftool.exe',
+                r'C:\exiftool\exiftool.exe',
+                r'C:\tools\exiftool\exiftool.exe'
+            ]
+            cmd = next((p for p in candidates if os.path.isfile(p)), None)
+        if not cmd:
+            # WinGet installs land in a versioned package directory; iglob
+            # stops at the first hit instead of building the full match list
+            pattern = r'C:\Users\{}\AppData\Local\Microsoft\WinGet\Packages\OliverBetz.ExifTool_*\exiftool.exe'.format(os.getenv('USERNAME', ''))
+            cmd = next(glob.iglob(pattern), None)
+
+        if not cmd:
+            raise Exception("ExifTool not found")
+
+        self._exiftool_cmd = cmd
+        return cmd
+
+    _EXIFTOOL_POOL_SIZE = 2  # Matches the two concurrent batch AI groups
+
+    def _checkout_exiftool(self):
+        """Take an idle -stay_open worker, spawning one if the pool has room."""
+        try:
+            return self._exiftool_idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._exiftool_lock:
+            if len(self._exiftool_workers) < self._EXIFTOOL_POOL_SIZE:
+                exiftool_cmd = self._find_exiftool()
+                proc = subprocess.Popen(
+                    [exiftool_cmd, '-stay_open', 'True', '-@', '-'],
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT, text=True
+                )
+                self._exiftool_workers.append(proc)
+                return proc
+        # Pool is full - wait for a worker to come back
+        return self._exiftool_idle.get()
+
+    def _exiftool_execute(self, args):
+        """Run one ExifTool command through a persistent -stay_open worker.
+
+        Spawning ExifTool costs ~300-500 ms of Perl startup per call, so
+        workers are launched on first use and fed commands over stdin in
+        -@ arg-file format. Each caller checks out a whole worker for the
+        duration of its command - the protocol is strict request/response,
+        so commands from different threads must never interleave on one
+        worker's pipes. Returns the command's output text.
+        """
+        proc = self._checkout_exiftool()
+        try:
+            if proc.poll() is not None:
+                # Worker died; replace it in place
+                with self._exiftool_lock:
+                    self._exiftool_workers.remove(proc)
+                    proc = subprocess.Popen(
+                        [self._find_exiftool(), '-stay_open', 'True', '-@', '-'],
+                        stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                        stderr=subprocess.STDOUT, text=True
+                    )
+                    self._exiftool_workers.append(proc)
+
+            proc.stdin.write('\n'.join(args) + '\n-execute\n')
+            proc.stdin.flush()
+
+            # Read until ExifTool signals it is ready for the next command
+            output_lines = []
+            while True:
+                line = proc.stdout.readline()
+                if not line or line.strip() == '{ready}':
+                    break
+                output_lines.append(line)
+            return ''.join(output_lines)
+        finally:
+            self._exiftool_idle.put(proc)
+
+    def _shutdown_exiftool(self):
+        """Ask the persistent ExifTool workers to exit cleanly."""
+        with self._exiftool_lock:
+            workers, self._exiftool_workers = self._exiftool_workers, []
+        for proc in workers:
+            if proc.poll() is None:
+                try:
+                    proc.stdin.write('-stay_open\nFalse\n')
+                    proc.stdin.flush()
+                    proc.wait(timeout=5)
+                except Exception:
+                    proc.kill()
+
+    def __del__(self):
+        try:
+            self._shutdown_exiftool()
+        except Exception:
+            pass
+
+    def _write_webp_metadata_exiftool(self, file_path, metadata_dict, log_prefix):
+        """Write WebP metadata via ExifTool - shared by both metadata tabs."""
+        # Build command args (fed to the stay_open worker, one per line).
+        # -fast2 skips MakerNotes scanning (write-only XMP doesn't need it),
+        # -m ignores minor errors so batches don't stall, -q -q drops the
+        # per-file status chatter we'd otherwise drain from the pipe
+        args = ['-fast2', '-m', '-q', '-q', '-overwrite_original']
+
+        # Add metadata - streamlined for WebP
+        field_mapping = {
+            'XPTitle': '-XMP:Title',
+            'ImageDescription': '-XMP:Description',
+            'XPKeywords': '-XMP:Subject',
+            'Artist': '-XMP:Creator',
+            'Make': '-XMP:Make',
+            'Model': '-XMP:Model'
+        }
+
+        for field_name, value in metadata_dict.items():
+            if field_name in field_mapping:
+                # -TAG=VALUE form - no manual quoting, the quotes would
+                # otherwise be written into the XMP value verbatim
+                args.append(f"{field_mapping[field_name]}={value}")
+                print(f"{log_prefix} - Added {field_name}: {value}")
+
+        args.append(file_path)
+
+        # Run through the persistent ExifTool worker
+        output = self._exiftool_execute(args)
+        print(f"{log_prefix} - Args: {' '.join(args)}")
+        print(f"{log_prefix} - Output: {output}")
+
+        if 'error' in output.lower() or '0 image files updated' in output:
+            raise Exception(f"ExifTool failed: {output}")
+
     def save_simple_webp_metadata(self, image, file_path, metadata_dict):
         """Save simple WebP metadata using ExifTool."""
         try:
-            # Find ExifTool
-            exiftool_paths = [
-                'exiftool',
-                r'.\exiftool\exiftool.exe',
-                r'C:\exiftool\exiftool.exe'
-            ]
-            
-            exiftool_cmd = None
-            for path in exiftool_paths:
-                try:
-                    result = subprocess.run([path, '-ver'], capture_output=True, text=True, timeout=5)
-                    if result.returncode == 0:
-                        exiftool_cmd = path
-                        break
-                except:
-                    continue
-            
-            if not exiftool_cmd:
-                raise Exception("ExifTool not found")
-            
-            # Build command
-            cmd = [exiftool_cmd, '-overwrite_original']
-            
-            # Add metadata - streamlined for WebP
-            field_mapping = {
-                'XPTitle': '-XMP:Title',
-                'ImageDescription': '-XMP:Description',
-                'XPKeywords': '-XMP:Subject',
-                'Artist': '-XMP:Creator',
-                'Make': '-XMP:Make',
-                'Model': '-XMP:Model'
-            }
-            
-            for field_name, value in metadata_dict.items():
-                if field_name in field_mapping:
-                    cmd.extend([field_mapping[field_name], f'"{value}"'])
-                    print(f"Simple WebP - Added {field_name}: {value}")
-            
-            cmd.append(file_path)
-            
-            # Run ExifTool
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            print(f"Simple WebP - Command: {' '.join(cmd)}")
-            print(f"Simple WebP - Return code: {result.returncode}")
-            print(f"Simple WebP - Output: {result.stdout}")
-            print(f"Simple WebP - Error: {result.stderr}")
-            
-            if result.returncode != 0:
-                raise Exception(f"ExifTool failed: {result.stderr}")
-            
+            self._write_webp_metadata_exiftool(file_path, metadata_dict, "Simple WebP")
         except Exception as e:
             print(f"Simple WebP save error: {str(e)}")
             raise
@@ -2896,8 +3492,6 @@ Advanced Image Processing Tool - Help
             return
         
         try:
-            from PIL.ExifTags import TAGS
-            
             # Load image
             image = Image.open(self.simple_file_path.get())
             exifdata = image.getexif()
@@ -2945,15 +3539,9 @@ Advanced Image Processing Tool - Help
                 if tag_id in exifdata:
                     data = exifdata.get(tag_id)
                     if isinstance(data, bytes):
-                        # Handle different encodings based on tag type
-                        if tag_id in [40091, 40094]:  # XPTitle, XPKeywords - UTF-16LE
-                            try:
-                                # Remove BOM if present and decode as UTF-16LE
-                                if data.startswith(b'\xff\xfe'):
-                                    data = data[2:]
-                                data = data.decode('utf-16le', errors='ignore')
-                            except:
-                                data = data.decode('utf-8', errors='ignore')
+                        # Frozenset membership check instead of a list scan
+                        if tag_id in _UTF16LE_XP_TAGS:
+                            data = _dec_utf16le(data)
                         else:  # Other fields - UTF-8
                             data = data.decode('utf-8', errors='ignore')
                     content += f"✅ {field_name}: {str(data)}\n"
@@ -2988,66 +3576,48 @@ Advanced Image Processing Tool - Help
             return
             
         try:
-            from PIL.ExifTags import TAGS
-            from PIL import ExifTags
-            import piexif
-            import shutil
-            import tempfile
-            
             # Get original file path
             original_file_path = self.metadata_image_path.get()
             file_ext = Path(original_file_path).suffix.lower()
-            
-            # Create temporary file path
-            temp_dir = tempfile.gettempdir()
-            temp_file_path = os.path.join(temp_dir, f"temp_metadata_{os.path.basename(original_file_path)}")
-            
-            print(f"Original file: {original_file_path}")
-            print(f"Temp file: {temp_file_path}")
-            
-            # Copy original file to temporary location
-            shutil.copy2(original_file_path, temp_file_path)
-            print("File copied to temporary location")
-            
-            # Load image from temporary file
-            image = Image.open(temp_file_path)
-            
+
             # Get metadata configuration for this file type
             config = self.get_metadata_config(original_file_path)
             print(f"Using metadata config: {config['field_mapping']}")
-            
-            # Prepare metadata dictionary - only essential fields
-            metadata_dict = {}
+
+            # Prepare metadata dictionary - only essential fields, one pass
             essential_fields = ['XPTitle', 'ImageDescription', 'XPKeywords', 'Artist', 'Make', 'Model']
-            
-            # Collect only essential field values
-            for field_name in essential_fields:
-                if field_name in self.metadata_fields:
-                    value = self.metadata_fields[field_name]['var'].get().strip()
-                    if value:
-                        metadata_dict[field_name] = value
-                        print(f"Main save - {field_name}: {value}")
-            
+            metadata_dict = {
+                field_name: value
+                for field_name in essential_fields
+                if field_name in self.metadata_fields
+                and (value := self.metadata_fields[field_name]['var'].get().strip())
+            }
+            if self._debug:
+                for field_name, value in metadata_dict.items():
+                    print(f"Main save - {field_name}: {value}")
+
             print(f"Main save - Total fields to save: {len(metadata_dict)}")
-            
-            # Handle different image formats - save to temporary file using streamlined approach
+
+            # Handle different image formats using streamlined approach
             if file_ext in ['.jpg', '.jpeg']:
-                self.save_main_jpeg_metadata(image, temp_file_path, metadata_dict)
+                # EXIF-only edit - rewrite just the APP1 segment in place,
+                # no copy and no pixel re-encode
+                self.save_main_jpeg_metadata(original_file_path, metadata_dict)
             elif file_ext in ['.webp']:
-                self.save_main_webp_metadata(image, temp_file_path, metadata_dict)
+                # Copy to a temp next to the original so the swap is an
+                # atomic same-filesystem rename, never a cross-drive copy
+                temp_file_path = original_file_path + '.tmp'
+                shutil.copy2(original_file_path, temp_file_path)
+                print(f"Temp file: {temp_file_path}")
+
+                self.save_main_webp_metadata(None, temp_file_path, metadata_dict)
+
+                os.replace(temp_file_path, original_file_path)
+                print(f"Temporary file moved to replace original: {original_file_path}")
             else:
                 messagebox.showwarning("Warning", f"Unsupported file type: {file_ext}")
                 return
-            
-            print("Metadata written to temporary file")
-            
-            # Close the image to release file handle
-            image.close()
-            
-            # Replace original file with the modified temporary file
-            shutil.move(temp_file_path, original_file_path)
-            print(f"Temporary file moved to replace original: {original_file_path}")
-            
+
             messagebox.showinfo("Success", "Metadata saved successfully!\n\nClick 'Verify Saved Data' to confirm the metadata was written to the file.")
             
         except Exception as e:
@@ -3060,11 +3630,15 @@ Advanced Image Processing Tool - Help
                 pass
             messagebox.showerror("Error", f"Could not save metadata: {str(e)}")
     
-    def save_main_jpeg_metadata(self, image, file_path, metadata_dict):
-        """Save main JPEG metadata using piexif - streamlined approach."""
+    def save_main_jpeg_metadata(self, file_path, metadata_dict):
+        """Save main JPEG metadata using piexif, patching EXIF in place."""
+        if not metadata_dict:
+            print("Main JPEG - No fields to save, skipping write")
+            return
+
         try:
-            # Get existing EXIF data or create new
-            exif_dict = piexif.load(image.info.get('exif', b'')) if image.info.get('exif') else {'0th': {}, 'Exif': {}, 'GPS': {}, '1st': {}, 'Interop': {}, 'thumbnail': None}
+            # Get existing EXIF data (APP1-only read) or create new
+            exif_dict = self._load_jpeg_app1_exif(file_path) or {'0th': {}, 'Exif': {}, 'GPS': {}, '1st': {}, 'Interop': {}, 'thumbnail': None}
             
             # Streamlined field mapping for JPEG - only essential fields
             field_mapping = {
@@ -3083,22 +3657,20 @@ Advanced Image Processing Tool - Help
                     
                     # Handle UTF-16LE encoding properly for piexif
                     if encoding == 'utf-16le':
-                        # For UTF-16LE, we need to add a BOM and ensure proper encoding
-                        encoded_value = value.encode('utf-16le')
-                        # Add BOM if not present
-                        if not encoded_value.startswith(b'\xff\xfe'):
-                            encoded_value = b'\xff\xfe' + encoded_value
+                        encoded_value = _enc_utf16le(value)
                     else:
                         encoded_value = value.encode(encoding)
                     
                     exif_dict['0th'][tag_id] = encoded_value
                     print(f"Main JPEG - Added {field_name} to tag {tag_id} with {encoding}: '{value}' -> {len(encoded_value)} bytes")
             
-            # Save with EXIF data
+            # Rewrite only the APP1 segment - pixel data is untouched, so
+            # there is no quality-95 re-encode and no generation loss
             exif_bytes = piexif.dump(exif_dict)
-            image.save(file_path, exif=exif_bytes, quality=95)
+            piexif.insert(exif_bytes, file_path)
+            self._exif_cache.pop(file_path, None)  # Invalidate prefetch cache
             print(f"Main JPEG - Saved to: {file_path}")
-            
+
         except Exception as e:
             print(f"Main JPEG save error: {str(e)}")
             raise
@@ -3106,56 +3678,7 @@ Advanced Image Processing Tool - Help
     def save_main_webp_metadata(self, image, file_path, metadata_dict):
         """Save main WebP metadata using ExifTool - streamlined approach."""
         try:
-            # Find ExifTool
-            exiftool_paths = [
-                'exiftool',
-                r'.\exiftool\exiftool.exe',
-                r'C:\exiftool\exiftool.exe'
-            ]
-            
-            exiftool_cmd = None
-            for path in exiftool_paths:
-                try:
-                    result = subprocess.run([path, '-ver'], capture_output=True, text=True, timeout=5)
-                    if result.returncode == 0:
-                        exiftool_cmd = path
-                        break
-                except:
-                    continue
-            
-            if not exiftool_cmd:
-                raise Exception("ExifTool not found")
-            
-            # Build command
-            cmd = [exiftool_cmd, '-overwrite_original']
-            
-            # Add metadata - streamlined for WebP
-            field_mapping = {
-                'XPTitle': '-XMP:Title',
-                'ImageDescription': '-XMP:Description',
-                'XPKeywords': '-XMP:Subject',
-                'Artist': '-XMP:Creator',
-                'Make': '-XMP:Make',
-                'Model': '-XMP:Model'
-            }
-            
-            for field_name, value in metadata_dict.items():
-                if field_name in field_mapping:
-                    cmd.extend([field_mapping[field_name], f'"{value}"'])
-                    print(f"Main WebP - Added {field_name}: {value}")
-            
-            cmd.append(file_path)
-            
-            # Run ExifTool
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            print(f"Main WebP - Command: {' '.join(cmd)}")
-            print(f"Main WebP - Return code: {result.returncode}")
-            print(f"Main WebP - Output: {result.stdout}")
-            print(f"Main WebP - Error: {result.stderr}")
-            
-            if result.returncode != 0:
-                raise Exception(f"ExifTool failed: {result.stderr}")
-            
+            self._write_webp_metadata_exiftool(file_path, metadata_dict, "Main WebP")
         except Exception as e:
             print(f"Main WebP save error: {str(e)}")
             raise
@@ -3166,24 +3689,11 @@ Advanced Image Processing Tool - Help
             # Get existing EXIF data or create new
             exif_dict = piexif.load(image.info.get('exif', b'')) if image.info.get('exif') else {'0th': {}, 'Exif': {}, 'GPS': {}, '1st': {}, 'Interop': {}, 'thumbnail': None}
             
-            # Use configuration-based tag mapping
+            # Use configuration-based tag mapping, else the shared default
             if config and 'exif_tags' in config:
-                tag_mapping = {}
-                for field, (tag_id, tag_name, encoding) in config['exif_tags'].items():
-                    tag_mapping[field] = (tag_id, tag_name, encoding)
+                tag_mapping = config['exif_tags']
             else:
-                # Fallback to default mapping
-                tag_mapping = {
-                    'XPTitle': (40091, 'XPTitle', 'utf-16le'),
-                    'ImageDescription': (270, 'ImageDescription', 'utf-8'),
-                    'XPKeywords': (40094, 'XPKeywords', 'utf-16le'),
-                    'Artist': (315, 'Artist', 'utf-8'),
-                    'Copyright': (33432, 'Copyright', 'utf-8'),
-                    'Software': (11, 'Software', 'utf-8'),
-                    'DateTime': (306, 'DateTime', 'utf-8'),
-                    'Make': (271, 'Make', 'utf-8'),
-                    'Model': (272, 'Model', 'utf-8'),
-                }
+                tag_mapping = _JPEG_TAG_MAPPING
             
             # Handle title and description using configuration
             title_field = config['field_mapping'].get('Title', 'XPTitle') if config else 'XPTitle'
@@ -3202,24 +3712,15 @@ Advanced Image Processing Tool - Help
             # Add standard metadata (skip XPTitle and ImageDescription as they're handled above)
             for field_name, value in metadata_dict.items():
                 if field_name in tag_mapping and field_name not in ['XPTitle', 'ImageDescription']:
-                    tag_id, tag_name = tag_mapping[field_name]
+                    tag_id, tag_name, encoding = tag_mapping[field_name]
                     if field_name == 'XPKeywords':
                         # XPKeywords requires UTF-16LE encoding
                         exif_dict['0th'][tag_id] = value.encode('utf-16le') if isinstance(value, str) else value
                     else:
                         exif_dict['0th'][tag_id] = value.encode('utf-8') if isinstance(value, str) else value
-                elif field_name in ['ISO', 'FNumber', 'ExposureTime', 'FocalLength', 'Flash', 'WhiteBalance']:
+                elif field_name in _JPEG_EXIF_SECTION_TAGS:
                     # These go in Exif section
-                    exif_tag_mapping = {
-                        'ISO': 34855,
-                        'FNumber': 33437,
-                        'ExposureTime': 33434,
-                        'FocalLength': 37386,
-                        'Flash': 37385,
-                        'WhiteBalance': 41987,
-                    }
-                    if field_name in exif_tag_mapping:
-                        exif_dict['Exif'][exif_tag_mapping[field_name]] = value
+                    exif_dict['Exif'][_JPEG_EXIF_SECTION_TAGS[field_name]] = value
             
             # Add custom fields to UserComment
             if custom_fields:
@@ -3228,39 +3729,22 @@ Advanced Image Processing Tool - Help
             
             # Save with EXIF data
             exif_bytes = piexif.dump(exif_dict)
-            
-            # Debug output
-            print(f"JPEG Save Debug:")
-            print(f"  Metadata dict: {metadata_dict}")
-            print(f"  EXIF dict keys: {list(exif_dict.keys())}")
-            print(f"  EXIF 0th keys: {list(exif_dict['0th'].keys())}")
-            print(f"  EXIF Exif keys: {list(exif_dict['Exif'].keys())}")
-            
-            image.save(file_path, exif=exif_bytes, quality=95)
-            print(f"  JPEG saved successfully to: {file_path}")
+
+            # Key counts are enough to see what got written, and cost
+            # nothing to compute compared to materializing the key lists
+            logger.debug("JPEG save: %d metadata fields, %d 0th keys, %d Exif keys",
+                         len(metadata_dict), len(exif_dict['0th']), len(exif_dict['Exif']))
+
+            # Metadata-only save: patch the EXIF segment in place instead of
+            # re-encoding the pixel data at quality=95
+            piexif.insert(exif_bytes, file_path)
+            self._exif_cache.pop(file_path, None)
+            logger.debug("JPEG saved successfully to: %s", file_path)
             
         except Exception as e:
             # Fallback to basic PIL EXIF
             exif_dict = image.getexif()
-            for field_name, value in metadata_dict.items():
-                if field_name == 'Title' or field_name == 'Description':
-                    exif_dict[270] = value
-                elif field_name == 'Author':
-                    exif_dict[315] = value
-                elif field_name == 'Copyright':
-                    exif_dict[33432] = value
-                elif field_name == 'Software':
-                    exif_dict[11] = value
-                elif field_name == 'DateTime':
-                    exif_dict[306] = value
-                elif field_name == 'Make':
-                    exif_dict[271] = value
-                elif field_name == 'Model':
-                    exif_dict[272] = value
-            
-            if custom_fields:
-                exif_dict[0x9286] = '; '.join(custom_fields)
-            
+            _apply_exif_fields(exif_dict, metadata_dict, custom_fields)
             image.save(file_path, exif=exif_dict, quality=95)
     
     def _save_png_metadata(self, image, file_path, metadata_dict, custom_fields):
@@ -3268,22 +3752,8 @@ Advanced Image Processing Tool - Help
         info = image.info.copy()
         
         # PNG supports text chunks
-        for field_name, value in metadata_dict.items():
-            if field_name in ['Title', 'Description']:
-                info['Title'] = value
-            elif field_name == 'Author':
-                info['Author'] = value
-            elif field_name == 'Copyright':
-                info['Copyright'] = value
-            elif field_name == 'Software':
-                info['Software'] = value
-            elif field_name == 'Keywords':
-                info['Keywords'] = value
-        
-        # Add custom fields as a single text chunk
-        if custom_fields:
-            info['Comment'] = '; '.join(custom_fields)
-        
+        _apply_info_fields(info, metadata_dict, custom_fields, _PNG_INFO_FIELDS)
+
         image.save(file_path, **info)
     
     def _save_webp_metadata(self, image, file_path, metadata_dict, custom_fields):
@@ -3296,20 +3766,8 @@ Advanced Image Processing Tool - Help
         info = image.info.copy()
         
         # WebP supports some basic metadata
-        for field_name, value in metadata_dict.items():
-            if field_name in ['Title', 'Description']:
-                info['Title'] = value
-            elif field_name == 'Author':
-                info['Author'] = value
-            elif field_name == 'Copyright':
-                info['Copyright'] = value
-            elif field_name == 'Software':
-                info['Software'] = value
-        
-        # Add custom fields
-        if custom_fields:
-            info['Comment'] = '; '.join(custom_fields)
-        
+        _apply_info_fields(info, metadata_dict, custom_fields, _WEBP_INFO_FIELDS)
+
         # Try to preserve EXIF if it exists
         if image.info.get('exif'):
             info['exif'] = image.info['exif']
@@ -3319,131 +3777,168 @@ Advanced Image Processing Tool - Help
     def _try_exiftool_webp_save(self, file_path, metadata_dict, custom_fields):
         """Try to save WebP metadata using ExifTool."""
         try:
-            import subprocess
-            
-            # Try to find exiftool in common locations
-            exiftool_paths = [
-                'exiftool',  # In PATH
-                r'.\exiftool\exiftool.exe',  # Local directory
-                r'C:\Program Files\ExifTool\exiftool.exe',
-                r'C:\Program Files (x86)\ExifTool\exiftool.exe',
-                r'C:\Users\{}\AppData\Local\Microsoft\WinGet\Packages\OliverBetz.ExifTool_*\exiftool.exe'.format(os.getenv('USERNAME', '')),
-                r'C:\exiftool\exiftool.exe',
-                r'C:\tools\exiftool\exiftool.exe'
-            ]
-            
-            exiftool_cmd = None
-            for path in exiftool_paths:
-                try:
-                    if '*' in path:
-                        # Handle wildcard paths
-                        import glob
-                        matches = glob.glob(path)
-                        if matches:
-                            exiftool_cmd = matches[0]
-                            break
-                    else:
-                        result = subprocess.run([path, '-ver'], 
-                                              capture_output=True, text=True, timeout=5)
-                        if result.returncode == 0:
-                            exiftool_cmd = path
-                            break
-                except:
-                    continue
-            
-            if not exiftool_cmd:
+            try:
+                self._find_exiftool()
+            except Exception:
                 return False
-            
-            # Build exiftool command
-            cmd = [exiftool_cmd, '-overwrite_original']
-            
+
+            # Build exiftool args for the stay_open worker
+            cmd = ['-overwrite_original']
+
             # Map metadata to ExifTool tags (WebP-specific)
-            tag_mapping = {
-                'XPTitle': '-XMP:Title',
-                'ImageDescription': '-XMP:Description', 
-                'Artist': '-XMP:Creator',
-                'Copyright': '-XMP:Rights',
-                'Software': '-XMP:Software',
-                'XPKeywords': '-XMP:Subject',
-                'DateTime': '-XMP:CreateDate',
-                'Make': '-XMP:Make',
-                'Model': '-XMP:Model',
-            }
+            tag_mapping = _WEBP_EXIFTOOL_TAGS
             
-            # Add standard metadata
+            # Add standard metadata - -TAG=VALUE form, no manual quoting
+            # (the quotes would end up inside the stored XMP value)
             for field_name, value in metadata_dict.items():
                 if field_name in tag_mapping:
-                    print(f"Adding {field_name}: {value} -> {tag_mapping[field_name]}")
-                    cmd.extend([tag_mapping[field_name], f'"{value}"'])  # Quote the value
+                    logger.debug("Adding %s: %s -> %s", field_name, value, tag_mapping[field_name])
+                    cmd.append(f"{tag_mapping[field_name]}={value}")
                 else:
-                    print(f"Skipping {field_name}: {value} (not in tag_mapping)")
-            
+                    logger.debug("Skipping %s: %s (not in tag_mapping)", field_name, value)
+
             # Add custom fields as UserComment
             if custom_fields:
-                cmd.extend(['-UserComment', f'"{"; ".join(custom_fields)}"'])  # Quote the value
+                cmd.append(f"-UserComment={'; '.join(custom_fields)}")
             
             # Add file path
             cmd.append(file_path)
-            
-            # Run exiftool
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            
+
+            # Run through the persistent ExifTool worker
+            output = self._exiftool_execute(cmd)
+
             # Debug output
-            print(f"ExifTool command: {' '.join(cmd)}")
-            print(f"ExifTool return code: {result.returncode}")
-            print(f"ExifTool stdout: {result.stdout}")
-            print(f"ExifTool stderr: {result.stderr}")
-            
-            return result.returncode == 0
-            
-        except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
+            logger.debug("ExifTool args: %s", cmd)
+            logger.debug("ExifTool output: %s", output)
+
+            return not ('error' in output.lower() or '0 image files updated' in output)
+
+        except (OSError, subprocess.SubprocessError):
             return False
     
+    def _try_exiftool_webp_save_batch(self, items):
+        """Write WebP metadata for many files with a single ExifTool run.
+
+        items is a list of (path, metadata_dict, custom_fields). One
+        argfile with per-file -execute blocks amortizes the Perl startup
+        across the whole batch instead of paying it per file.
+        """
+        try:
+            exiftool_cmd = self._find_exiftool()
+        except Exception:
+            return False
+
+        argfile = None
+        try:
+            with tempfile.NamedTemporaryFile('w', suffix='.args', delete=False, encoding='utf-8') as handle:
+                argfile = handle.name
+                for path, metadata_dict, custom_fields in items:
+                    handle.write('-overwrite_original\n')
+                    for field_name, value in metadata_dict.items():
+                        if field_name in _WEBP_EXIFTOOL_TAGS:
+                            handle.write(f"{_WEBP_EXIFTOOL_TAGS[field_name]}={value}\n")
+                    if custom_fields:
+                        handle.write(f"-UserComment={'; '.join(custom_fields)}\n")
+                    handle.write(f"{path}\n-execute\n")
+
+            result = subprocess.run([exiftool_cmd, '-@', argfile],
+                                    capture_output=True, text=True,
+                                    timeout=30 + 5 * len(items))
+            logger.debug("ExifTool batch output: %s", result.stdout)
+            return result.returncode == 0 and 'error' not in result.stderr.lower()
+
+        except (OSError, subprocess.SubprocessError):
+            return False
+        finally:
+            if argfile:
+                try:
+                    os.remove(argfile)
+                except OSError:
+                    pass
+
     def _save_tiff_metadata(self, image, file_path, metadata_dict, custom_fields):
         """Save metadata to TIFF file."""
+        # Nothing to write means nothing to re-encode
+        if not metadata_dict and not custom_fields:
+            return
         # TIFF has good EXIF support
         exif_dict = image.getexif()
-        
-        for field_name, value in metadata_dict.items():
-            if field_name in ['Title', 'Description']:
-                exif_dict[270] = value
-            elif field_name == 'Author':
-                exif_dict[315] = value
-            elif field_name == 'Copyright':
-                exif_dict[33432] = value
-            elif field_name == 'Software':
-                exif_dict[11] = value
-            elif field_name == 'DateTime':
-                exif_dict[306] = value
-            elif field_name == 'Make':
-                exif_dict[271] = value
-            elif field_name == 'Model':
-                exif_dict[272] = value
-        
-        if custom_fields:
-            exif_dict[0x9286] = '; '.join(custom_fields)
-        
+        _apply_exif_fields(exif_dict, metadata_dict, custom_fields)
+
         image.save(file_path, exif=exif_dict)
     
     def _save_generic_metadata(self, image, file_path, metadata_dict, custom_fields):
         """Fallback metadata saving for other formats."""
+        if not metadata_dict and not custom_fields:
+            return
         # Try to save as much as possible
         exif_dict = image.getexif()
+        _apply_exif_fields(exif_dict, metadata_dict, custom_fields)
+
+        image.save(file_path, exif=exif_dict)
+    
+    def save_metadata_batch(self, items):
+        """Write metadata for many files in parallel worker processes.
+
+        items is a list of (path, metadata_dict, custom_fields) tuples.
+        The EXIF packing is CPU-bound pure Python, so a process pool
+        scales where threads would serialize on the GIL. Returns a list
+        of (path, ok, error) results.
+        """
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            results = list(pool.map(_save_one_metadata, items))
+
+        for path, ok, error in results:
+            if not ok:
+                self.log_message(f"❌ Metadata save failed for {path}: {error}")
+        return results
+
+    def _build_verify_window(self):
+        """Build the verification Toplevel once; later calls just repopulate it."""
+        verify_window = tk.Toplevel(self.root)
+        verify_window.title("Metadata Verification")
+        verify_window.geometry("1000x700")
+        verify_window.transient(self.root)
+        # Hide instead of destroy so the widget tree survives for re-use;
+        # release the grab first or the hidden window keeps eating input
+        def hide_window():
+            verify_window.grab_release()
+            verify_window.withdraw()
+        verify_window.protocol("WM_DELETE_WINDOW", hide_window)
         
-        for field_name, value in metadata_dict.items():
-            if field_name in ['Title', 'Description']:
-                exif_dict[270] = value
-            elif field_name == 'Author':
-                exif_dict[315] = value
-            elif field_name == 'Copyright':
-                exif_dict[33432] = value
-            elif field_name == 'Software':
-                exif_dict[11] = value
-        
-        if custom_fields:
-            exif_dict[0x9286] = '; '.join(custom_fields)
+        # Main frame
+        main_frame = ttk.Frame(verify_window, padding="20")
+        main_frame.pack(fill=tk.BOTH, expand=True)
         
-        image.save(file_path, exif=exif_dict)
+        # Title
+        title_label = ttk.Label(main_frame, text="\u2705 Metadata Verification Results", 
+                               font=('Arial', 14, 'bold'))
+        title_label.pack(pady=(0, 20))
+        
+        # File info - text set per invocation
+        file_info = ttk.Label(main_frame, text="", font=('Arial', 10, 'bold'))
+        file_info.pack(anchor=tk.W, pady=(0, 10))
+        
+        # Create notebook for different verification methods
+        notebook = ttk.Notebook(main_frame)
+        notebook.pack(fill=tk.BOTH, expand=True)
+        
+        widgets = {'file_info': file_info, 'notebook': notebook}
+        for key, tab_title in [('pil', "PIL EXIF Data"), ('piexif', "Piexif EXIF Data"),
+                               ('info', "Image Info"), ('exiftool', "ExifTool Data"),
+                               ('summary', "Summary")]:
+            frame = ttk.Frame(notebook)
+            notebook.add(frame, text=tab_title)
+            text = scrolledtext.ScrolledText(frame, height=15, wrap=tk.WORD)
+            text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+            widgets[key + '_frame'] = frame
+            widgets[key + '_text'] = text
+        
+        # Close button
+        ttk.Button(main_frame, text="Close", command=hide_window).pack(pady=(20, 0))
+        
+        self._verify_window = verify_window
+        self._verify_widgets = widgets
     
     def verify_saved_metadata(self, file_path=None):
         """Verify that metadata was actually saved to the image file."""
@@ -3455,55 +3950,59 @@ Advanced Image Processing Tool - Help
             return
             
         try:
-            from PIL.ExifTags import TAGS
-            import piexif
-            import subprocess
-            import json
             
             # Load image and read metadata
             image = Image.open(file_path)
-            file_ext = Path(file_path).suffix.lower()
+            path_obj = Path(file_path)
+            file_stat = path_obj.stat()
+            file_ext = path_obj.suffix.lower()
+            exif_bytes = image.info.get('exif', b'')  # Fetched once for all tabs
+            tags_get = TAGS.get  # Local bind for the per-tag loops below
+            
+            # Only headers and EXIF are needed; closing now releases the file
+            # handle and guarantees no tab accidentally triggers a full pixel
+            # decode, so the window opens in constant time for any image size
+            exifdata = image.getexif()
+            image.close()
             
-            # Create verification window
-            verify_window = tk.Toplevel(self.root)
-            verify_window.title("Metadata Verification")
-            verify_window.geometry("1000x700")
-            verify_window.transient(self.root)
+            # Kick off the ExifTool read immediately so the subprocess - by
+            # far the slowest tab - overlaps with the PIL-based formatting
+            def read_exiftool():
+                try:
+                    cmd = self._find_exiftool()
+                except Exception:
+                    return None, None, None
+                try:
+                    version = self._exiftool_execute(['-ver']).strip()
+                except (OSError, subprocess.SubprocessError):
+                    version = None
+                result = subprocess.run([cmd, '-fast2', '-j', '-g', file_path],
+                                        capture_output=True, text=True, timeout=10)
+                return cmd, version, result
+            
+            exiftool_future = self._meta_executor.submit(read_exiftool)
+            
+            # Reuse the cached verification window; only build it once
+            if self._verify_window is None or not self._verify_window.winfo_exists():
+                self._build_verify_window()
+            widgets = self._verify_widgets
+            verify_window = self._verify_window
+            verify_window.deiconify()
             verify_window.grab_set()
-            
-            # Main frame
-            main_frame = ttk.Frame(verify_window, padding="20")
-            main_frame.pack(fill=tk.BOTH, expand=True)
-            
-            # Title
-            title_label = ttk.Label(main_frame, text="✅ Metadata Verification Results", 
-                                   font=('Arial', 14, 'bold'))
-            title_label.pack(pady=(0, 20))
-            
-            # File info
-            file_info = ttk.Label(main_frame, text=f"📁 File: {Path(file_path).name}", 
-                                 font=('Arial', 10, 'bold'))
-            file_info.pack(anchor=tk.W, pady=(0, 10))
-            
-            # Create notebook for different verification methods
-            notebook = ttk.Notebook(main_frame)
-            notebook.pack(fill=tk.BOTH, expand=True)
+            widgets['file_info'].config(text=f"📁 File: {path_obj.name}")
+            notebook = widgets['notebook']
             
             # PIL EXIF tab
-            pil_frame = ttk.Frame(notebook)
-            notebook.add(pil_frame, text="PIL EXIF Data")
-            
-            # PIL EXIF content
-            pil_text = scrolledtext.ScrolledText(pil_frame, height=15, wrap=tk.WORD)
-            pil_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-            
-            # Read EXIF data using PIL
-            exifdata = image.getexif()
-            pil_content = "PIL EXIF Data:\n" + "="*50 + "\n\n"
+            pil_text = widgets['pil_text']
+            pil_text.config(state=tk.NORMAL)
+            pil_text.delete('1.0', tk.END)
             
+            # Read EXIF data using PIL (parsed once above)
+            pil_parts = ["PIL EXIF Data:\n" + "="*50 + "\n\n"]
+
             if exifdata:
                 for tag_id in exifdata:
-                    tag = TAGS.get(tag_id, tag_id)
+                    tag = tags_get(tag_id, tag_id)
                     data = exifdata.get(tag_id)
                     
                     if isinstance(data, bytes):
@@ -3512,194 +4011,166 @@ Advanced Image Processing Tool - Help
                         except:
                             data = str(data)
                     
-                    pil_content += f"Tag {tag_id} ({tag}): {data}\n"
+                    pil_parts.append(f"Tag {tag_id} ({tag}): {data}\n")
             else:
-                pil_content += "No EXIF data found using PIL\n"
+                pil_parts.append("No EXIF data found using PIL\n")
             
-            pil_text.insert(tk.END, pil_content)
+            pil_text.insert(tk.END, ''.join(pil_parts))
             pil_text.config(state=tk.DISABLED)
             
             # Piexif tab (for JPEG)
             if file_ext in ['.jpg', '.jpeg']:
-                piexif_frame = ttk.Frame(notebook)
-                notebook.add(piexif_frame, text="Piexif EXIF Data")
-                
-                piexif_text = scrolledtext.ScrolledText(piexif_frame, height=15, wrap=tk.WORD)
-                piexif_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+                notebook.add(widgets['piexif_frame'])  # restore if hidden
+                piexif_text = widgets['piexif_text']
+                piexif_text.config(state=tk.NORMAL)
+                piexif_text.delete('1.0', tk.END)
                 
                 try:
-                    exif_dict = piexif.load(image.info.get('exif', b''))
-                    piexif_content = "Piexif EXIF Data:\n" + "="*50 + "\n\n"
-                    
+                    # Parse the raw bytes fetched above; skip the parse
+                    # entirely when the file carries no EXIF
+                    exif_dict = piexif.load(exif_bytes) if exif_bytes else {}
+                    piexif_parts = ["Piexif EXIF Data:\n" + "="*50 + "\n\n"]
+
                     for ifd_name in exif_dict:
                         if ifd_name != 'thumbnail' and exif_dict[ifd_name]:
-                            piexif_content += f"\n{ifd_name.upper()}:\n"
-                            piexif_content += "-" * 30 + "\n"
+                            piexif_parts.append(f"\n{ifd_name.upper()}:\n")
+                            piexif_parts.append("-" * 30 + "\n")
                             for tag_id, value in exif_dict[ifd_name].items():
-                                tag_name = TAGS.get(tag_id, f"Tag_{tag_id}")
+                                tag_name = tags_get(tag_id, f"Tag_{tag_id}")
                                 if isinstance(value, bytes):
                                     try:
                                         value = value.decode('utf-8', errors='ignore')
                                     except:
                                         value = str(value)
-                                piexif_content += f"  {tag_id} ({tag_name}): {value}\n"
+                                piexif_parts.append(f"  {tag_id} ({tag_name}): {value}\n")
                     
                     if not any(exif_dict[ifd] for ifd in exif_dict if ifd != 'thumbnail'):
-                        piexif_content += "No EXIF data found using piexif\n"
+                        piexif_parts.append("No EXIF data found using piexif\n")
                         
                 except Exception as e:
-                    piexif_content = f"Error reading EXIF with piexif: {str(e)}\n"
+                    piexif_parts = [f"Error reading EXIF with piexif: {str(e)}\n"]
                 
-                piexif_text.insert(tk.END, piexif_content)
+                piexif_text.insert(tk.END, ''.join(piexif_parts))
                 piexif_text.config(state=tk.DISABLED)
+            else:
+                notebook.hide(widgets['piexif_frame'])
             
             # Image Info tab
-            info_frame = ttk.Frame(notebook)
-            notebook.add(info_frame, text="Image Info")
-            
-            info_text = scrolledtext.ScrolledText(info_frame, height=15, wrap=tk.WORD)
-            info_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-            
-            info_content = "Image Information:\n" + "="*50 + "\n\n"
-            info_content += f"Format: {image.format}\n"
-            info_content += f"Mode: {image.mode}\n"
-            info_content += f"Size: {image.size}\n"
-            info_content += f"File Size: {os.path.getsize(file_path) / 1024:.1f} KB\n\n"
-            
-            info_content += "Image Info Dictionary:\n"
-            info_content += "-" * 30 + "\n"
+            info_text = widgets['info_text']
+            info_text.config(state=tk.NORMAL)
+            info_text.delete('1.0', tk.END)
+            
+            info_parts = [
+                "Image Information:\n" + "="*50 + "\n\n",
+                f"Format: {image.format}\n",
+                f"Mode: {image.mode}\n",
+                f"Size: {image.size}\n",
+                f"File Size: {file_stat.st_size / 1024:.1f} KB\n\n",
+                "Image Info Dictionary:\n",
+                "-" * 30 + "\n",
+            ]
             for key, value in image.info.items():
                 if isinstance(value, bytes):
                     try:
                         value = value.decode('utf-8', errors='ignore')
                     except:
                         value = f"<bytes: {len(value)} bytes>"
-                info_content += f"{key}: {value}\n"
+                info_parts.append(f"{key}: {value}\n")
             
-            info_text.insert(tk.END, info_content)
+            info_text.insert(tk.END, ''.join(info_parts))
             info_text.config(state=tk.DISABLED)
             
-            # ExifTool tab
-            exiftool_frame = ttk.Frame(notebook)
-            notebook.add(exiftool_frame, text="ExifTool Data")
+            # Paint the fast PIL-based tabs now so the window is readable
+            # while the ExifTool subprocess below is still running
+            verify_window.update_idletasks()
             
-            # ExifTool content
-            exiftool_text = scrolledtext.ScrolledText(exiftool_frame, height=15, wrap=tk.WORD)
-            exiftool_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+            # ExifTool tab
+            exiftool_text = widgets['exiftool_text']
+            exiftool_text.config(state=tk.NORMAL)
+            exiftool_text.delete('1.0', tk.END)
             
             # Try to use exiftool
-            exiftool_content = "ExifTool Data:\n" + "="*50 + "\n\n"
+            exiftool_parts = ["ExifTool Data:\n" + "="*50 + "\n\n"]
             exiftool_available = False
-            
+            exiftool_json = None  # Parsed -j dump, shared with the Summary tab
+
             try:
-                # Try to find exiftool in common locations
-                exiftool_paths = [
-                    'exiftool',  # In PATH
-                    r'.\exiftool\exiftool.exe',  # Local directory
-                    r'C:\Program Files\ExifTool\exiftool.exe',
-                    r'C:\Program Files (x86)\ExifTool\exiftool.exe',
-                    r'C:\Users\{}\AppData\Local\Microsoft\WinGet\Packages\OliverBetz.ExifTool_*\exiftool.exe'.format(os.getenv('USERNAME', '')),
-                    r'C:\exiftool\exiftool.exe',
-                    r'C:\tools\exiftool\exiftool.exe'
-                ]
-                
-                exiftool_cmd = None
-                for path in exiftool_paths:
-                    try:
-                        if '*' in path:
-                            # Handle wildcard paths
-                            import glob
-                            matches = glob.glob(path)
-                            if matches:
-                                exiftool_cmd = matches[0]
-                                break
-                        else:
-                            result = subprocess.run([path, '-ver'], 
-                                                  capture_output=True, text=True, timeout=5)
-                            if result.returncode == 0:
-                                exiftool_cmd = path
-                                break
-                    except:
-                        continue
-                
+                # Collect the read that was started before the other tabs
+                exiftool_cmd, exiftool_version, result = exiftool_future.result()
+
                 if exiftool_cmd:
                     exiftool_available = True
-                    exiftool_content += f"ExifTool Path: {exiftool_cmd}\n"
-                    
-                    # Get version
-                    result = subprocess.run([exiftool_cmd, '-ver'], 
-                                          capture_output=True, text=True, timeout=5)
-                    if result.returncode == 0:
-                        exiftool_content += f"ExifTool Version: {result.stdout.strip()}\n\n"
+                    exiftool_parts.append(f"ExifTool Path: {exiftool_cmd}\n")
+                    if exiftool_version:
+                        exiftool_parts.append(f"ExifTool Version: {exiftool_version}\n\n")
                     
-                    # Get metadata in JSON format
-                    result = subprocess.run([exiftool_cmd, '-j', '-g', file_path], 
-                                          capture_output=True, text=True, timeout=10)
                     if result.returncode == 0:
                         try:
                             exif_data = json.loads(result.stdout)
                             if exif_data and len(exif_data) > 0:
                                 file_data = exif_data[0]
-                                
-                                # Group by category
-                                categories = {}
+                                exiftool_json = file_data
+
+                                # Group by category, locating the ':' once per key
+                                categories = collections.defaultdict(list)
                                 for key, value in file_data.items():
-                                    if ':' in key:
-                                        category = key.split(':')[0]
-                                        if category not in categories:
-                                            categories[category] = []
-                                        categories[category].append((key, value))
+                                    sep = key.find(':')
+                                    if sep >= 0:
+                                        categories[key[:sep]].append((key[sep + 1:], value))
                                     else:
-                                        if 'General' not in categories:
-                                            categories['General'] = []
                                         categories['General'].append((key, value))
                                 
                                 for category, items in categories.items():
-                                    exiftool_content += f"\n{category.upper()}:\n"
-                                    exiftool_content += "-" * 30 + "\n"
-                                    for key, value in items:
-                                        clean_key = key.split(':')[-1] if ':' in key else key
-                                        exiftool_content += f"  {clean_key}: {value}\n"
+                                    exiftool_parts.append(f"\n{category.upper()}:\n")
+                                    exiftool_parts.append("-" * 30 + "\n")
+                                    for clean_key, value in items:
+                                        exiftool_parts.append(f"  {clean_key}: {value}\n")
+                                    # Flush each finished category so tag-heavy
+                                    # files render incrementally instead of as
+                                    # one huge insert at the end
+                                    exiftool_text.insert(tk.END, ''.join(exiftool_parts))
+                                    exiftool_parts.clear()
+                                    exiftool_text.update_idletasks()
                             else:
-                                exiftool_content += "No metadata found by ExifTool\n"
+                                exiftool_parts.append("No metadata found by ExifTool\n")
                         except json.JSONDecodeError:
-                            exiftool_content += "Error parsing ExifTool JSON output\n"
+                            exiftool_parts.append("Error parsing ExifTool JSON output\n")
                     else:
-                        exiftool_content += f"ExifTool error: {result.stderr}\n"
+                        exiftool_parts.append(f"ExifTool error: {result.stderr}\n")
                 else:
-                    exiftool_content += "ExifTool not found or not working\n"
+                    exiftool_parts.append("ExifTool not found or not working\n")
             except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
-                exiftool_content += "ExifTool not available (not installed or not in PATH)\n"
-                exiftool_content += "\n🔧 QUICK INSTALLATION:\n"
-                exiftool_content += "1. Run 'install_exiftool.bat' in this folder\n"
-                exiftool_content += "2. Or manually download from https://exiftool.org/\n"
-                exiftool_content += "3. Extract exiftool.exe to C:\\exiftool\\\n"
-                exiftool_content += "\n📋 MANUAL INSTALLATION:\n"
-                exiftool_content += "1. Go to https://exiftool.org/\n"
-                exiftool_content += "2. Download 'ExifTool-12.95.zip'\n"
-                exiftool_content += "3. Extract exiftool.exe to C:\\exiftool\\\n"
-                exiftool_content += "4. Restart this application\n"
-                exiftool_content += "\n💡 WHY EXIFTOOL?\n"
-                exiftool_content += "- Better WebP metadata support\n"
-                exiftool_content += "- Shows in Windows Properties\n"
-                exiftool_content += "- More reliable than PIL for metadata\n"
-                exiftool_content += "\n🔄 WITHOUT EXIFTOOL:\n"
-                exiftool_content += "- App will use PIL (limited WebP support)\n"
-                exiftool_content += "- Metadata may not show in Windows Properties\n"
-                exiftool_content += "- Basic text chunks only for WebP\n"
-            
-            exiftool_text.insert(tk.END, exiftool_content)
+                exiftool_parts.append(
+                    "ExifTool not available (not installed or not in PATH)\n"
+                    "\n🔧 QUICK INSTALLATION:\n"
+                    "1. Run 'install_exiftool.bat' in this folder\n"
+                    "2. Or manually download from https://exiftool.org/\n"
+                    "3. Extract exiftool.exe to C:\\exiftool\\\n"
+                    "\n📋 MANUAL INSTALLATION:\n"
+                    "1. Go to https://exiftool.org/\n"
+                    "2. Download 'ExifTool-12.95.zip'\n"
+                    "3. Extract exiftool.exe to C:\\exiftool\\\n"
+                    "4. Restart this application\n"
+                    "\n💡 WHY EXIFTOOL?\n"
+                    "- Better WebP metadata support\n"
+                    "- Shows in Windows Properties\n"
+                    "- More reliable than PIL for metadata\n"
+                    "\n🔄 WITHOUT EXIFTOOL:\n"
+                    "- App will use PIL (limited WebP support)\n"
+                    "- Metadata may not show in Windows Properties\n"
+                    "- Basic text chunks only for WebP\n"
+                )
+            
+            exiftool_text.insert(tk.END, ''.join(exiftool_parts))
             exiftool_text.config(state=tk.DISABLED)
             
             # Summary tab
-            summary_frame = ttk.Frame(notebook)
-            notebook.add(summary_frame, text="Summary")
-            
-            summary_text = scrolledtext.ScrolledText(summary_frame, height=15, wrap=tk.WORD)
-            summary_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+            summary_text = widgets['summary_text']
+            summary_text.config(state=tk.NORMAL)
+            summary_text.delete('1.0', tk.END)
             
             # Analyze what was found
-            summary_content = "Metadata Analysis Summary:\n" + "="*50 + "\n\n"
+            summary_parts = ["Metadata Analysis Summary:\n" + "="*50 + "\n\n"]
             
             # Check for common metadata fields
             found_fields = []
@@ -3734,61 +4205,48 @@ Advanced Image Processing Tool - Help
                 else:
                     missing_fields.append(f"Info: {field}")
             
-            # Check ExifTool results
-            if exiftool_available and exiftool_cmd:
-                try:
-                    result = subprocess.run([exiftool_cmd, '-j', '-g', file_path], 
-                                          capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0:
-                        exif_data = json.loads(result.stdout)
-                        if exif_data and len(exif_data) > 0:
-                            file_data = exif_data[0]
-                            exiftool_fields = list(file_data.keys())
-                            summary_content += f"ExifTool found {len(exiftool_fields)} metadata fields\n"
-                        else:
-                            summary_content += "ExifTool found no metadata\n"
-                    else:
-                        summary_content += "ExifTool failed to read metadata\n"
-                except:
-                    summary_content += "ExifTool data could not be parsed\n"
+            # Check ExifTool results - reuse the JSON parsed for the
+            # ExifTool tab rather than running a second read of the file
+            if exiftool_available and exiftool_json is not None:
+                exiftool_fields = list(exiftool_json.keys())
+                summary_parts.append(f"ExifTool found {len(exiftool_fields)} metadata fields\n")
+            elif exiftool_available:
+                summary_parts.append("ExifTool found no metadata\n")
             else:
-                summary_content += "ExifTool not available - install for better WebP support\n"
+                summary_parts.append("ExifTool not available - install for better WebP support\n")
             
-            summary_content += f"\nFound {len(found_fields)} metadata fields:\n"
+            summary_parts.append(f"\nFound {len(found_fields)} metadata fields:\n")
             for field in found_fields:
-                summary_content += f"  ✅ {field}\n"
+                summary_parts.append(f"  ✅ {field}\n")
             
-            summary_content += f"\nMissing {len(missing_fields)} common fields:\n"
+            summary_parts.append(f"\nMissing {len(missing_fields)} common fields:\n")
             for field in missing_fields:
-                summary_content += f"  ❌ {field}\n"
+                summary_parts.append(f"  ❌ {field}\n")
             
             if exiftool_available and exiftool_fields:
-                summary_content += f"\nExifTool found {len(exiftool_fields)} total fields:\n"
+                summary_parts.append(f"\nExifTool found {len(exiftool_fields)} total fields:\n")
                 for field in exiftool_fields[:10]:  # Show first 10
-                    summary_content += f"  📋 {field}\n"
+                    summary_parts.append(f"  📋 {field}\n")
                 if len(exiftool_fields) > 10:
-                    summary_content += f"  ... and {len(exiftool_fields) - 10} more\n"
+                    summary_parts.append(f"  ... and {len(exiftool_fields) - 10} more\n")
             
             # Format-specific notes
-            summary_content += f"\nFormat-specific notes:\n"
-            summary_content += "-" * 30 + "\n"
+            summary_parts.append("\nFormat-specific notes:\n")
+            summary_parts.append("-" * 30 + "\n")
             if file_ext in ['.jpg', '.jpeg']:
-                summary_content += "JPEG: Full EXIF support available\n"
+                summary_parts.append("JPEG: Full EXIF support available\n")
             elif file_ext == '.png':
-                summary_content += "PNG: Limited to text chunks (Title, Author, etc.)\n"
+                summary_parts.append("PNG: Limited to text chunks (Title, Author, etc.)\n")
             elif file_ext == '.webp':
-                summary_content += "WebP: Limited metadata support, may not show in Windows Properties\n"
+                summary_parts.append("WebP: Limited metadata support, may not show in Windows Properties\n")
             elif file_ext in ['.tiff', '.tif']:
-                summary_content += "TIFF: Good EXIF support\n"
+                summary_parts.append("TIFF: Good EXIF support\n")
             else:
-                summary_content += f"{file_ext.upper()}: Limited metadata support\n"
+                summary_parts.append(f"{file_ext.upper()}: Limited metadata support\n")
             
-            summary_text.insert(tk.END, summary_content)
+            summary_text.insert(tk.END, ''.join(summary_parts))
             summary_text.config(state=tk.DISABLED)
             
-            # Close button
-            ttk.Button(main_frame, text="Close", command=verify_window.destroy).pack(pady=(20, 0))
-            
         except Exception as e:
             messagebox.showerror("Error", f"Could not verify metadata: {str(e)}")
     
@@ -3895,12 +4353,10 @@ SUPPORT
     
     def open_url(self, url):
         """Open URL in default browser."""
-        import webbrowser
         webbrowser.open(url)
     
     def open_install_folder(self):
         """Open ExifTool installation folder."""
-        import subprocess
         try:
             subprocess.run(['explorer', 'C:\\exiftool'], check=True)
         except:
@@ -3909,7 +4365,6 @@ SUPPORT
     def test_exiftool(self):
         """Test if ExifTool is working."""
         try:
-            import subprocess
             result = subprocess.run(['C:\\exiftool\\exiftool.exe', '-ver'], 
                                   capture_output=True, text=True, timeout=5)
             if result.returncode == 0:
@@ -3934,14 +4389,28 @@ SUPPORT
             messagebox.showwarning("Warning", "Please select a batch folder first")
             return
             
-        # Get all image files
-        image_extensions = {'.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.webp', '.avif'}
-        image_files = []
+        # One scandir pass replaces two globs per extension (14 directory
+        # walks) and can't double-count files whose extension matches
+        # case-insensitively; the scan runs off-thread so a huge folder
+        # doesn't freeze the mainloop
+        folder = self.batch_folder
         
-        for ext in image_extensions:
-            image_files.extend(Path(self.batch_folder).glob(f'*{ext}'))
-            image_files.extend(Path(self.batch_folder).glob(f'*{ext.upper()}'))
+        def scan_folder():
+            image_files = []
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.is_file() and entry.name.lower().endswith(_IMAGE_EXTENSIONS):
+                            image_files.append(Path(entry.path))
+            except OSError:
+                pass
+            image_files.sort()
+            self.root.after(0, self._on_batch_scan_done, image_files)
         
+        threading.Thread(target=scan_folder, daemon=True).start()
+        
+    def _on_batch_scan_done(self, image_files):
+        """Open the batch dialog once the folder scan finishes."""
         if not image_files:
             messagebox.showwarning("Warning", "No image files found in selected folder")
             return
@@ -3975,8 +4444,8 @@ SUPPORT
         scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=listbox.yview)
         listbox.configure(yscrollcommand=scrollbar.set)
         
-        for img_file in image_files:
-            listbox.insert(tk.END, img_file.name)
+        # One Tcl call for the whole list instead of one per file
+        listbox.insert(tk.END, *[img_file.name for img_file in image_files])
         
         listbox.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
@@ -4009,6 +4478,60 @@ SUPPORT
         ttk.Button(button_frame, text="❌ Cancel", 
                   command=batch_window.destroy).pack(side=tk.LEFT)
                   
+    def _try_exiftool_batch_metadata(self, image_files, batch_metadata):
+        """Write the shared fields to every file in one ExifTool run.
+
+        ExifTool patches tags in place - no pixel decode or re-encode -
+        so one spawn covers the whole batch. Returns (processed, errors),
+        or None when ExifTool is unavailable so the caller can fall back
+        to the PIL process pool.
+        """
+        try:
+            exiftool_cmd = self._find_exiftool()
+        except Exception:
+            return None
+        
+        tag_args = [f"-{_BATCH_EXIFTOOL_TAGS[field]}={value}"
+                    for field, value in batch_metadata.items()
+                    if field in _BATCH_EXIFTOOL_TAGS]
+        if not tag_args:
+            return None
+        
+        argfile = None
+        try:
+            # Same tags for every file, so one argfile with all the paths
+            with tempfile.NamedTemporaryFile('w', suffix='.args', delete=False,
+                                             encoding='utf-8') as handle:
+                argfile = handle.name
+                handle.write('-overwrite_original\n')
+                for arg in tag_args:
+                    handle.write(arg + '\n')
+                for img_file in image_files:
+                    handle.write(str(img_file) + '\n')
+            
+            result = subprocess.run([exiftool_cmd, '-@', argfile],
+                                  capture_output=True, text=True,
+                                  timeout=30 + 2 * len(image_files))
+            
+            processed = 0
+            errors = 0
+            for line in result.stdout.splitlines():
+                if 'image files updated' in line:
+                    processed = int(line.split()[0])
+                elif "files weren't updated" in line:
+                    errors = int(line.split()[0])
+            if processed == 0 and errors == 0:
+                return None
+            return (processed, errors)
+        except (OSError, ValueError, subprocess.SubprocessError):
+            return None
+        finally:
+            if argfile:
+                try:
+                    os.remove(argfile)
+                except OSError:
+                    pass
+
     def execute_batch_processing(self, image_files, field_vars, window):
         """Execute batch metadata processing."""
         # Get values from fields
@@ -4022,44 +4545,50 @@ SUPPORT
             messagebox.showwarning("Warning", "Please enter at least one metadata field")
             return
             
-        # Process images
-        processed = 0
-        errors = 0
+        window.destroy()
         
-        for img_file in image_files:
-            try:
-                # Load image
-                image = Image.open(img_file)
-                exif_dict = image.getexif()
-                
-                # Add batch metadata
-                tag_mapping = {
-                    'Title': 270,
-                    'Description': 270,
-                    'Keywords': 272,
-                    'Author': 315,
-                    'Copyright': 33432,
-                }
-                
-                for field, value in batch_metadata.items():
-                    tag_id = tag_mapping.get(field)
-                    if tag_id:
-                        exif_dict[tag_id] = value
+        # The writes run on a worker thread so the mainloop keeps pumping;
+        # only the final report hops back via root.after
+        def run_batch():
+            failures = []
+            
+            # Prefer a single in-place ExifTool run; fall back to the PIL
+            # process pool (which re-encodes) when ExifTool is unavailable
+            exiftool_result = self._try_exiftool_batch_metadata(image_files, batch_metadata)
+            if exiftool_result is not None:
+                processed, errors = exiftool_result
+            else:
+                processed = 0
+                errors = 0
                 
-                # Save image
-                image.save(img_file, exif=exif_dict)
-                processed += 1
+                # Resolve field names to tag IDs once, not per file per field
+                encoded_tags = [(_BATCH_TAG_MAPPING[field], value)
+                                for field, value in batch_metadata.items()
+                                if field in _BATCH_TAG_MAPPING]
+                items = [(str(img_file), encoded_tags) for img_file in image_files]
+                with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+                    results = list(pool.map(_apply_batch_metadata, items, chunksize=8))
                 
-            except Exception as e:
-                errors += 1
-                self.log_message(f"❌ Error processing {img_file.name}: {str(e)}")
+                for path, ok, error in results:
+                    if ok:
+                        processed += 1
+                    else:
+                        errors += 1
+                        failures.append(f"❌ Error processing {Path(path).name}: {error}")
+            
+            self.root.after(0, self._on_batch_processing_done, processed, errors, failures)
+        
+        threading.Thread(target=run_batch, daemon=True).start()
+        
+    def _on_batch_processing_done(self, processed, errors, failures):
+        """Report batch metadata results back on the Tk thread."""
+        # One insert and one scroll for the whole failure list
+        self.log_messages(failures)
         
         # Show results
         messagebox.showinfo("Batch Processing Complete", 
                            f"Processed: {processed} images\nErrors: {errors} images")
         
-        window.destroy()
-        
     def show_batch_summary(self):
         """Show summary of batch processing."""
         if not self.batch_folder:
@@ -4138,6 +4667,8 @@ SUPPORT
                                    textvariable=self.chat_token_limit_var,
                                    command=self.update_chat_token_limit)
         token_spinbox.pack(side=tk.LEFT, padx=(0, 20))
+        # Arrow clicks commit via command=; Return commits typed values
+        token_spinbox.bind('<Return>', lambda e: self.update_chat_token_limit())
         
         ttk.Label(params_frame, text="Temperature:").pack(side=tk.LEFT, padx=(0, 5))
         self.chat_temperature_var = tk.StringVar(value=str(self.tool_use_temperature))
@@ -4145,6 +4676,7 @@ SUPPORT
                                   textvariable=self.chat_temperature_var,
                                   command=self.update_chat_temperature)
         temp_spinbox.pack(side=tk.LEFT, padx=(0, 20))
+        temp_spinbox.bind('<Return>', lambda e: self.update_chat_temperature())
         
         # Update model info display
         self.update_chat_model_display()
@@ -4210,6 +4742,12 @@ SUPPORT
                                                      font=('Consolas', 10))
         self.chat_display.pack(fill=tk.BOTH, expand=True)
         
+        # Configure message tags once at build time, not per message
+        self.chat_display.tag_configure("timestamp", foreground="gray")
+        self.chat_display.tag_configure("user", foreground="blue", font=('Arial', 10, 'bold'))
+        self.chat_display.tag_configure("ai", foreground="green", font=('Arial', 10, 'bold'))
+        self.chat_display.tag_configure("system", foreground="purple", font=('Arial', 10, 'bold'))
+        
         # Input area
         input_frame = ttk.LabelFrame(chat_container, text="✍️ Send Message", padding="10")
         input_frame.pack(fill=tk.X, pady=(0, 10))
@@ -4259,8 +4797,11 @@ SUPPORT
         ttk.Button(quick_buttons, text="📐 Analyze Composition", 
                   command=self.quick_analyze_composition).pack(side=tk.LEFT)
         
-        # Initialize chat
+        # Initialize chat - role-indexed deques give O(1) access to the
+        # latest AI/SEO message instead of scanning the whole history
         self.chat_messages = []
+        self._ai_messages = collections.deque()
+        self._seo_messages = collections.deque()
         self.add_chat_message("system", "AI Chat initialized. Select an image and start chatting!")
     
     def update_chat_model_display(self):
@@ -4295,6 +4836,8 @@ SUPPORT
         """Update token limit from AI Chat tab."""
         try:
             new_limit = int(self.chat_token_limit_var.get())
+            if new_limit == self.tool_use_max_tokens:
+                return  # Unchanged - skip the log/chat round trips
             if 1000 <= new_limit <= 8000:
                 self.tool_use_max_tokens = new_limit
                 self.log_message(f"🔧 Token limit updated to {new_limit}")
@@ -4310,6 +4853,8 @@ SUPPORT
         """Update temperature from AI Chat tab."""
         try:
             new_temp = float(self.chat_temperature_var.get())
+            if new_temp == self.tool_use_temperature:
+                return  # Unchanged - skip the log/chat round trips
             if 0.1 <= new_temp <= 1.0:
                 self.tool_use_temperature = new_temp
                 self.log_message(f"🌡️ Temperature updated to {new_temp}")
@@ -4324,12 +4869,8 @@ SUPPORT
     def filter_thinking_output(self, message):
         """Filter out thinking tags if thinking is disabled."""
         if self.disable_thinking and "<think>" in message:
-            # Remove thinking tags and content
-            import re
-            # Remove <think>...</think> blocks
-            filtered = re.sub(r'<think>.*?</think>', '', message, flags=re.DOTALL)
-            # Clean up extra whitespace
-            filtered = re.sub(r'\n\s*\n', '\n', filtered).strip()
+            # Remove thinking blocks, then collapse the leftover blank lines
+            filtered = _BLANKS_RE.sub('\n', _THINK_RE.sub('', message)).strip()
             return filtered if filtered else message
         return message
     
@@ -4355,22 +4896,23 @@ SUPPORT
         # Add message
         self.chat_display.insert(tk.END, f"{display_message}\n\n")
         
-        # Configure tags for styling
-        self.chat_display.tag_configure("timestamp", foreground="gray")
-        self.chat_display.tag_configure("user", foreground="blue", font=('Arial', 10, 'bold'))
-        self.chat_display.tag_configure("ai", foreground="green", font=('Arial', 10, 'bold'))
-        self.chat_display.tag_configure("system", foreground="purple", font=('Arial', 10, 'bold'))
-        
-        # Scroll to bottom
-        self.chat_display.see(tk.END)
+        # Scroll to bottom - unless the user has scrolled up to read history
+        if self.chat_display.yview()[1] > 0.95:
+            self.chat_display.see(tk.END)
         self.chat_display.config(state=tk.DISABLED)
         
-        # Store message
-        self.chat_messages.append({
+        # Store message; AI messages are also indexed by role so the
+        # apply-to-metadata buttons don't rescan the whole history
+        entry = {
             'sender': sender,
             'message': message,
             'timestamp': timestamp
-        })
+        }
+        self.chat_messages.append(entry)
+        if sender == 'ai':
+            self._ai_messages.append(entry)
+            if _SEO_RE.search(message):
+                self._seo_messages.append(entry)
     
     def send_chat_message(self):
         """Send a text-only message to the AI."""
@@ -4389,18 +4931,22 @@ SUPPORT
         self.chat_input.delete("1.0", tk.END)
         
         # Send to AI
-        threading.Thread(target=self._process_chat_message, args=(message,), daemon=True).start()
+        self._chat_executor.submit(self._process_chat_message, message)
     
-    def send_chat_with_image(self):
-        """Send a message with the current image to the AI."""
+    def send_chat_with_image(self, quick=False):
+        """Send a message with the current image to the AI.
+
+        quick=True marks a canned visual-only quick action, which skips
+        the product-metadata preamble to cut vision prefill tokens.
+        """
         # Check for image in chat tab first, then metadata tab
         image_path = None
-        if hasattr(self, 'chat_current_image') and self.chat_current_image:
+        if self.chat_current_image:
             image_path = self.chat_current_image
         elif self.metadata_image_path.get():
             image_path = self.metadata_image_path.get()
         
-        if not image_path or not os.path.exists(image_path):
+        if not image_path or self._stat_or_none(image_path) is None:
             self.add_chat_message("system", "❌ No image selected. Please select an image first using 'Select Image' or 'Use from Metadata Tab'.")
             return
         
@@ -4419,7 +4965,7 @@ SUPPORT
         self.chat_input.delete("1.0", tk.END)
         
         # Send to AI with image
-        threading.Thread(target=self._process_chat_with_image, args=(message, image_path), daemon=True).start()
+        self._chat_executor.submit(self._process_chat_with_image, message, image_path, quick)
     
     def _process_chat_message(self, message):
         """Process a text-only chat message."""
@@ -4439,6 +4985,12 @@ SUPPORT
     
     def parse_filename_data(self, filename):
         """Parse filename to extract relevant metadata context."""
+        # Navigation re-parses the same names constantly; callers only
+        # read the result, so one shared dict per filename is safe
+        cached = self._filename_parse_cache.get(filename)
+        if cached is not None:
+            return cached
+        
         try:
             # Remove extension
             name_without_ext = Path(filename).stem
@@ -4466,49 +5018,138 @@ SUPPORT
                 parsed_data['category'] = parts[4]  # Granite
                 parsed_data['number'] = parts[5] if len(parts) > 5 else ''  # room_images_000
             
+            self._filename_parse_cache[filename] = parsed_data
             return parsed_data
             
         except Exception as e:
             print(f"Error parsing filename: {e}")
             return {'filename': filename, 'code': '', 'type': '', 'color': '', 'name': '', 'category': '', 'number': ''}
     
-    def _process_chat_with_image(self, message, image_path):
+    def _encode_image_data_url(self, image_path, max_edge=None):
+        """Build the data: URL for an image without an intermediate bytes copy.
+
+        Mapping the file lets b64encode read straight from the page cache,
+        so peak memory is just the encoded string instead of raw + encoded.
+        The MIME type reflects what is actually sent - the original format
+        for pass-through files, JPEG once the downscaler re-encoded.
+        max_edge overrides the default downscale cap for prompts that can
+        work from a small thumbnail. Results are cached per (path, mtime,
+        size, edge) - quick-action buttons and retries hit the same image
+        repeatedly - LRU capped like the preview photo cache.
+        """
+        st = os.stat(image_path)
+        cache_key = (image_path, st.st_mtime_ns, st.st_size, max_edge)
+        cached = self._b64_cache.get(cache_key)
+        if cached is not None:
+            self._b64_cache.move_to_end(cache_key)
+            return cached
+        
+        prepared = self._prepare_vision_bytes(image_path, max_edge)
+        if prepared is not None:
+            mime = 'image/jpeg'
+            encoded = base64.b64encode(prepared).decode('ascii')
+        else:
+            ext = os.path.splitext(image_path)[1].lower()
+            mime = _MIME_BY_EXT.get(ext, 'image/jpeg')
+            with open(image_path, 'rb') as image_file:
+                with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    encoded = base64.b64encode(mapped).decode('ascii')
+        
+        data_url = f'data:{mime};base64,{encoded}'
+        self._b64_cache[cache_key] = data_url
+        if len(self._b64_cache) > 32:
+            self._b64_cache.popitem(last=False)
+        return data_url
+
+    def _stat_or_none(self, image_path):
+        """One os.stat standing in for separate exists + getsize calls."""
+        try:
+            return os.stat(image_path)
+        except OSError:
+            return None
+
+    def _prepare_vision_bytes(self, image_path, max_edge=None):
+        """Downscale an oversized image for the vision model, or None to send as-is.
+
+        The model tiles anything above ~1k pixels per edge anyway, so
+        shipping a full-resolution photo just inflates upload and prompt
+        processing time. Images already within the edge cap are left
+        untouched so the mmap fast path keeps handling them.
+        """
+        if max_edge is None:
+            max_edge = self.vision_max_edge
+        try:
+            with Image.open(image_path) as image:
+                if max(image.size) <= max_edge:
+                    return None
+                # JPEG sources can decode at reduced scale in the DCT
+                # domain - draft() is a no-op for other formats
+                image.draft('RGB', (max_edge, max_edge))
+                if image.mode not in ('RGB', 'L'):
+                    image = image.convert('RGB')
+                image.thumbnail((max_edge, max_edge),
+                                Image.Resampling.LANCZOS)
+                buffer = io.BytesIO()
+                image.save(buffer, format='JPEG', quality=85)
+                return buffer.getvalue()
+        except Exception as e:
+            logger.debug("Vision downscale failed for %s: %s", image_path, e)
+            return None
+
+    def _process_chat_with_image(self, message, image_path, quick=False):
         """Process a chat message with image with context and memory."""
         try:
             self.add_chat_message("system", "🤖 AI is analyzing image...")
             
-            # Validate image path
-            if not image_path or not os.path.exists(image_path):
+            # The caller already stat'd the path; a missing file surfaces
+            # from the open below, so no second exists() syscall here
+            if not image_path:
                 self.add_chat_message("system", "❌ No valid image selected")
                 return
             
             # Parse filename for context
-            filename = Path(image_path).name
+            filename = os.path.basename(image_path)
             filename_data = self.parse_filename_data(filename)
             
             # Store filename data for use in parsing
             self.current_filename_data = filename_data
             
-            # Build comprehensive context from filename data and folder
+            # Visual-only quick actions don't use the product metadata or
+            # the structured output format - prefill tokens are the main
+            # cost of local vision inference, so send just the request
+            if quick:
+                context = message
+                image_data = self._encode_image_data_url(image_path)
+                response = self._call_lm_studio_api_with_context(image_data, context)
+                if response:
+                    self.add_chat_message("ai", response)
+                else:
+                    self.add_chat_message("system", "❌ AI did not respond. Please try again.")
+                return
+            
+            # Build comprehensive context from filename data and folder.
+            # Everything but the current position is fixed per folder, so
+            # the block is built once and only the position is formatted in.
             folder_context = ""
             if self.chat_folder_images:
-                folder_name = os.path.basename(self.chat_folder_path_str) if self.chat_folder_path_str else "Unknown"
-                total_images = len(self.chat_folder_images)
-                current_position = self.chat_current_image_index + 1
-                
-                # Get sample filenames from the folder for context
-                sample_files = []
-                for i, img_path in enumerate(self.chat_folder_images[:5]):  # First 5 files
-                    sample_files.append(os.path.basename(img_path))
-                
-                folder_context = f"""
+                if self._folder_context_template is None:
+                    folder_name = os.path.basename(self.chat_folder_path_str) if self.chat_folder_path_str else "Unknown"
+                    total_images = len(self.chat_folder_images)
+                    
+                    # Get sample filenames from the folder for context
+                    sample_files = [os.path.basename(img_path)
+                                    for img_path in self.chat_folder_images[:5]]
+                    
+                    self._folder_context_template = f"""
 FOLDER CONTEXT:
 - Folder Name: {folder_name}
 - Total Images: {total_images}
-- Current Image: {current_position} of {total_images}
+- Current Image: {{current_position}} of {total_images}
 - Sample Files: {', '.join(sample_files)}
 - This is part of a batch of {total_images} images from the same product line
 """
+                folder_context = self._folder_context_template.format(
+                    current_position=self.chat_current_image_index + 1)
 
             context = f"""
 {filename_data['filename']} - IMAGE ANALYSIS REQUEST
@@ -4543,8 +5184,7 @@ Please ensure all 6 fields are provided with the exact format shown above.
 """
             
             # Encode image to base64
-            with open(image_path, "rb") as image_file:
-                image_data = base64.b64encode(image_file.read()).decode('utf-8')
+            image_data = self._encode_image_data_url(image_path)
             
             # Call LM Studio API with image and context
             response = self._call_lm_studio_api_with_context(image_data, context)
@@ -4586,13 +5226,13 @@ Please provide:
     def _call_lm_studio_text_api(self, message):
         """Call LM Studio API for text-only messages with conversation memory."""
         try:
-            print(f"AI Debug (Text) - Tool use enabled: {self.tool_use_enabled}")
-            print(f"AI Debug (Text) - Message: {message}")
+            logger.debug("AI Debug (Text) - Tool use enabled: %s", self.tool_use_enabled)
+            logger.debug("AI Debug (Text) - Message: %s", message)
             # Use tool use if enabled
             if self.tool_use_enabled:
-                print(f"AI Debug (Text) - Tool use enabled, calling tool use API")
+                logger.debug("AI Debug (Text) - Tool use enabled, calling tool use API")
                 result = self._call_tool_use_api_with_tools(message)
-                print(f"AI Debug (Text) - Tool use API result: {result is not None}")
+                logger.debug("AI Debug (Text) - Tool use API result: %s", result is not None)
                 return result
             
             url = f"{self.lm_studio_url.get()}/v1/chat/completions"
@@ -4629,8 +5269,8 @@ Please respond with this context in mind, understanding that you're working thro
                 "content": context_message
             })
             
-            print(f"AI Debug (Text) - Using Model Name: {model_name}")
-            print(f"AI Debug (Text) - Messages count: {len(messages)}")
+            logger.debug("AI Debug (Text) - Using Model Name: %s", model_name)
+            logger.debug("AI Debug (Text) - Messages count: %s", len(messages))
             
             payload = {
                 "model": model_name,
@@ -4644,20 +5284,25 @@ Please respond with this context in mind, understanding that you're working thro
                 "Accept": "application/json"
             }
             
-            print(f"AI Debug (Text) - Sending request to: {url}")
-            print(f"AI Debug (Text) - Headers: {headers}")
-            print(f"AI Debug (Text) - Payload: {json.dumps(payload, indent=2)}")
+            logger.debug("AI Debug (Text) - Sending request to: %s", url)
+            if self._debug:
+                # Pretty-printing copies and indents the whole payload
+                logger.debug("AI Debug (Text) - Payload: %s", json.dumps(payload, indent=2))
             
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
+            response = self._http.post(url, json=payload, headers=headers, timeout=30)
             
-            print(f"AI Debug (Text) - Response status: {response.status_code}")
-            print(f"AI Debug (Text) - Response text: {response.text}")
+            logger.debug("AI Debug (Text) - Response status: %s", response.status_code)
+            if self._debug:
+                # .content avoids decoding the whole body to str just for a dump
+                logger.debug("AI Debug (Text) - Response body: %.512s", response.content)
             
             if response.status_code != 200:
-                print(f"AI Debug (Text) - Error response: {response.text}")
+                logger.debug("AI Debug (Text) - Error response: %.200s", response.text)
                 return None
                 
-            result = response.json()
+            # Parse the raw bytes once - response.text would decode the
+            # whole body to str a second time
+            result = json.loads(response.content)
             return result['choices'][0]['message']['content']
             
         except Exception as e:
@@ -4672,12 +5317,12 @@ Please respond with this context in mind, understanding that you're working thro
             # Use vision model configuration
             model_name = self.vision_model
             
-            print(f"AI Debug (Vision) - Using vision model: {model_name}")
+            logger.debug("AI Debug (Vision) - Using vision model: %s", model_name)
             
-            print(f"AI Debug (Vision) - URL: {url}")
-            print(f"AI Debug (Vision) - Model: {model_name}")
-            print(f"AI Debug (Vision) - Context length: {len(context)}")
-            print(f"AI Debug (Vision) - Image data length: {len(image_data)}")
+            logger.debug("AI Debug (Vision) - URL: %s", url)
+            logger.debug("AI Debug (Vision) - Model: %s", model_name)
+            logger.debug("AI Debug (Vision) - Context length: %s", len(context))
+            logger.debug("AI Debug (Vision) - Image data length: %s", len(image_data))
             
             # Build messages for vision model
             messages = []
@@ -4700,7 +5345,7 @@ Please respond with this context in mind, understanding that you're working thro
                     {
                         "type": "image_url",
                         "image_url": {
-                            "url": f"data:image/jpeg;base64,{image_data}"
+                            "url": image_data
                         }
                     }
                 ]
@@ -4713,39 +5358,64 @@ Please respond with this context in mind, understanding that you're working thro
                 "temperature": self.vision_temperature
             }
             
-            print(f"AI Debug - Payload messages count: {len(messages)}")
-            print(f"AI Debug - Sending request...")
+            logger.debug("AI Debug - Payload messages count: %s", len(messages))
+            logger.debug("AI Debug - Sending request...")
             
-            # Debug: Print the exact payload being sent
-            import json
-            print(f"AI Debug - Full payload: {json.dumps(payload, indent=2)}")
+            if self._debug:
+                # The payload embeds the full base64 image - serializing it
+                # again just for the console is megabytes of wasted work
+                logger.debug("AI Debug - Full payload: %s", json.dumps(payload, indent=2))
             
             headers = {
                 "Content-Type": "application/json",
                 "Accept": "application/json"
             }
             
-            print(f"AI Debug - Headers: {headers}")
-            
-            response = requests.post(url, json=payload, headers=headers, timeout=60)
+            logger.debug("AI Debug - Headers: %s", headers)
+            
+            # Serialize once ourselves - compact separators, no ASCII
+            # escaping pass, and retries reuse the same bytes instead of
+            # re-dumping a megabytes-large payload
+            body = json.dumps(payload, separators=(',', ':'),
+                              ensure_ascii=False).encode('utf-8')
+            
+            # Transient failures (server busy, model loading) get up to two
+            # same-modality retries with backoff - cheaper than dropping to
+            # the text-only fallback and losing the image entirely
+            for attempt in range(3):
+                if attempt:
+                    time.sleep(0.2 * 2 ** attempt)
+                    logger.debug("AI Debug - Retrying vision request (attempt %s)...", attempt + 1)
+                try:
+                    response = self._http.post(url, data=body, headers=headers, timeout=60)
+                except (requests.exceptions.Timeout,
+                        requests.exceptions.ConnectionError) as e:
+                    if attempt == 2:
+                        raise
+                    logger.debug("AI Debug - Transient connection error: %s", e)
+                    continue
+                if response.status_code not in (408, 429, 503) or attempt == 2:
+                    break
+                logger.debug("AI Debug - Retryable status %s", response.status_code)
             
-            print(f"AI Debug - Response status: {response.status_code}")
-            print(f"AI Debug - Response headers: {dict(response.headers)}")
+            logger.debug("AI Debug - Response status: %s", response.status_code)
+            logger.debug("AI Debug - Response headers: %s", dict(response.headers))
             
             if response.status_code != 200:
-                print(f"AI Debug - Error response: {response.text}")
-                self.add_chat_message("system", f"❌ API Error {response.status_code}: {response.text}")
+                logger.debug("AI Debug - Error response: %.200s", response.text)
+                self.add_chat_message("system", f"❌ API Error {response.status_code}: {response.text[:200]}")
                 return None
             
-            result = response.json()
-            print(f"AI Debug - Response result: {result}")
+            result = json.loads(response.content)
+            if self._debug:
+                logger.debug("AI Debug - Response result: %s", result)
             
             if 'choices' in result and len(result['choices']) > 0:
                 content = result['choices'][0]['message']['content']
-                print(f"AI Debug - Extracted content: {content[:100]}...")
+                logger.debug("AI Debug - Extracted content: %.100s...", content)
                 return content
             else:
-                print(f"AI Debug - No choices in response: {result}")
+                logger.debug("AI Debug - No choices in response: %s", result)
                 return None
             
         except Exception as e:
@@ -4759,6 +5429,9 @@ Please respond with this context in mind, understanding that you're working thro
         self.chat_display.delete("1.0", tk.END)
         self.chat_display.config(state=tk.DISABLED)
         self.chat_messages = []
+        self._ai_messages.clear()
+        self._seo_messages.clear()
+        self._ai_parse_cache.clear()
         self.add_chat_message("system", "Chat cleared. Ready for new conversation!")
     
     def save_chat(self):
@@ -4774,41 +5447,54 @@ Please respond with this context in mind, understanding that you're working thro
         )
         
         if filename:
-            try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    for msg in self.chat_messages:
-                        f.write(f"[{msg['timestamp']}] {msg['sender'].title()}: {msg['message']}\n\n")
-                self.add_chat_message("system", f"💾 Chat saved to {filename}")
-            except Exception as e:
-                self.add_chat_message("system", f"❌ Error saving chat: {str(e)}")
+            # Format everything first, then hand the buffered writer one
+            # batch - no per-message write call or .title() lookup
+            lines = [f"[{msg['timestamp']}] "
+                     f"{_SENDER_TITLES.get(msg['sender'], msg['sender'].title())}: "
+                     f"{msg['message']}\n\n"
+                     for msg in self.chat_messages]
+            
+            def write_chat():
+                # Disk write happens off the Tk loop - a slow network drive
+                # shouldn't freeze the UI
+                try:
+                    with open(filename, 'w', encoding='utf-8') as f:
+                        f.writelines(lines)
+                    self.root.after(0, self.add_chat_message, "system",
+                                    f"💾 Chat saved to {filename}")
+                except Exception as e:
+                    self.root.after(0, self.add_chat_message, "system",
+                                    f"❌ Error saving chat: {str(e)}")
+            
+            threading.Thread(target=write_chat, daemon=True).start()
     
     def quick_analyze_image(self):
         """Quick action: Analyze current image."""
         # Check for image in chat tab first, then metadata tab
         image_path = None
-        if hasattr(self, 'chat_current_image') and self.chat_current_image:
+        if self.chat_current_image:
             image_path = self.chat_current_image
         elif self.metadata_image_path.get():
             image_path = self.metadata_image_path.get()
         
-        if not image_path or not os.path.exists(image_path):
+        if not image_path or self._stat_or_none(image_path) is None:
             self.add_chat_message("system", "❌ No image selected. Please select an image first.")
             return
         
         self.chat_input.delete("1.0", tk.END)
         self.chat_input.insert("1.0", "Please analyze this image in detail, describing what you see, the composition, colors, and any interesting features.")
-        self.send_chat_with_image()
+        self.send_chat_with_image(quick=True)
     
     def quick_generate_seo(self):
         """Quick action: Generate SEO data."""
         # Check for image in chat tab first, then metadata tab
         image_path = None
-        if hasattr(self, 'chat_current_image') and self.chat_current_image:
+        if self.chat_current_image:
             image_path = self.chat_current_image
         elif self.metadata_image_path.get():
             image_path = self.metadata_image_path.get()
         
-        if not image_path or not os.path.exists(image_path):
+        if not image_path or self._stat_or_none(image_path) is None:
             self.add_chat_message("system", "❌ No image selected. Please select an image first.")
             return
         
@@ -4820,35 +5506,35 @@ Please respond with this context in mind, understanding that you're working thro
         """Quick action: Describe colors."""
         # Check for image in chat tab first, then metadata tab
         image_path = None
-        if hasattr(self, 'chat_current_image') and self.chat_current_image:
+        if self.chat_current_image:
             image_path = self.chat_current_image
         elif self.metadata_image_path.get():
             image_path = self.metadata_image_path.get()
         
-        if not image_path or not os.path.exists(image_path):
+        if not image_path or self._stat_or_none(image_path) is None:
             self.add_chat_message("system", "❌ No image selected. Please select an image first.")
             return
         
         self.chat_input.delete("1.0", tk.END)
         self.chat_input.insert("1.0", "Describe the color palette of this image in detail, including dominant colors, accent colors, and the overall color scheme.")
-        self.send_chat_with_image()
+        self.send_chat_with_image(quick=True)
     
     def quick_analyze_composition(self):
         """Quick action: Analyze composition."""
         # Check for image in chat tab first, then metadata tab
         image_path = None
-        if hasattr(self, 'chat_current_image') and self.chat_current_image:
+        if self.chat_current_image:
             image_path = self.chat_current_image
         elif self.metadata_image_path.get():
             image_path = self.metadata_image_path.get()
         
-        if not image_path or not os.path.exists(image_path):
+        if not image_path or self._stat_or_none(image_path) is None:
             self.add_chat_message("system", "❌ No image selected. Please select an image first.")
             return
         
         self.chat_input.delete("1.0", tk.END)
         self.chat_input.insert("1.0", "Analyze the composition of this image, including the rule of thirds, focal points, balance, and overall visual structure.")
-        self.send_chat_with_image()
+        self.send_chat_with_image(quick=True)
     
     def select_chat_image(self):
         """Select an image for the chat tab."""
@@ -4868,7 +5554,7 @@ Please respond with this context in mind, understanding that you're working thro
         # Get the actual path value from StringVar
         image_path = self.metadata_image_path.get()
         
-        if image_path and os.path.exists(image_path):
+        if image_path and self._stat_or_none(image_path) is not None:
             self.load_chat_image(image_path)
             self.add_chat_message("system", f"📸 Using image from Metadata tab: {os.path.basename(image_path)}")
         else:
@@ -4883,31 +5569,43 @@ Please respond with this context in mind, understanding that you're working thro
             # Update path label
             self.chat_image_path.config(text=os.path.basename(image_path), foreground="black")
             
-            # Load and display image
-            image = Image.open(image_path)
-            
             # Resize image to fit canvas
             canvas_width = 200
             canvas_height = 150
             
-            # Calculate aspect ratio
-            img_width, img_height = image.size
-            aspect_ratio = img_width / img_height
-            
-            if aspect_ratio > canvas_width / canvas_height:
-                # Image is wider
-                new_width = canvas_width
-                new_height = int(canvas_width / aspect_ratio)
+            # The folder scan usually cached the stat, otherwise one
+            # os.stat covers existence, size and the thumbnail cache key
+            file_stat = self._folder_stat_cache.get(image_path) or self._stat_or_none(image_path)
+            file_size = file_stat.st_size if file_stat else 0
+            
+            # Decoding and resizing a large photo costs tens of ms of C
+            # work - reuse the thumbnail when the same file is reloaded
+            thumb_key = (image_path,
+                         file_stat.st_mtime_ns if file_stat else 0,
+                         (canvas_width, canvas_height))
+            cached = self._thumb_cache.get(thumb_key)
+            if cached is not None:
+                self._thumb_cache.move_to_end(thumb_key)
+                photo, img_width, img_height, new_width, new_height = cached
             else:
-                # Image is taller
-                new_height = canvas_height
-                new_width = int(canvas_height * aspect_ratio)
-            
-            # Resize image
-            image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            
-            # Convert to PhotoImage
-            photo = ImageTk.PhotoImage(image)
+                # Load and display image
+                image = Image.open(image_path)
+                img_width, img_height = image.size
+                
+                # At 200x150 bilinear is visually identical to LANCZOS and much
+                # cheaper; reducing_gap lets Pillow box-reduce most of the way
+                # first. thumbnail() also keeps the aspect math in C.
+                image.thumbnail((canvas_width, canvas_height),
+                                Image.Resampling.BILINEAR, reducing_gap=2.0)
+                new_width, new_height = image.size
+                
+                # Convert to PhotoImage
+                photo = ImageTk.PhotoImage(image)
+                
+                self._thumb_cache[thumb_key] = (photo, img_width, img_height,
+                                                new_width, new_height)
+                if len(self._thumb_cache) > 16:
+                    self._thumb_cache.popitem(last=False)
             
             # Clear canvas and display image
             self.chat_image_canvas.delete("all")
@@ -4917,9 +5615,6 @@ Please respond with this context in mind, understanding that you're working thro
             
             # Keep reference to prevent garbage collection
             self.chat_image_canvas.image = photo
-            
-            # Update image info
-            file_size = os.path.getsize(image_path)
             size_mb = file_size / (1024 * 1024)
             info_text = f"📏 {img_width}x{img_height}\n💾 {size_mb:.2f} MB\n📁 {os.path.basename(image_path)}"
             self.chat_image_info.config(text=info_text, foreground="black")
@@ -4931,21 +5626,56 @@ Please respond with this context in mind, understanding that you're working thro
             self.chat_image_path.config(text="Error loading image", foreground="red")
             self.chat_image_info.config(text="Failed to load image", foreground="red")
     
+    def _prefetch_chat_thumbs(self):
+        """Predecode the next few folder thumbnails on background workers."""
+        if not self.chat_folder_images:
+            return
+        start = self.chat_current_image_index + 1
+        for image_path in self.chat_folder_images[start:start + 4]:
+            self._prefetch_pool.submit(self._decode_thumb, image_path)
+    
+    def _decode_thumb(self, image_path):
+        """Decode and resize one thumbnail off-thread, store via the Tk thread."""
+        try:
+            file_stat = self._folder_stat_cache.get(image_path) or self._stat_or_none(image_path)
+            thumb_key = (image_path,
+                         file_stat.st_mtime_ns if file_stat else 0,
+                         (200, 150))
+            if thumb_key in self._thumb_cache:
+                return
+            
+            image = Image.open(image_path)
+            img_width, img_height = image.size
+            image.thumbnail((200, 150), Image.Resampling.BILINEAR, reducing_gap=2.0)
+            # PhotoImage creation must happen on the Tk thread
+            self.root.after(0, self._store_thumb, thumb_key, image,
+                            img_width, img_height)
+        except Exception as e:
+            logger.debug("Thumbnail prefetch failed for %s: %s", image_path, e)
+    
+    def _store_thumb(self, thumb_key, image, img_width, img_height):
+        """Insert a prefetched thumbnail into the cache (Tk thread)."""
+        if thumb_key in self._thumb_cache:
+            return
+        new_width, new_height = image.size
+        photo = ImageTk.PhotoImage(image)
+        self._thumb_cache[thumb_key] = (photo, img_width, img_height,
+                                        new_width, new_height)
+        if len(self._thumb_cache) > 16:
+            self._thumb_cache.popitem(last=False)
+    
     def apply_ai_description_to_metadata(self):
         """Apply the most recent AI description to metadata fields."""
         if not self.chat_messages:
             self.add_chat_message("system", "❌ No chat messages to process")
             return
         
-        # Find the most recent AI message with detailed description
-        ai_messages = [msg for msg in reversed(self.chat_messages) if msg['sender'] == 'ai']
-        
-        if not ai_messages:
+        if not self._ai_messages:
             self.add_chat_message("system", "❌ No AI responses found")
             return
         
-        # Get the most recent AI response
-        latest_ai_response = ai_messages[0]['message']
+        # Get the most recent AI response from the role index
+        latest_ai_response = self._ai_messages[-1]['message']
         
         # Extract key information from the AI response
         metadata_dict = self._parse_ai_response_for_metadata(latest_ai_response)
@@ -4964,19 +5694,13 @@ Please respond with this context in mind, understanding that you're working thro
             self.add_chat_message("system", "❌ No chat messages to process")
             return
         
-        # Find AI messages that contain SEO recommendations
-        seo_messages = []
-        for msg in reversed(self.chat_messages):
-            if msg['sender'] == 'ai' and any(keyword in msg['message'].lower() for keyword in 
-                ['seo', 'meta', 'title', 'description', 'alt text', 'keywords', 'structured data']):
-                seo_messages.append(msg)
-        
-        if not seo_messages:
+        if not self._seo_messages:
             self.add_chat_message("system", "❌ No SEO-related AI responses found")
             return
         
-        # Parse the most recent SEO response
-        seo_response = seo_messages[0]['message']
+        # Parse the most recent SEO response - the SEO check already ran
+        # once when the message arrived
+        seo_response = self._seo_messages[-1]['message']
         metadata_dict = self._parse_seo_response_for_metadata(seo_response)
         
         # Apply to metadata fields
@@ -4993,9 +5717,8 @@ Please respond with this context in mind, understanding that you're working thro
             self.add_chat_message("system", "❌ No chat messages to process")
             return
         
-        # Combine all AI responses
-        all_ai_responses = [msg['message'] for msg in self.chat_messages if msg['sender'] == 'ai']
-        combined_response = "\n\n".join(all_ai_responses)
+        # Combine all AI responses from the role index
+        combined_response = "\n\n".join(msg['message'] for msg in self._ai_messages)
         
         # Parse for metadata
         metadata_dict = self._parse_ai_response_for_metadata(combined_response)
@@ -5012,185 +5735,103 @@ Please respond with this context in mind, understanding that you're working thro
         
         self.add_chat_message("system", "✅ All AI data applied to metadata fields. Check the Metadata tab.")
     
-    def _parse_ai_response_for_metadata(self, ai_response):
-        """Parse AI response to extract metadata fields."""
+    def _parse_ai_response_fields(self, ai_response):
+        """Extract metadata fields from AI text (pure - results are memoized)."""
+        cached = self._ai_parse_cache.get(ai_response)
+        if cached is not None:
+            self._ai_parse_cache.move_to_end(ai_response)
+            return cached
+        
         metadata = {}
         
-        self.add_chat_message("system", f"🔍 Parsing AI response for metadata...")
+        # Extract description - one pass tracking the longest qualifying
+        # line, no candidate list and no second max() scan
+        best_line = ''
+        for line in ai_response.split('\n'):
+            line = line.strip()
+            if (len(line) > 20 and len(line) > len(best_line)
+                    and not line.startswith(('**', '###', '```'))):
+                best_line = line
         
-        # Extract description (look for detailed descriptions)
-        lines = ai_response.split('\n')
-        description_parts = []
+        if best_line:
+            metadata['Description'] = best_line
         
-        for line in lines:
-            line = line.strip()
-            if line and not line.startswith('**') and not line.startswith('###') and not line.startswith('```'):
-                # Skip very short lines and headers
-                if len(line) > 20:
-                    description_parts.append(line)
-        
-        if description_parts:
-            # Take the longest description part
-            metadata['Description'] = max(description_parts, key=len)
-            self.add_chat_message("system", f"📝 Found description: {metadata['Description'][:50]}...")
-        
-        # Extract keywords from the response
-        keywords = []
-        keyword_indicators = ['kitchen', 'worktop', 'countertop', 'cabinet', 'modern', 'design', 'concrete', 'wood', 'granite', 'braganza']
-        for indicator in keyword_indicators:
-            if indicator.lower() in ai_response.lower():
-                keywords.append(indicator)
+        # Extract keywords via token-set intersection - one split pass
+        # regardless of how long the indicator list grows; trailing-s
+        # stripping keeps plural mentions matching
+        tokens = set(_TOKEN_SPLIT_RE.split(ai_response.lower()))
+        tokens.update(t[:-1] for t in tuple(tokens) if t.endswith('s'))
+        found = _KEYWORD_SET & tokens
+        keywords = [kw for kw in _KEYWORD_INDICATORS if kw in found]
         
         if keywords:
             metadata['Keywords'] = ', '.join(keywords)
-            self.add_chat_message("system", f"🏷️ Found keywords: {metadata['Keywords']}")
-        
-        # Extract title suggestions
-        import re
-        
-        # Look for structured format first (Title: value)
-        title_match = re.search(r'title\s*:\s*(.+?)(?:\n|$)', ai_response, re.IGNORECASE | re.MULTILINE)
-        if title_match:
-            metadata['Title'] = title_match.group(1).strip()
-            self.add_chat_message("system", f"📋 Found title: {metadata['Title']}")
-        elif 'title' in ai_response.lower() or 'name' in ai_response.lower():
-            # Fallback to other patterns
-            title_patterns = [
-                r'title["\']?\s*[:=]\s*["\']([^"\']+)["\']',
-                r'<title>([^<]+)</title>',
-                r'name["\']?\s*[:=]\s*["\']([^"\']+)["\']'
-            ]
-            
-            for pattern in title_patterns:
-                match = re.search(pattern, ai_response, re.IGNORECASE)
-                if match:
-                    metadata['Title'] = match.group(1).strip()
-                    self.add_chat_message("system", f"📋 Found title: {metadata['Title']}")
-                    break
-        
-        # Extract Artist, Make, Model from AI response using structured format
-        # Look for Artist field
-        artist_match = re.search(r'artist\s*:\s*(.+?)(?:\n|$)', ai_response, re.IGNORECASE | re.MULTILINE)
-        if artist_match:
-            metadata['Artist'] = artist_match.group(1).strip()
-            self.add_chat_message("system", f"👤 Found artist: {metadata['Artist']}")
-        else:
-            # Fallback patterns
-            artist_patterns = [
-                r'artist["\']?\s*[:=]\s*["\']([^"\']+)["\']',
-                r'company["\']?\s*[:=]\s*["\']([^"\']+)["\']',
-                r'brand["\']?\s*[:=]\s*["\']([^"\']+)["\']'
-            ]
-            for pattern in artist_patterns:
-                match = re.search(pattern, ai_response, re.IGNORECASE)
-                if match:
-                    metadata['Artist'] = match.group(1).strip()
-                    self.add_chat_message("system", f"👤 Found artist: {metadata['Artist']}")
-                    break
-        
-        # Look for Make field
-        make_match = re.search(r'make\s*:\s*(.+?)(?:\n|$)', ai_response, re.IGNORECASE | re.MULTILINE)
-        if make_match:
-            metadata['Make'] = make_match.group(1).strip()
-            self.add_chat_message("system", f"🏭 Found make: {metadata['Make']}")
-        else:
-            # Fallback patterns
-            make_patterns = [
-                r'make["\']?\s*[:=]\s*["\']([^"\']+)["\']',
-                r'product code["\']?\s*[:=]\s*["\']([^"\']+)["\']',
-                r'code["\']?\s*[:=]\s*["\']([^"\']+)["\']'
-            ]
-            for pattern in make_patterns:
-                match = re.search(pattern, ai_response, re.IGNORECASE)
-                if match:
-                    metadata['Make'] = match.group(1).strip()
-                    self.add_chat_message("system", f"🏭 Found make: {metadata['Make']}")
-                    break
         
-        # Look for Model field
-        model_match = re.search(r'model\s*:\s*(.+?)(?:\n|$)', ai_response, re.IGNORECASE | re.MULTILINE)
-        if model_match:
-            metadata['Model'] = model_match.group(1).strip()
-            self.add_chat_message("system", f"📦 Found model: {metadata['Model']}")
-        else:
-            # Fallback patterns
-            model_patterns = [
-                r'model["\']?\s*[:=]\s*["\']([^"\']+)["\']',
-                r'type["\']?\s*[:=]\s*["\']([^"\']+)["\']',
-                r'product type["\']?\s*[:=]\s*["\']([^"\']+)["\']'
-            ]
-            for pattern in model_patterns:
-                match = re.search(pattern, ai_response, re.IGNORECASE)
-                if match:
-                    metadata['Model'] = match.group(1).strip()
-                    self.add_chat_message("system", f"📦 Found model: {metadata['Model']}")
-                    break
+        # Extract structured fields with the precompiled patterns; each
+        # falls back to its looser quoted forms when the plain form misses
+        for field, pattern in _AI_FIELD_RES.items():
+            match = pattern.search(ai_response)
+            if not match:
+                if field == 'Title' and not ('title' in ai_response.lower() or 'name' in ai_response.lower()):
+                    continue
+                for fallback in _AI_FALLBACK_RES[field]:
+                    match = fallback.search(ai_response)
+                    if match:
+                        break
+            if match:
+                metadata[field] = match.group(1).strip()
         
         # If we didn't find structured data, try to extract from context
         if not metadata.get('Artist'):
             if 'egger' in ai_response.lower():
                 metadata['Artist'] = '[Your Company Name]'
-                self.add_chat_message("system", f"👤 Set artist to [Your Company Name] from context")
+        
+        self._ai_parse_cache[ai_response] = metadata
+        if len(self._ai_parse_cache) > 128:
+            self._ai_parse_cache.popitem(last=False)
+        return metadata
+    
+    def _parse_ai_response_for_metadata(self, ai_response):
+        """Parse AI response to extract metadata fields."""
+        # Text-only extraction is memoized - repeat apply clicks on the
+        # same response skip the multi-regex scan entirely
+        metadata = dict(self._parse_ai_response_fields(ai_response))
         
         if not metadata.get('Make') and not metadata.get('Model'):
             # Try to extract from filename context if available
-            if hasattr(self, 'current_filename_data'):
+            if self.current_filename_data:
                 filename_data = self.current_filename_data
                 if filename_data.get('code'):
                     metadata['Make'] = filename_data['code']
-                    self.add_chat_message("system", f"🏭 Set make to {metadata['Make']} from filename")
                 if filename_data.get('type'):
                     metadata['Model'] = filename_data['type']
-                    self.add_chat_message("system", f"📦 Set model to {metadata['Model']} from filename")
         
         self.add_chat_message("system", f"📊 Parsed metadata: {list(metadata.keys())}")
         return metadata
     
     def _parse_seo_response_for_metadata(self, seo_response):
-        """Parse SEO-specific response for metadata."""
+        """Parse SEO-specific response for metadata in one regex sweep."""
         metadata = {}
         
-        # Extract title from meta tags or structured data
-        import re
-        
-        # Look for title in meta tags
-        title_match = re.search(r'<meta[^>]*name=["\']title["\'][^>]*content=["\']([^"\']+)["\']', seo_response, re.IGNORECASE)
-        if not title_match:
-            title_match = re.search(r'title["\']?\s*[:=]\s*["\']([^"\']+)["\']', seo_response, re.IGNORECASE)
-        
-        if title_match:
-            metadata['Title'] = title_match.group(1).strip()
-        
-        # Extract description
-        desc_match = re.search(r'<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']+)["\']', seo_response, re.IGNORECASE)
-        if not desc_match:
-            desc_match = re.search(r'description["\']?\s*[:=]\s*["\']([^"\']+)["\']', seo_response, re.IGNORECASE)
-        
-        if desc_match:
-            metadata['Description'] = desc_match.group(1).strip()
-        
-        # Extract alt text
-        alt_match = re.search(r'alt=["\']([^"\']+)["\']', seo_response, re.IGNORECASE)
-        if alt_match:
-            metadata['AltText'] = alt_match.group(1).strip()
-        
-        # Extract keywords
-        keywords_match = re.search(r'keywords["\']?\s*[:=]\s*["\']([^"\']+)["\']', seo_response, re.IGNORECASE)
-        if keywords_match:
-            metadata['Keywords'] = keywords_match.group(1).strip()
-        
-        # Extract from structured data (JSON-LD)
-        json_ld_match = re.search(r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', seo_response, re.DOTALL | re.IGNORECASE)
-        if json_ld_match:
-            try:
-                import json
-                json_data = json.loads(json_ld_match.group(1))
-                if 'name' in json_data:
-                    metadata['Title'] = json_data['name']
-                if 'description' in json_data:
-                    metadata['Description'] = json_data['description']
-            except:
-                pass
+        # One O(N) finditer walk replaces six separate full-text searches;
+        # first occurrence of each field in the text wins
+        for match in _SEO_UNIFIED_RE.finditer(seo_response):
+            field = _SEO_GROUP_FIELDS[match.lastgroup]
+            metadata.setdefault(field, match.group(match.lastgroup + '_v').strip())
+        
+        # Structured data (JSON-LD) overrides the loose matches; substring
+        # gate keeps the DOTALL search off plain-text responses
+        if '<script' in seo_response:
+            json_ld_match = _JSON_LD_RE.search(seo_response)
+            if json_ld_match:
+                try:
+                    json_data = json.loads(json_ld_match.group(1))
+                    if 'name' in json_data:
+                        metadata['Title'] = json_data['name']
+                    if 'description' in json_data:
+                        metadata['Description'] = json_data['description']
+                except:
+                    pass
         
         return metadata
     
@@ -5231,8 +5872,9 @@ Please respond with this context in mind, understanding that you're working thro
     
     def _set_metadata_field(self, field_name, value):
         """Set a metadata field value."""
-        # Ensure metadata fields are initialized
-        if not hasattr(self, 'metadata_fields') or not self.metadata_fields:
+        # Ensure metadata fields are initialized - the dict itself exists
+        # from setup, so only emptiness needs checking
+        if not self.metadata_fields:
             self._initialize_metadata_fields()
         
         if field_name in self.metadata_fields:
@@ -5247,7 +5889,7 @@ Please respond with this context in mind, understanding that you're working thro
     
     def _initialize_metadata_fields(self):
         """Initialize basic metadata fields if they don't exist."""
-        if not hasattr(self, 'metadata_scrollable_frame'):
+        if self.metadata_scrollable_frame is None:
             return
             
         # Standard metadata fields
@@ -5267,15 +5909,15 @@ Please respond with this context in mind, understanding that you're working thro
     
     def update_chat_connection_status(self):
         """Update the chat tab connection status."""
-        if hasattr(self, 'chat_connection_status'):
+        if self.chat_connection_status is not None:
             if self.ai_connected:
                 self.chat_connection_status.config(text="✅ Connected", foreground="green")
-                if hasattr(self, 'chat_model_info'):
+                if self.chat_model_info is not None:
                     model = self.lm_studio_model.get()
                     self.chat_model_info.config(text=f"Model: {model}", foreground="black")
             else:
                 self.chat_connection_status.config(text="❌ Not Connected", foreground="red")
-                if hasattr(self, 'chat_model_info'):
+                if self.chat_model_info is not None:
                     self.chat_model_info.config(text="No model selected", foreground="gray")
     
     def setup_ai_integration(self):
@@ -5285,56 +5927,54 @@ Please respond with this context in mind, understanding that you're working thro
     
     def add_ai_settings_to_metadata_tab(self):
         """Add AI settings section to metadata tab."""
-        # Find the metadata frame and add AI settings
-        for child in self.metadata_frame.winfo_children():
-            if isinstance(child, ttk.Frame):
-                # Add AI settings frame
-                ai_frame = ttk.LabelFrame(child, text="🤖 AI-Powered Metadata Generation", padding="10")
-                ai_frame.pack(fill=tk.X, pady=(10, 0))
-                
-                # LM Studio URL
-                url_frame = ttk.Frame(ai_frame)
-                url_frame.pack(fill=tk.X, pady=5)
-                ttk.Label(url_frame, text="LM Studio URL:").pack(side=tk.LEFT)
-                ttk.Entry(url_frame, textvariable=self.lm_studio_url, width=30).pack(side=tk.LEFT, padx=(5, 0))
-                
-                # Model Selection
-                model_frame = ttk.Frame(ai_frame)
-                model_frame.pack(fill=tk.X, pady=5)
-                ttk.Label(model_frame, text="Model:").pack(side=tk.LEFT)
-                self.model_combo = ttk.Combobox(model_frame, textvariable=self.lm_studio_model, 
-                                              width=35, state="readonly")
-                self.model_combo.pack(side=tk.LEFT, padx=(5, 0))
-                ttk.Button(model_frame, text="🔄 Refresh", 
-                          command=self.fetch_lm_studio_models).pack(side=tk.LEFT, padx=(5, 0))
-                
-                # Connection Status
-                status_frame = ttk.Frame(ai_frame)
-                status_frame.pack(fill=tk.X, pady=5)
-                self.connection_status = ttk.Label(status_frame, text="❌ Not Connected", 
-                                                 foreground="red")
-                self.connection_status.pack(side=tk.LEFT)
-                
-                # Enable AI checkbox
-                ttk.Checkbutton(ai_frame, text="Enable AI Description Generation", 
-                               variable=self.ai_enabled).pack(anchor=tk.W, pady=5)
-                
-                # AI controls
-                ai_controls = ttk.Frame(ai_frame)
-                ai_controls.pack(fill=tk.X, pady=5)
-                
-                ttk.Button(ai_controls, text="🔍 Analyze Current Image", 
-                          command=self.analyze_current_image).pack(side=tk.LEFT, padx=(0, 5))
-                ttk.Button(ai_controls, text="📝 Generate SEO Data", 
-                          command=self.generate_seo_data).pack(side=tk.LEFT, padx=(0, 5))
-                ttk.Button(ai_controls, text="🔄 Test AI Connection", 
-                          command=self.test_ai_connection).pack(side=tk.LEFT)
-                
-                break
+        # The container was captured at creation time - no widget-tree walk
+        child = self._metadata_container
+        
+        # Add AI settings frame
+        ai_frame = ttk.LabelFrame(child, text="🤖 AI-Powered Metadata Generation", padding="10")
+        ai_frame.pack(fill=tk.X, pady=(10, 0))
+        
+        # LM Studio URL
+        url_frame = ttk.Frame(ai_frame)
+        url_frame.pack(fill=tk.X, pady=5)
+        ttk.Label(url_frame, text="LM Studio URL:").pack(side=tk.LEFT)
+        ttk.Entry(url_frame, textvariable=self.lm_studio_url, width=30).pack(side=tk.LEFT, padx=(5, 0))
+        
+        # Model Selection
+        model_frame = ttk.Frame(ai_frame)
+        model_frame.pack(fill=tk.X, pady=5)
+        ttk.Label(model_frame, text="Model:").pack(side=tk.LEFT)
+        self.model_combo = ttk.Combobox(model_frame, textvariable=self.lm_studio_model, 
+                                      width=35, state="readonly")
+        self.model_combo.pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Button(model_frame, text="🔄 Refresh", 
+                  command=self.fetch_lm_studio_models).pack(side=tk.LEFT, padx=(5, 0))
+        
+        # Connection Status
+        status_frame = ttk.Frame(ai_frame)
+        status_frame.pack(fill=tk.X, pady=5)
+        self.connection_status = ttk.Label(status_frame, text="❌ Not Connected", 
+                                         foreground="red")
+        self.connection_status.pack(side=tk.LEFT)
+        
+        # Enable AI checkbox
+        ttk.Checkbutton(ai_frame, text="Enable AI Description Generation", 
+                       variable=self.ai_enabled).pack(anchor=tk.W, pady=5)
+        
+        # AI controls
+        ai_controls = ttk.Frame(ai_frame)
+        ai_controls.pack(fill=tk.X, pady=5)
+        
+        ttk.Button(ai_controls, text="🔍 Analyze Current Image", 
+                  command=self.analyze_current_image).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(ai_controls, text="📝 Generate SEO Data", 
+                  command=self.generate_seo_data).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(ai_controls, text="🔄 Test AI Connection", 
+                  command=self.test_ai_connection).pack(side=tk.LEFT)
     
     def analyze_current_image(self):
         """Analyze current image with AI to generate description."""
-        if not self.metadata_image_path:
+        if not self.metadata_image_path.get():
             messagebox.showwarning("Warning", "Please select an image first")
             return
             
@@ -5352,8 +5992,7 @@ Please respond with this context in mind, understanding that you're working thro
             self.log_message("🤖 Starting AI analysis...")
             
             # Encode image to base64
-            with open(self.metadata_image_path, "rb") as image_file:
-                image_data = base64.b64encode(image_file.read()).decode('utf-8')
+            image_data = self._encode_image_data_url(self.metadata_image_path.get())
             
             # Prepare prompt for Qwen2.5-VL
             prompt = """Analyze this image and provide:
@@ -5370,8 +6009,8 @@ Please be specific and professional in your analysis."""
             response = self._call_lm_studio_api(image_data, prompt)
             
             if response:
-                # Parse and display results
-                self._display_ai_results(response)
+                # Parse and display results on the Tk thread
+                self.root.after(0, self._display_ai_results, response)
                 self.log_message("✅ AI analysis completed successfully")
             else:
                 self.log_message("❌ AI analysis failed")
@@ -5394,8 +6033,8 @@ Please be specific and professional in your analysis."""
             # Use the full model name as it appears in LM Studio
             model_name = selected_model
             
-            print(f"AI Debug (Legacy) - Using Model Name: {model_name}")
-            print(f"AI Debug (Legacy) - Prompt: {prompt[:100]}...")
+            logger.debug("AI Debug (Legacy) - Using Model Name: %s", model_name)
+            logger.debug("AI Debug (Legacy) - Prompt: %.100s...", prompt)
             
             payload = {
                 "model": model_name,
@@ -5407,7 +6046,7 @@ Please be specific and professional in your analysis."""
                             {
                                 "type": "image_url",
                                 "image_url": {
-                                    "url": f"data:image/jpeg;base64,{image_data}"
+                                    "url": image_data
                                 }
                             }
                         ]
@@ -5422,9 +6061,11 @@ Please be specific and professional in your analysis."""
                 "Accept": "application/json"
             }
             
-            print(f"AI Debug (Legacy) - Headers: {headers}")
+            logger.debug("AI Debug (Legacy) - Headers: %s", headers)
             
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
+            body = json.dumps(payload, separators=(',', ':'),
+                              ensure_ascii=False).encode('utf-8')
+            response = self._http.post(url, data=body, headers=headers, timeout=30)
             response.raise_for_status()
             
             result = response.json()
@@ -5439,18 +6080,21 @@ Please be specific and professional in your analysis."""
     
     def _display_ai_results(self, ai_response):
         """Display AI analysis results in the metadata editor."""
-        # Parse AI response and populate metadata fields
-        lines = ai_response.split('\n')
-        
-        # Look for specific sections and populate fields
-        for line in lines:
+        # Look for specific sections and populate fields - one regex match
+        # per line, falling back to a single lowercased hint scan
+        for line in ai_response.splitlines():
             line = line.strip()
-            if line.startswith('1.') or 'description' in line.lower():
-                self._set_metadata_field('ImageDescription', line.replace('1.', '').strip())
-            elif line.startswith('5.') or 'keywords' in line.lower():
-                self._set_metadata_field('Keywords', line.replace('5.', '').strip())
-            elif line.startswith('6.') or 'alt text' in line.lower():
-                self._set_metadata_field('AltText', line.replace('6.', '').strip())
+            section = _AI_SECTION_RE.match(line)
+            if section:
+                field = _AI_SECTION_FIELDS.get(int(section.group(1)))
+                if field:
+                    self._set_metadata_field(field, section.group(2).strip())
+                continue
+            lowered = line.lower()
+            for hint, field in _AI_LINE_HINTS:
+                if hint in lowered:
+                    self._set_metadata_field(field, line)
+                    break
         
         # Store full AI response
         self._set_metadata_field('AIAnalysis', ai_response)
@@ -5499,7 +6143,7 @@ Please be specific and professional in your analysis."""
     
     def generate_seo_data(self):
         """Generate SEO-optimized metadata for the current image."""
-        if not self.metadata_image_path:
+        if not self.metadata_image_path.get():
             messagebox.showwarning("Warning", "Please select an image first")
             return
             
@@ -5525,15 +6169,16 @@ Focus on search engine optimization and user engagement."""
             self.ai_processing = True
             self.log_message("🔍 Generating SEO data...")
             
-            # Encode image to base64
-            with open(self.metadata_image_path, "rb") as image_file:
-                image_data = base64.b64encode(image_file.read()).decode('utf-8')
+            # Title/keywords/mood don't need pixel detail - a 512px
+            # thumbnail cuts upload and vision prefill several-fold
+            image_data = self._encode_image_data_url(self.metadata_image_path.get(),
+                                                     max_edge=512)
             
             # Call LM Studio API
             response = self._call_lm_studio_api(image_data, prompt)
             
             if response:
-                self._display_seo_results(response)
+                self.root.after(0, self._display_seo_results, response)
                 self.log_message("✅ SEO data generated successfully")
             else:
                 self.log_message("❌ SEO data generation failed")
@@ -5563,15 +6208,16 @@ Focus on search engine optimization and user engagement."""
         seo_frame = ttk.Frame(main_frame)
         seo_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Parse and display structured SEO data
-        lines = seo_response.split('\n')
+        # Parse and display structured SEO data - split each line once and
+        # lowercase only the key part for the prefix check
         seo_fields = {}
         
-        for line in lines:
-            line = line.strip()
-            if ':' in line and any(keyword in line.lower() for keyword in ['title', 'description', 'keywords', 'alt text', 'file name', 'category', 'color', 'mood']):
-                key, value = line.split(':', 1)
-                seo_fields[key.strip()] = value.strip()
+        for line in seo_response.splitlines():
+            key, sep, value = line.strip().partition(':')
+            if sep:
+                key_lower = key.lower()
+                if any(keyword in key_lower for keyword in _SEO_FORM_KEYS):
+                    seo_fields[key.strip()] = value.strip()
         
         # Create form fields
         row = 0
@@ -5614,6 +6260,39 @@ Focus on search engine optimization and user engagement."""
         
         self.log_message("✅ SEO data applied to image metadata")
     
+    def _ingest_models_response(self, models_data):
+        """Apply a /v1/models response: model list, combobox, auto-select."""
+        self.available_lm_studio_models = []
+        
+        # Extract model IDs
+        if 'data' in models_data:
+            for model in models_data['data']:
+                if 'id' in model:
+                    self.available_lm_studio_models.append(model['id'])
+        
+        # Update combobox
+        self.root.after(0, self._update_model_combobox)
+        
+        # Auto-select Qwen2.5-VL-7B if available
+        qwen_model = "qwen/qwen2.5-vl-7b"
+        if qwen_model in self.available_lm_studio_models:
+            self.lm_studio_model.set(qwen_model)
+            self.log_message(f"✅ Auto-selected {qwen_model}")
+        else:
+            # Try to find any qwen model
+            for model in self.available_lm_studio_models:
+                if 'qwen' in model.lower():
+                    self.lm_studio_model.set(model)
+                    self.log_message(f"✅ Auto-selected {model}")
+                    break
+        
+        self.ai_connected = True
+        self.root.after(0, self._update_connection_status, True)
+        self.log_message(f"✅ Found {len(self.available_lm_studio_models)} models")
+        
+        # Debug: Show available models
+        logger.debug("AI Debug - Available models: %s", self.available_lm_studio_models)
+    
     def fetch_lm_studio_models(self):
         """Fetch available models from LM Studio."""
         def fetch_models():
@@ -5622,40 +6301,10 @@ Focus on search engine optimization and user engagement."""
                 
                 # Get models from LM Studio
                 url = f"{self.lm_studio_url.get()}/v1/models"
-                response = requests.get(url, timeout=10)
+                response = self._http.get(url, timeout=10)
                 response.raise_for_status()
                 
-                models_data = response.json()
-                self.available_lm_studio_models = []
-                
-                # Extract model IDs
-                if 'data' in models_data:
-                    for model in models_data['data']:
-                        if 'id' in model:
-                            self.available_lm_studio_models.append(model['id'])
-                
-                # Update combobox
-                self.root.after(0, self._update_model_combobox)
-                
-                # Auto-select Qwen2.5-VL-7B if available
-                qwen_model = "qwen/qwen2.5-vl-7b"
-                if qwen_model in self.available_lm_studio_models:
-                    self.lm_studio_model.set(qwen_model)
-                    self.log_message(f"✅ Auto-selected {qwen_model}")
-                else:
-                    # Try to find any qwen model
-                    for model in self.available_lm_studio_models:
-                        if 'qwen' in model.lower():
-                            self.lm_studio_model.set(model)
-                            self.log_message(f"✅ Auto-selected {model}")
-                            break
-                
-                self.ai_connected = True
-                self.root.after(0, self._update_connection_status, True)
-                self.log_message(f"✅ Found {len(self.available_lm_studio_models)} models")
-                
-                # Debug: Show available models
-                print(f"AI Debug - Available models: {self.available_lm_studio_models}")
+                self._ingest_models_response(response.json())
                 
             except requests.exceptions.RequestException as e:
                 self.log_message(f"❌ Failed to fetch models: {str(e)}")
@@ -5668,14 +6317,14 @@ Focus on search engine optimization and user engagement."""
     
     def _update_model_combobox(self):
         """Update the model combobox with available models."""
-        if hasattr(self, 'model_combo'):
+        if self.model_combo is not None:
             self.model_combo['values'] = self.available_lm_studio_models
             if self.available_lm_studio_models and not self.lm_studio_model.get():
                 self.lm_studio_model.set(self.available_lm_studio_models[0])
     
     def _update_connection_status(self, connected):
         """Update the connection status display."""
-        if hasattr(self, 'connection_status'):
+        if self.connection_status is not None:
             if connected:
                 self.connection_status.config(text="✅ Connected", foreground="green")
             else:
@@ -5692,15 +6341,14 @@ Focus on search engine optimization and user engagement."""
                 
                 # Simple test request
                 url = f"{self.lm_studio_url.get()}/v1/models"
-                response = requests.get(url, timeout=5)
+                response = self._http.get(url, timeout=5)
                 response.raise_for_status()
                 
                 self.log_message("✅ LM Studio connection successful!")
-                self.ai_connected = True
-                self.root.after(0, self._update_connection_status, True)
                 
-                # Fetch available models
-                self.fetch_lm_studio_models()
+                # The test already fetched /v1/models - parse it in place
+                # instead of re-requesting on another thread
+                self._ingest_models_response(response.json())
                 
                 messagebox.showinfo("Connection Test", "✅ Successfully connected to LM Studio!")
                 
@@ -5723,13 +6371,12 @@ Focus on search engine optimization and user engagement."""
             try:
                 # Test connection without showing popup
                 url = f"{self.lm_studio_url.get()}/v1/models"
-                response = requests.get(url, timeout=3)
+                response = self._http.get(url, timeout=3)
                 response.raise_for_status()
                 
-                # Connection successful, fetch models
-                self.ai_connected = True
-                self.root.after(0, self._update_connection_status, True)
-                self.fetch_lm_studio_models()
+                # Connection successful - reuse the response for the
+                # model list instead of a second round-trip
+                self._ingest_models_response(response.json())
                 self.log_message("🤖 Auto-connected to LM Studio")
                 
             except:
@@ -5762,16 +6409,25 @@ Focus on search engine optimization and user engagement."""
             return
             
         # Start batch processing in a separate thread
+        self._ai_cancel.clear()
         threading.Thread(target=self._process_batch_ai_thread, daemon=True).start()
     
+    def stop_batch_ai_processing(self):
+        """Request cancellation of the running batch AI run."""
+        if self.ai_processing:
+            self._ai_cancel.set()
+            self.log_message("⏹ Stopping batch AI processing after the current group...")
+    
     def _process_batch_ai_thread(self):
         """Process batch AI in a separate thread."""
         try:
             self.log_message("🤖 Starting batch AI processing...")
             self.ai_processing = True
             
-            # Extract rules from chat
+            # Extract rules from chat and stringify them once - the block
+            # is identical for every image in the run
             rules = self._extract_chat_rules()
+            formatted_rules = self._format_rules_for_ai(rules)
             self.log_message(f"📋 Extracted {len(rules)} rules from chat")
             
             # Process each image
@@ -5780,32 +6436,55 @@ Focus on search engine optimization and user engagement."""
             successful = 0
             failed = 0
             
-            for i, image_path in enumerate(self.image_files):
-                try:
-                    # Update progress
-                    self.root.after(0, self._update_batch_progress, i + 1, total_images, image_path)
-                    
-                    # Process image with AI
-                    success = self._process_single_image_ai(image_path, rules)
-                    
-                    if success:
-                        successful += 1
-                        self.log_message(f"✅ Processed: {os.path.basename(image_path)}")
-                    else:
-                        failed += 1
-                        self.log_message(f"❌ Failed: {os.path.basename(image_path)}")
-                    
-                    processed += 1
-                    
-                    # Small delay to prevent overwhelming the API
-                    time.sleep(1)
+            # Group images so one request carries several; per-request
+            # overhead (HTTP, JSON, model prefill) dominates for small files
+            groups = [self.image_files[start:start + _AI_BATCH_SIZE]
+                      for start in range(0, total_images, _AI_BATCH_SIZE)]
+            
+            def run_group(group):
+                # Event check gives Stop a window before each group's
+                # request goes out
+                if self._ai_cancel.is_set():
+                    return None
+                # Warm the encode cache so the payload build is a dict hit
+                for image_path in group:
+                    self._prefetch_pool.submit(self._encode_image_data_url, image_path)
+                return self._process_image_batch_ai(group, formatted_rules)
+            
+            # Two groups in flight: llama.cpp-style servers batch
+            # concurrent requests, and one group's encode/parse overlaps
+            # the other's generation - more would just queue server-side
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                futures = {pool.submit(run_group, group): group for group in groups}
+                for future in as_completed(futures):
+                    group = futures[future]
+                    try:
+                        results = future.result()
+                        if results is None:
+                            continue  # Cancelled before dispatch
+                        for image_path, success in results:
+                            if success:
+                                successful += 1
+                                self.log_message(f"✅ Processed: {os.path.basename(image_path)}")
+                            else:
+                                failed += 1
+                                self.log_message(f"❌ Failed: {os.path.basename(image_path)}")
+                            processed += 1
+                    except Exception as e:
+                        failed += len(group)
+                        processed += len(group)
+                        self.log_message(f"❌ Error processing batch at {os.path.basename(group[0])}: {str(e)}")
                     
-                except Exception as e:
-                    failed += 1
-                    self.log_message(f"❌ Error processing {os.path.basename(image_path)}: {str(e)}")
+                    # Progress reflects completed work; only this thread
+                    # touches the counters
+                    self.root.after(0, self._update_batch_progress,
+                                    processed, total_images, group[0])
             
             # Final results
-            self.log_message(f"🎉 Batch processing complete!")
+            if self._ai_cancel.is_set():
+                self.log_message(f"⏹ Batch processing stopped by user")
+            else:
+                self.log_message(f"🎉 Batch processing complete!")
             self.log_message(f"📊 Results: {successful} successful, {failed} failed out of {total_images} total")
             
             # Reset progress
@@ -5822,58 +6501,38 @@ Focus on search engine optimization and user engagement."""
         
         for msg in self.chat_messages:
             if msg['sender'] == 'user':
-                # Look for rule-like messages
-                content = msg['message'].lower()
-                if any(keyword in content for keyword in ['rule', 'instruction', 'always', 'never', 'should', 'must', 'format']):
+                # Look for rule-like messages - one precompiled scan, no
+                # lowercased copy per message
+                if _USER_RULE_RE.search(msg['message']):
                     rules.append({
                         'type': 'user_rule',
                         'content': msg['message']
                     })
             elif msg['sender'] == 'ai':
                 # Look for AI responses that contain structured instructions
-                content = msg['message']
-                if 'format' in content.lower() or 'structure' in content.lower():
+                if _AI_FORMAT_RE.search(msg['message']):
                     rules.append({
                         'type': 'ai_format',
-                        'content': content
+                        'content': msg['message']
                     })
         
         return rules
     
-    def _process_single_image_ai(self, image_path, rules):
-        """Process a single image with AI using the established rules."""
+    def _process_single_image_ai(self, image_path, formatted_rules):
+        """Process a single image with AI using the pre-formatted rules block."""
         try:
             # Parse filename for context
             filename = Path(image_path).name
             filename_data = self.parse_filename_data(filename)
             
-            # Build context with rules
-            context = f"""
-Filename: {filename}
-Product Code: {filename_data['code']}
-Product Type: {filename_data['type']}
-Color: {filename_data['color']}
-Product Name: {filename_data['name']}
-Category: {filename_data['category']}
-
-Rules and Instructions:
-{self._format_rules_for_ai(rules)}
-
-Please provide metadata suggestions for this image in the following format:
-
-Title: [descriptive title based on the product and room shown]
-Description: [detailed description of what's shown in the image]
-Keywords: [relevant search terms, comma-separated]
-Artist: [Your Company Name]
-Make: {filename_data['code']}
-Model: {filename_data['type']}
-
-Please ensure all 6 fields are provided with the exact format shown above.
-"""
+            # Build context with rules from the hoisted template
+            context = _SINGLE_IMAGE_PROMPT.format_map(
+                {**filename_data, 'filename': filename,
+                 'rules': formatted_rules})
+            
             
             # Encode image to base64
-            with open(image_path, "rb") as image_file:
-                image_data = base64.b64encode(image_file.read()).decode('utf-8')
+            image_data = self._encode_image_data_url(image_path)
             
             # Call AI API
             response = self._call_lm_studio_api_with_context(image_data, context)
@@ -5893,6 +6552,130 @@ Please ensure all 6 fields are provided with the exact format shown above.
             self.log_message(f"❌ Error processing {image_path}: {str(e)}")
             return False
     
+    def _process_image_batch_ai(self, image_paths, formatted_rules):
+        """Process a group of images with one vision request.
+
+        Returns a list of (path, success) pairs. Falls back to the
+        per-image path when the grouped response cannot be used.
+        """
+        if len(image_paths) == 1:
+            path = image_paths[0]
+            return [(path, self._process_single_image_ai(path, formatted_rules))]
+        
+        try:
+            # Per-image context blocks, delimited so the response can be
+            # split back apart
+            sections = []
+            for i, image_path in enumerate(image_paths, 1):
+                filename = os.path.basename(image_path)
+                filename_data = self.parse_filename_data(filename)
+                sections.append(_BATCH_IMAGE_SECTION.format_map(
+                    {**filename_data, 'index': i, 'filename': filename}))
+            
+            context = f"""You will be shown {len(image_paths)} images. For EACH image, provide metadata in the format below, preceded by its delimiter line exactly as given (for example "=== IMAGE 1 ===").
+
+{chr(10).join(sections)}
+
+Rules and Instructions:
+{formatted_rules}
+
+For every image respond with:
+
+=== IMAGE [number] ===
+Title: [descriptive title based on the product and room shown]
+Description: [detailed description of what's shown in the image]
+Keywords: [relevant search terms, comma-separated]
+Artist: [Your Company Name]
+Make: [product code from that image's filename]
+Model: [product type from that image's filename]
+"""
+            
+            image_data_list = [self._encode_image_data_url(p) for p in image_paths]
+            response = self._call_lm_studio_api_batch(image_data_list, context)
+            
+            if not response:
+                raise ValueError("empty batch response")
+            
+            # Split the response on the delimiters and map sections back
+            # to their images by number
+            parts = _IMAGE_SECTION_RE.split(response)
+            section_by_index = {}
+            for j in range(1, len(parts) - 1, 2):
+                section_by_index[int(parts[j])] = parts[j + 1]
+            
+            if not section_by_index:
+                raise ValueError("no image delimiters in batch response")
+            
+            results = []
+            for i, image_path in enumerate(image_paths, 1):
+                section = section_by_index.get(i)
+                if section:
+                    metadata_dict = self._parse_ai_response_for_metadata(section)
+                    success = bool(metadata_dict) and self._save_metadata_to_file(image_path, metadata_dict)
+                else:
+                    success = self._process_single_image_ai(image_path, formatted_rules)
+                results.append((image_path, success))
+            return results
+            
+        except Exception as e:
+            # Grouped request failed outright - process one at a time
+            self.log_message(f"⚠️ Batch request failed ({str(e)}), retrying images individually")
+            return [(p, self._process_single_image_ai(p, formatted_rules)) for p in image_paths]
+    
+    def _call_lm_studio_api_batch(self, image_data_list, context):
+        """Call LM Studio with one prompt and several images."""
+        try:
+            url = f"{self.lm_studio_url.get()}/v1/chat/completions"
+            
+            content = [{"type": "text", "text": context}]
+            for image_data in image_data_list:
+                content.append({
+                    "type": "image_url",
+                    "image_url": {
+                        "url": image_data
+                    }
+                })
+            
+            payload = {
+                "model": self.vision_model,
+                "messages": [
+                    {
+                        "role": "system",
+                        "content": "You are an expert at analyzing interior design images and creating SEO-optimized metadata. Always provide structured responses for metadata fields."
+                    },
+                    {"role": "user", "content": content}
+                ],
+                "max_tokens": self.vision_max_tokens * len(image_data_list),
+                "temperature": self.vision_temperature
+            }
+            
+            headers = {
+                "Content-Type": "application/json",
+                "Accept": "application/json"
+            }
+            
+            # Batch payloads carry several base64 images - serialize compactly
+            # once instead of letting requests re-dump with spaces
+            body = json.dumps(payload, separators=(',', ':'),
+                              ensure_ascii=False).encode('utf-8')
+            response = self._http.post(url, data=body, headers=headers,
+                                     timeout=60 * len(image_data_list))
+            
+            if response.status_code != 200:
+                self.log_message(f"❌ Batch API error {response.status_code}: {response.text[:200]}")
+                return None
+            
+            # Batch responses are the largest bodies we see - parse the
+            # bytes once instead of decoding to str first
+            result = json.loads(response.content)
+            if 'choices' in result and len(result['choices']) > 0:
+                return result['choices'][0]['message']['content']
+            return None
+            
+        except Exception as e:
+            self.log_message(f"❌ Error calling LM Studio batch API: {str(e)}")
+            return None
+    
     def _format_rules_for_ai(self, rules):
         """Format rules for AI consumption."""
         if not rules:
@@ -5907,16 +6690,26 @@ Please ensure all 6 fields are provided with the exact format shown above.
     def _save_metadata_to_file(self, image_path, metadata_dict):
         """Save metadata directly to image file."""
         try:
+            # Skip no-op writes: re-running AI over a folder regenerates the
+            # same tags, and rewriting them still rewrites the file on disk
+            if self._written_metadata.get(image_path) == metadata_dict:
+                self.log_message(f"⏭ Metadata unchanged, skipping: {os.path.basename(image_path)}")
+                return True
+
             # Determine file type
             file_ext = Path(image_path).suffix.lower()
             
             if file_ext in ['.jpg', '.jpeg']:
-                return self._save_jpeg_metadata_direct(image_path, metadata_dict)
+                success = self._save_jpeg_metadata_direct(image_path, metadata_dict)
             elif file_ext == '.webp':
-                return self._save_webp_metadata_direct(image_path, metadata_dict)
+                success = self._save_webp_metadata_direct(image_path, metadata_dict)
             else:
                 self.log_message(f"⚠️ Unsupported file type: {file_ext}")
                 return False
+
+            if success:
+                self._written_metadata[image_path] = dict(metadata_dict)
+            return success
                 
         except Exception as e:
             self.log_message(f"❌ Error saving metadata to {image_path}: {str(e)}")
@@ -5925,34 +6718,28 @@ Please ensure all 6 fields are provided with the exact format shown above.
     def _save_jpeg_metadata_direct(self, image_path, metadata_dict):
         """Save metadata directly to JPEG file."""
         try:
-            # Load image
-            image = Image.open(image_path)
-            
-            # Convert to RGB if necessary
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
-            
-            # Create EXIF data
-            exif_dict = piexif.load(image.info.get('exif', b''))
-            
+            # Existing EXIF (APP1-only read) or a fresh template
+            exif_dict = self._load_jpeg_app1_exif(image_path) or {'0th': {}, 'Exif': {}, 'GPS': {}, '1st': {}, 'Interop': {}, 'thumbnail': None}
+
             # Set metadata fields
             if 'XPTitle' in metadata_dict:
-                exif_dict['0th'][piexif.ImageIFD.XPTitle] = metadata_dict['XPTitle'].encode('utf-16le')
+                exif_dict['0th'][piexif.ImageIFD.XPTitle] = _enc_utf16le(metadata_dict['XPTitle'])
             if 'ImageDescription' in metadata_dict:
                 exif_dict['0th'][piexif.ImageIFD.ImageDescription] = metadata_dict['ImageDescription'].encode('utf-8')
             if 'XPKeywords' in metadata_dict:
-                exif_dict['0th'][piexif.ImageIFD.XPKeywords] = metadata_dict['XPKeywords'].encode('utf-16le')
+                exif_dict['0th'][piexif.ImageIFD.XPKeywords] = _enc_utf16le(metadata_dict['XPKeywords'])
             if 'Artist' in metadata_dict:
                 exif_dict['0th'][piexif.ImageIFD.Artist] = metadata_dict['Artist'].encode('utf-8')
             if 'Make' in metadata_dict:
                 exif_dict['0th'][piexif.ImageIFD.Make] = metadata_dict['Make'].encode('utf-8')
             if 'Model' in metadata_dict:
                 exif_dict['0th'][piexif.ImageIFD.Model] = metadata_dict['Model'].encode('utf-8')
-            
-            # Save with metadata
+
+            # Patch only the APP1 segment - no pixel decode or re-encode
             exif_bytes = piexif.dump(exif_dict)
-            image.save(image_path, 'JPEG', exif=exif_bytes, quality=95)
-            
+            piexif.insert(exif_bytes, image_path)
+            self._exif_cache.pop(image_path, None)  # Invalidate prefetch cache
+
             return True
             
         except Exception as e:
@@ -5962,33 +6749,25 @@ Please ensure all 6 fields are provided with the exact format shown above.
     def _save_webp_metadata_direct(self, image_path, metadata_dict):
         """Save metadata directly to WebP file using ExifTool."""
         try:
-            # Build ExifTool command
-            cmd = [self.exiftool_path, '-overwrite_original']
-            
-            # Add metadata tags
-            if 'XPTitle' in metadata_dict:
-                cmd.extend(['-XMP:Title', metadata_dict['XPTitle']])
-            if 'ImageDescription' in metadata_dict:
-                cmd.extend(['-XMP:Description', metadata_dict['ImageDescription']])
-            if 'XPKeywords' in metadata_dict:
-                cmd.extend(['-XMP:Subject', metadata_dict['XPKeywords']])
-            if 'Artist' in metadata_dict:
-                cmd.extend(['-XMP:Creator', metadata_dict['Artist']])
-            if 'Make' in metadata_dict:
-                cmd.extend(['-XMP:Make', metadata_dict['Make']])
-            if 'Model' in metadata_dict:
-                cmd.extend(['-XMP:Model', metadata_dict['Model']])
-            
-            cmd.append(image_path)
+            # Feed the persistent -stay_open worker instead of paying Perl
+            # startup per file - batch AI runs hit this once per image.
+            # Same -fast2/-m/-q flags as _write_webp_metadata_exiftool
+            args = ['-fast2', '-m', '-q', '-q', '-overwrite_original']
+
+            # Add metadata tags - -TAG=VALUE single-arg form, the bare
+            # ['-TAG', value] pairs were read requests to ExifTool
+            for field_name, value in metadata_dict.items():
+                if field_name in _WEBP_EXIFTOOL_TAGS:
+                    args.append(f"{_WEBP_EXIFTOOL_TAGS[field_name]}={value}")
+
+            args.append(image_path)
             
-            # Run ExifTool
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            output = self._exiftool_execute(args)
             
-            if result.returncode == 0:
-                return True
-            else:
-                self.log_message(f"❌ ExifTool error: {result.stderr}")
+            if 'error' in output.lower() or '0 image files updated' in output:
+                self.log_message(f"❌ ExifTool error: {output.strip()}")
                 return False
+            return True
                 
         except Exception as e:
             self.log_message(f"❌ Error saving WebP metadata: {str(e)}")
@@ -6039,10 +6818,10 @@ Please ensure all 6 fields are provided with the exact format shown above.
         text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Insert rules
-        for i, rule in enumerate(rules, 1):
-            text_widget.insert(tk.END, f"Rule {i} ({rule['type']}):\n")
-            text_widget.insert(tk.END, f"{rule['content']}\n\n")
+        # Insert rules in one call - per-line inserts each reflow the widget
+        text_widget.insert(tk.END, "\n\n".join(
+            f"Rule {i} ({rule['type']}):\n{rule['content']}"
+            for i, rule in enumerate(rules, 1)) + "\n")
         
         # Make read-only
         text_widget.config(state=tk.DISABLED)
@@ -6057,31 +6836,41 @@ Please ensure all 6 fields are provided with the exact format shown above.
             self.chat_folder_path_str = folder
             self.chat_folder_images = self._load_images_from_folder(folder)
             self.chat_current_image_index = 0
+            self._folder_context_template = None  # Rebuilt for the new folder
+            self._b64_cache.clear()  # Old folder's encodings won't be needed
             
             if self.chat_folder_images:
                 self.chat_folder_path.config(text=f"Folder: {os.path.basename(folder)}")
                 self.load_chat_image(self.chat_folder_images[0])
                 self.update_chat_image_counter()
+                self._prefetch_chat_thumbs()
             else:
                 self.chat_folder_path.config(text="No images found")
                 messagebox.showwarning("Warning", "No image files found in selected folder")
     
     def _load_images_from_folder(self, folder_path):
         """Load all image files from a folder."""
-        image_extensions = {'.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.webp', '.avif'}
-        image_files = []
-        
         try:
-            for ext in image_extensions:
-                # Add both lowercase and uppercase extensions
-                image_files.extend(Path(folder_path).glob(f'*{ext}'))
-                image_files.extend(Path(folder_path).glob(f'*{ext.upper()}'))
-            
-            # Convert to strings and remove duplicates (case-insensitive file systems)
-            image_files = [str(f) for f in image_files]
-            # Remove duplicates by converting to set and back to list
-            image_files = list(set(image_files))
+            # Re-selecting the same folder is common; the directory mtime
+            # changes on any add/remove/rename, so an unchanged mtime means
+            # the cached listing is still valid
+            dir_mtime = os.stat(folder_path).st_mtime_ns
+            cached = self._folder_scan_cache.get(folder_path)
+            if cached and cached[0] == dir_mtime:
+                self.log_message(f"📁 Loaded {len(cached[1])} unique images from folder (cached)")
+                return list(cached[1])
+
+            # One scandir pass; DirEntry.stat() is served from the directory
+            # read on Windows, so caching it here makes the size shown while
+            # navigating with Previous/Next free of extra stat calls
+            image_files = []
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith(_IMAGE_EXTENSIONS) and entry.is_file():
+                        image_files.append(entry.path)
+                        self._folder_stat_cache[entry.path] = entry.stat()
             image_files.sort()
+            self._folder_scan_cache[folder_path] = (dir_mtime, image_files)
             
             self.log_message(f"📁 Loaded {len(image_files)} unique images from folder")
             return image_files
@@ -6095,6 +6884,7 @@ Please ensure all 6 fields are provided with the exact format shown above.
             self.chat_current_image_index -= 1
             self.load_chat_image(self.chat_folder_images[self.chat_current_image_index])
             self.update_chat_image_counter()
+            self._prefetch_chat_thumbs()
     
     def next_chat_image(self):
         """Navigate to next image in chat folder."""
@@ -6102,6 +6892,7 @@ Please ensure all 6 fields are provided with the exact format shown above.
             self.chat_current_image_index += 1
             self.load_chat_image(self.chat_folder_images[self.chat_current_image_index])
             self.update_chat_image_counter()
+            self._prefetch_chat_thumbs()
     
     def update_chat_image_counter(self):
         """Update the image counter display."""
@@ -6134,13 +6925,12 @@ Please ensure all 6 fields are provided with the exact format shown above.
         text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Insert folder contents
-        text_widget.insert(tk.END, f"Folder: {self.batch_folder}\n")
-        text_widget.insert(tk.END, f"Total Images: {len(self.image_files)}\n\n")
-        
-        for i, img_path in enumerate(self.image_files, 1):
-            filename = os.path.basename(img_path)
-            text_widget.insert(tk.END, f"{i:3d}. {filename}\n")
+        # Insert folder contents in one call; per-file inserts make the
+        # widget reflow N times and dominate open time on big folders
+        body = "\n".join(f"{i:3d}. {os.path.basename(img_path)}"
+                         for i, img_path in enumerate(self.image_files, 1))
+        text_widget.insert(tk.END, f"Folder: {self.batch_folder}\n"
+                                   f"Total Images: {len(self.image_files)}\n\n{body}\n")
         
         # Make read-only
         text_widget.config(state=tk.DISABLED)
@@ -6211,7 +7001,7 @@ Please ensure all 6 fields are provided with the exact format shown above.
     
     def _call_tool_use_api_with_tools(self, message):
         """Call tool use API with predefined tools for folder access."""
-        print(f"AI Debug (Tool Use) - Starting tool use API call with message: {message[:100]}...")
+        logger.debug("AI Debug (Tool Use) - Starting tool use API call with message: %.100s...", message)
         tools = [
             {
                 "type": "function",
@@ -6257,7 +7047,7 @@ Please ensure all 6 fields are provided with the exact format shown above.
         ]
         
         result = self._call_tool_use_api(message, tools)
-        print(f"AI Debug (Tool Use) - Tool use API returned: {result is not None}")
+        logger.debug("AI Debug (Tool Use) - Tool use API returned: %s", result is not None)
         return result
     
     def _call_tool_use_api(self, message, tools=None):
@@ -6322,15 +7112,15 @@ IMPORTANT: Always respond with useful information based on tool results. Never l
             
             headers = self.tool_use_headers
             
-            print(f"AI Debug (Tool Use) - Using Model: {model_name}")
-            print(f"AI Debug (Tool Use) - Message: {message}")
+            logger.debug("AI Debug (Tool Use) - Using Model: %s", model_name)
+            logger.debug("AI Debug (Tool Use) - Message: %s", message)
             
-            response = requests.post(url, json=payload, headers=headers, timeout=60)
+            response = self._http.post(url, json=payload, headers=headers, timeout=60)
             
-            print(f"AI Debug (Tool Use) - Response status: {response.status_code}")
+            logger.debug("AI Debug (Tool Use) - Response status: %s", response.status_code)
             
             if response.status_code != 200:
-                print(f"AI Debug (Tool Use) - Error: {response.text}")
+                logger.debug("AI Debug (Tool Use) - Error: %s", response.text)
                 return None
                 
             result = response.json()
@@ -6341,7 +7131,7 @@ IMPORTANT: Always respond with useful information based on tool results. Never l
                 
                 if 'tool_calls' in choice['message'] and choice['message']['tool_calls']:
                     # Process tool calls
-                    return self._process_tool_calls(choice['message']['tool_calls'], messages, model_name)
+                    return self._process_tool_calls(choice['message']['tool_calls'], messages, model_name, message)
                 else:
                     # Return regular response
                     return choice['message']['content']
@@ -6349,10 +7139,10 @@ IMPORTANT: Always respond with useful information based on tool results. Never l
             return None
             
         except Exception as e:
-            print(f"AI Debug (Tool Use) - Error: {str(e)}")
+            logger.debug("AI Debug (Tool Use) - Error: %s", str(e))
             return None
     
-    def _process_tool_calls(self, tool_calls, messages, model_name):
+    def _process_tool_calls(self, tool_calls, messages, model_name, user_message):
         """Process tool calls and return results."""
         try:
             # Add assistant message with tool calls
@@ -6362,24 +7152,23 @@ IMPORTANT: Always respond with useful information based on tool results. Never l
                 "tool_calls": tool_calls
             })
             
-            # Track executed tools to prevent duplicates
-            executed_tools = set()
-            
-            # Execute tool calls
+            # Models sometimes emit the same tool twice in one turn; dedup
+            # on (name, args) before executing so duplicates cost one dict
+            # insert, not a parse plus a skip
+            unique_calls = {}
             for tool_call in tool_calls:
                 function_name = tool_call['function']['name']
                 function_args = json.loads(tool_call['function']['arguments'])
-                
-                # Skip if already executed
-                tool_key = f"{function_name}_{str(function_args)}"
-                if tool_key in executed_tools:
-                    print(f"AI Debug (Tool Use) - Skipping duplicate tool call: {function_name}")
-                    continue
-                
-                executed_tools.add(tool_key)
-                
-                print(f"AI Debug (Tool Use) - Executing tool: {function_name}")
-                print(f"AI Debug (Tool Use) - Arguments: {function_args}")
+                key = (function_name, tuple(sorted(function_args.items())))
+                if key in unique_calls:
+                    logger.debug("AI Debug (Tool Use) - Skipping duplicate tool call: %s", function_name)
+                else:
+                    unique_calls[key] = (tool_call, function_args)
+            
+            # Execute tool calls
+            for (function_name, _), (tool_call, function_args) in unique_calls.items():
+                logger.debug("AI Debug (Tool Use) - Executing tool: %s", function_name)
+                logger.debug("AI Debug (Tool Use) - Arguments: %s", function_args)
                 
                 # Execute the tool
                 tool_result = self._execute_tool(function_name, function_args)
@@ -6392,7 +7181,7 @@ IMPORTANT: Always respond with useful information based on tool results. Never l
                 })
             
             # Instead of trying to get the model to respond, let's format the tool results directly
-            print(f"AI Debug (Tool Use) - Formatting tool results directly")
+            logger.debug("AI Debug (Tool Use) - Formatting tool results directly")
             
             # Collect all tool results
             tool_results = []
@@ -6401,25 +7190,72 @@ IMPORTANT: Always respond with useful information based on tool results. Never l
                     tool_results.append(msg['content'])
             
             if tool_results:
-                # Parse the tool results and provide intelligent responses based on the user's question
-                # Get the original user message from the messages
-                user_message = ""
-                for msg in messages:
-                    if msg.get('role') == 'user' and not msg.get('content', '').startswith('Please provide a clear response'):
-                        user_message = msg.get('content', '')
-                        break
-                
+                # Parse the tool results and provide intelligent responses
+                # based on the user's question - the caller hands the
+                # original user turn straight through
                 response_text = self._analyze_tool_results_and_respond(user_message, tool_results, tool_calls)
                 
-                print(f"AI Debug (Tool Use) - Returning analyzed response: {response_text[:100]}...")
+                logger.debug("AI Debug (Tool Use) - Returning analyzed response: %.100s...", response_text)
                 return response_text
             else:
                 return "Tool execution completed but no results were returned."
             
         except Exception as e:
-            print(f"AI Debug (Tool Use) - Tool processing error: {str(e)}")
+            logger.debug("AI Debug (Tool Use) - Tool processing error: %s", str(e))
             return f"Error processing tools: {str(e)}"
     
+    def _parse_folder_listing(self, folder_data):
+        """Parse a folder listing into files plus aggregates in one pass.
+
+        Largest, smallest and the unique-name count are tracked while
+        parsing so the question branches don't each rescan the file list.
+        Successive chat turns usually ask about the same folder, so the
+        result is memoized on the listing text (bounded like the other
+        instance caches).
+        """
+        cached = self._folder_parse_cache.get(folder_data)
+        if cached is not None:
+            self._folder_parse_cache.move_to_end(folder_data)
+            return cached
+
+        folder_name = "Unknown"
+        total_files = 0
+        files = []
+        seen_names = set()
+        largest = smallest = None
+
+        for line in folder_data.split('\n'):
+            if line.startswith("Folder:"):
+                folder_name = line.replace("Folder:", "").strip()
+            elif line.startswith("Total files:"):
+                total_files = int(line.replace("Total files:", "").strip())
+            elif line.strip() and line[0].isdigit():
+                # Parse file line: "1. filename.ext (size KB)"
+                parts = line.split('.', 1)
+                if len(parts) > 1:
+                    file_info = parts[1].strip()
+                    if ' (' in file_info and ' KB)' in file_info:
+                        filename = file_info.split(' (')[0]
+                        size_str = file_info.split(' (')[1].replace(' KB)', '')
+                        try:
+                            entry = {'name': filename, 'size': float(size_str)}
+                        except ValueError:
+                            entry = {'name': file_info, 'size': 0}
+                        files.append(entry)
+                        seen_names.add(entry['name'])
+                        if largest is None or entry['size'] > largest['size']:
+                            largest = entry
+                        if smallest is None or entry['size'] < smallest['size']:
+                            smallest = entry
+
+        parsed = {'folder_name': folder_name, 'total_files': total_files,
+                  'files': files, 'unique_count': len(seen_names),
+                  'largest': largest, 'smallest': smallest}
+        self._folder_parse_cache[folder_data] = parsed
+        if len(self._folder_parse_cache) > 8:
+            self._folder_parse_cache.popitem(last=False)
+        return parsed
+
     def _analyze_tool_results_and_respond(self, user_message, tool_results, tool_calls):
         """Analyze tool results and provide intelligent responses based on the user's question."""
         try:
@@ -6434,65 +7270,43 @@ IMPORTANT: Always respond with useful information based on tool results. Never l
                 return "Tool execution completed but no folder data was returned."
             
             # Parse the folder data
-            lines = folder_data.split('\n')
-            folder_name = "Unknown"
-            total_files = 0
-            files = []
-            
-            for line in lines:
-                if line.startswith("Folder:"):
-                    folder_name = line.replace("Folder:", "").strip()
-                elif line.startswith("Total files:"):
-                    total_files = int(line.replace("Total files:", "").strip())
-                elif line.strip() and line[0].isdigit():
-                    # Parse file line: "1. filename.ext (size KB)"
-                    parts = line.split('.', 1)
-                    if len(parts) > 1:
-                        file_info = parts[1].strip()
-                        if ' (' in file_info and ' KB)' in file_info:
-                            filename = file_info.split(' (')[0]
-                            size_str = file_info.split(' (')[1].replace(' KB)', '')
-                            try:
-                                size = float(size_str)
-                                files.append({'name': filename, 'size': size})
-                            except ValueError:
-                                files.append({'name': file_info, 'size': 0})
+            parsed = self._parse_folder_listing(folder_data)
+            folder_name = parsed['folder_name']
+            total_files = parsed['total_files']
+            files = parsed['files']
             
             # Analyze the user's question and provide appropriate response
             user_lower = user_message.lower()
             
             if "duplicate" in user_lower:
                 # Check for duplicates
-                filenames = [f['name'] for f in files]
-                unique_filenames = list(set(filenames))
-                if len(filenames) == len(unique_filenames):
+                unique_count = parsed['unique_count']
+                if len(files) == unique_count:
                     return f"No, there are no duplicate files in the '{folder_name}' folder. All {total_files} files have unique names."
                 else:
-                    duplicates = len(filenames) - len(unique_filenames)
-                    return f"Yes, there are {duplicates} duplicate files in the '{folder_name}' folder. The folder contains {len(unique_filenames)} unique files out of {total_files} total files."
+                    duplicates = len(files) - unique_count
+                    return f"Yes, there are {duplicates} duplicate files in the '{folder_name}' folder. The folder contains {unique_count} unique files out of {total_files} total files."
             
             elif "largest" in user_lower or "biggest" in user_lower:
-                # Find largest file
-                if files:
-                    largest = max(files, key=lambda x: x['size'])
+                if parsed['largest']:
+                    largest = parsed['largest']
                     return f"The largest file in the '{folder_name}' folder is '{largest['name']}' at {largest['size']:.1f} KB."
                 else:
                     return "No files found to analyze."
             
             elif "smallest" in user_lower:
-                # Find smallest file
-                if files:
-                    smallest = min(files, key=lambda x: x['size'])
+                if parsed['smallest']:
+                    smallest = parsed['smallest']
                     return f"The smallest file in the '{folder_name}' folder is '{smallest['name']}' at {smallest['size']:.1f} KB."
                 else:
                     return "No files found to analyze."
             
             elif "list" in user_lower or "files" in user_lower:
-                # List all files
-                response = f"The '{folder_name}' folder contains {total_files} files:\n\n"
-                for i, file_info in enumerate(files, 1):
-                    response += f"{i}. {file_info['name']} ({file_info['size']:.1f} KB)\n"
-                return response
+                # List all files - joined once, not concatenated per line
+                lines = [f"{i}. {file_info['name']} ({file_info['size']:.1f} KB)"
+                         for i, file_info in enumerate(files, 1)]
+                return (f"The '{folder_name}' folder contains {total_files} files:\n\n"
+                        + "\n".join(lines))
             
             elif "count" in user_lower or "how many" in user_lower:
                 return f"The '{folder_name}' folder contains {total_files} files."
@@ -6502,39 +7316,58 @@ IMPORTANT: Always respond with useful information based on tool results. Never l
                 return f"The '{folder_name}' folder contains {total_files} files. Here are the details:\n\n{folder_data}"
                 
         except Exception as e:
-            print(f"AI Debug (Tool Use) - Analysis error: {str(e)}")
+            logger.debug("AI Debug (Tool Use) - Analysis error: %s", str(e))
             return f"Error analyzing tool results: {str(e)}"
     
     def _execute_tool(self, function_name, args):
         """Execute a tool function and return results."""
         try:
-            if function_name == "list_folder_contents":
-                return self._tool_list_folder_contents(args)
-            elif function_name == "get_image_info":
-                return self._tool_get_image_info(args)
-            elif function_name == "get_current_image":
-                return self._tool_get_current_image(args)
-            else:
+            tool = self._tool_dispatch.get(function_name)
+            if tool is None:
                 return f"Unknown tool: {function_name}"
+            return tool(args)
         except Exception as e:
             return f"Tool execution error: {str(e)}"
     
+    def _chat_file_size_kb(self, img_path):
+        """File size in KB, served from the scandir stat cache when possible."""
+        st = self._folder_stat_cache.get(img_path) or self._stat_or_none(img_path)
+        return st.st_size / 1024 if st else 0.0
+
     def _tool_list_folder_contents(self, args):
         """Tool to list folder contents."""
         if hasattr(self, 'chat_folder_images') and self.chat_folder_images:
             folder_name = os.path.basename(self.chat_folder_path_str) if self.chat_folder_path_str else "Unknown"
             file_list = []
+            files = []
+            largest = smallest = None
             
-            # Get unique files only (remove duplicates)
-            unique_files = list(set(self.chat_folder_images))
-            unique_files.sort()  # Sort for consistent ordering
-            
-            for i, img_path in enumerate(unique_files, 1):
+            # chat_folder_images comes from one scandir pass, already unique
+            # and sorted, and the same pass cached each entry's stat - no
+            # set/sort round-trip and no getsize syscall per file here
+            for i, img_path in enumerate(self.chat_folder_images, 1):
                 filename = os.path.basename(img_path)
-                file_size = os.path.getsize(img_path) / 1024  # KB
+                file_size = self._chat_file_size_kb(img_path)
                 file_list.append(f"{i}. {filename} ({file_size:.1f} KB)")
-            
-            return f"Folder: {folder_name}\nTotal files: {len(unique_files)}\n\nFiles:\n" + "\n".join(file_list)
+                entry = {'name': filename, 'size': file_size}
+                files.append(entry)
+                if largest is None or file_size > largest['size']:
+                    largest = entry
+                if smallest is None or file_size < smallest['size']:
+                    smallest = entry
+            
+            listing = f"Folder: {folder_name}\nTotal files: {len(files)}\n\nFiles:\n" + "\n".join(file_list)
+            # Seed the parse cache with the structured data this listing was
+            # rendered from, so the analyzer never round-trips through the
+            # text format (the listing stays human-readable for the LLM).
+            # unique_count is len(files): the scandir listing has no dupes
+            self._folder_parse_cache[listing] = {
+                'folder_name': folder_name, 'total_files': len(files),
+                'files': files, 'unique_count': len(files),
+                'largest': largest, 'smallest': smallest}
+            if len(self._folder_parse_cache) > 8:
+                self._folder_parse_cache.popitem(last=False)
+            return listing
         else:
             return "No folder loaded. Please select a folder first."
     
@@ -6546,7 +7379,7 @@ IMPORTANT: Always respond with useful information based on tool results. Never l
                 if 0 <= image_index < len(self.chat_folder_images):
                     img_path = self.chat_folder_images[image_index]
                     filename = os.path.basename(img_path)
-                    file_size = os.path.getsize(img_path) / 1024
+                    file_size = self._chat_file_size_kb(img_path)
                     
                     # Parse filename for product info
                     filename_data = self.parse_filename_data(filename)